@@ -0,0 +1,82 @@
+"""Measure user ingest throughput in users per second.
+
+Compares creating users one request at a time, through ``POST /users/bulk``
+and through the client-streaming ``CreateUsers`` RPC, all in-process
+(ASGI transport / direct servicer calls) so only server-side cost is
+measured.
+
+Usage:
+    python -m benchmarks.bulk_users [--users 20000] [--batch 1000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from httpx import AsyncClient
+from httpx._transports.asgi import ASGITransport
+
+from services.user_service.app import user_pb2
+from services.user_service.app.api import routes
+from services.user_service.app.crud import UserRepository
+from services.user_service.app.grpc_service import UserServicer
+from services.user_service.app.main import create_app
+
+
+def records(n: int, tag: str):
+    return [{"name": f"User {i}", "email": f"{tag}{i}@example.com"} for i in range(n)]
+
+
+async def one_by_one(client: AsyncClient, n: int) -> float:
+    start = time.perf_counter()
+    for record in records(n, "single"):
+        r = await client.post("/users/", json=record)
+        r.raise_for_status()
+    return n / (time.perf_counter() - start)
+
+
+async def bulk_rest(client: AsyncClient, n: int, batch: int) -> float:
+    items = records(n, "bulk")
+    start = time.perf_counter()
+    for offset in range(0, n, batch):
+        r = await client.post("/users/bulk", json=items[offset : offset + batch])
+        r.raise_for_status()
+    return n / (time.perf_counter() - start)
+
+
+async def stream_grpc(n: int, batch: int) -> float:
+    servicer = UserServicer(UserRepository())
+    servicer.ingest_batch_size = batch
+
+    async def stream():
+        for record in records(n, "grpc"):
+            yield user_pb2.UserCreateRequest(**record)
+
+    start = time.perf_counter()
+    response = await servicer.CreateUsers(stream(), None)
+    assert response.created == n
+    return n / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    routes._repo = UserRepository()
+    app = create_app()
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        single = await one_by_one(client, min(args.users, 2000))
+        bulk = await bulk_rest(client, args.users, args.batch)
+    streamed = await stream_grpc(args.users, args.batch)
+
+    print(f"POST /users/ (one by one): {single:10.0f} users/s")
+    print(f"POST /users/bulk:          {bulk:10.0f} users/s")
+    print(f"CreateUsers stream:        {streamed:10.0f} users/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""Measure the cost of the product price index at catalogue scale.
+
+Loads ``--products`` products with random prices through ``create_many``,
+then times single creates (an insert into the full index), a page of a
+narrow price range through ``list_page`` and, for comparison, the same
+page computed by filtering and sorting the whole catalogue. Calls the
+repository directly so only the index is measured.
+
+Usage:
+    python -m benchmarks.price_index [--products 1000000] [--queries 1000]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+from libs.common.models import ProductCreate
+from services.product_service.app.crud import ProductRepository
+
+BATCH = 10_000
+MAX_PRICE = 10_000.0
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--page", type=int, default=100)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # one log line per create would dominate
+    rng = random.Random(42)
+    repo = ProductRepository()
+
+    start = time.perf_counter()
+    for offset in range(0, args.products, BATCH):
+        await repo.create_many(
+            ProductCreate(name=f"Product {i}", price=rng.uniform(0, MAX_PRICE))
+            for i in range(offset, min(offset + BATCH, args.products))
+        )
+    load = time.perf_counter() - start
+
+    creates = 10_000
+    start = time.perf_counter()
+    for _ in range(creates):
+        await repo.create(ProductCreate(name="Late", price=rng.uniform(0, MAX_PRICE)))
+    create = (time.perf_counter() - start) / creates
+
+    # ranges wide enough that a page is usually full
+    width = MAX_PRICE * args.page * 2 / len(repo._store)
+    bounds = [
+        (low, low + width)
+        for low in (rng.uniform(0, MAX_PRICE) for _ in range(args.queries))
+    ]
+    start = time.perf_counter()
+    for low, high in bounds:
+        await repo.list_page(args.page, min_price=low, max_price=high)
+    indexed = (time.perf_counter() - start) / len(bounds)
+
+    scans = bounds[: max(1, args.queries // 100)]
+    start = time.perf_counter()
+    for low, high in scans:
+        products = await repo.list_all()
+        in_range = [p for p in products if low <= p.price <= high]
+        sorted(in_range, key=lambda p: (p.price, p.id))[: args.page]
+    scanned = (time.perf_counter() - start) / len(scans)
+
+    n = len(repo._store)
+    assert n == args.products + creates, f"{args.products + creates - n} overwritten"
+    print(f"products:                         {n:12d}")
+    print(f"create_many load:                 {args.products / load:12.0f} products/s")
+    print(f"create into full index:           {create * 1e6:12.1f} us")
+    print(f"price range page ({args.page}), indexed:  {indexed * 1e6:12.1f} us")
+    print(f"price range page ({args.page}), scan:     {scanned * 1e6:12.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
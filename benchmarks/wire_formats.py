@@ -0,0 +1,118 @@
+"""Compare JSON, protobuf and msgpack on the product REST routes.
+
+For a single product (``GET /products/{id}``), a page of products
+(``GET /products/?limit=N``) and a create (``POST /products/``), measures
+requests per second including client-side encoding and decoding, and the
+response size, for each wire format. Runs in-process over the ASGI
+transport so only serialization and framework cost is measured.
+
+Usage:
+    python -m benchmarks.wire_formats [--products 1000] [--requests 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Callable, Dict, List, Tuple
+
+from httpx import AsyncClient
+from httpx._transports.asgi import ASGITransport
+
+from libs.common import codecs
+from libs.common.codecs import JSON, MSGPACK, PROTOBUF
+from libs.common.models import ProductCreate
+from services.product_service.app import product_pb2
+from services.product_service.app.api import routes
+from services.product_service.app.crud import ProductRepository
+from services.product_service.app.main import create_app
+
+NEW_PRODUCT = {"name": "Benchmark widget", "price": 19.99}
+
+# media type -> (encode a create body, decode a product, decode a page)
+FORMATS: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    JSON: (lambda d: json.dumps(d).encode(), json.loads, json.loads),
+    PROTOBUF: (
+        lambda d: product_pb2.ProductCreateRequest(**d).SerializeToString(),
+        product_pb2.Product.FromString,
+        product_pb2.ListProductsResponse.FromString,
+    ),
+}
+if codecs.msgpack is not None:
+    FORMATS[MSGPACK] = (
+        codecs.msgpack.packb,
+        codecs.msgpack.unpackb,
+        codecs.msgpack.unpackb,
+    )
+
+
+def senders(
+    media_type: str,
+    codec: Tuple[Callable, Callable, Callable],
+    product_id: str,
+    page_size: int,
+    requests: int,
+) -> List[Tuple[str, Callable, int]]:
+    """Return (case, send, number of requests) for each case of one format."""
+    encode, decode_one, decode_page = codec
+    headers = {"Accept": media_type, "Content-Type": media_type}
+
+    async def get_one(c: AsyncClient) -> int:
+        r = await c.get(f"/products/{product_id}", headers=headers)
+        decode_one(r.content)
+        return len(r.content)
+
+    async def get_page(c: AsyncClient) -> int:
+        r = await c.get("/products/", params={"limit": page_size}, headers=headers)
+        decode_page(r.content)
+        return len(r.content)
+
+    async def create(c: AsyncClient) -> int:
+        r = await c.post("/products/", content=encode(NEW_PRODUCT), headers=headers)
+        decode_one(r.content)
+        return len(r.content)
+
+    return [
+        ("get", get_one, requests),
+        ("list", get_page, max(1, requests // 20)),
+        ("create", create, requests),
+    ]
+
+
+async def measure(client: AsyncClient, n: int, send: Callable) -> Tuple[float, int]:
+    size = 0
+    start = time.perf_counter()
+    for _ in range(n):
+        size = await send(client)
+    return n / (time.perf_counter() - start), size
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # one log line per create would dominate
+
+    routes._repo = ProductRepository()
+    created = await routes._repo.create_many(
+        ProductCreate(name=f"Product {i}", price=i + 0.99, user_id=f"u_{i:08x}")
+        for i in range(args.products)
+    )
+    product_id = created[0].id
+
+    async with AsyncClient(
+        transport=ASGITransport(app=create_app()), base_url="http://bench"
+    ) as client:
+        print(f"{'format':24} {'case':8} {'req/s':>10} {'bytes':>10}")
+        for media_type, codec in FORMATS.items():
+            for case, send, n in senders(
+                media_type, codec, product_id, args.products, args.requests
+            ):
+                rate, size = await measure(client, n, send)
+                print(f"{media_type:24} {case:8} {rate:10.0f} {size:10d}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,14 @@
 """Common utilities and models shared across services."""
 
 from .models import User, UserCreate, Product, ProductCreate
-from .utils import generate_id
+from .utils import generate_id, generate_unique_id, generate_unique_ids
 
-__all__ = ["User", "UserCreate", "Product", "ProductCreate", "generate_id"]
+__all__ = [
+    "User",
+    "UserCreate",
+    "Product",
+    "ProductCreate",
+    "generate_id",
+    "generate_unique_id",
+    "generate_unique_ids",
+]
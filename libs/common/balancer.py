@@ -0,0 +1,295 @@
+import asyncio
+import random
+import socket
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from libs.common.logging import get_logger
+from libs.common.metrics import Metrics
+from libs.common.resilience import ServiceUnavailableError
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Endpoint:
+    """One replica of an upstream service and its client-side state.
+
+    Attributes:
+        address: Base URL ("http://10.0.0.5:8001") or gRPC target ("10.0.0.5:50051").
+        outstanding: Requests currently in flight to this replica.
+        consecutive_failures: Failed requests since the last success.
+        ejected_until: Monotonic time until which the replica is skipped.
+        healthy: Result of the latest health probe.
+    """
+
+    address: str
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    healthy: bool = True
+
+
+class StaticResolver:
+    """Resolver returning a fixed list of endpoint addresses.
+
+    Args:
+        addresses: Endpoint addresses.
+    """
+
+    ttl = float("inf")
+
+    def __init__(self, addresses: List[str]) -> None:
+        self.addresses = list(addresses)
+
+    async def resolve(self) -> List[str]:
+        """Return the configured addresses."""
+        return self.addresses
+
+
+class DnsResolver:
+    """Resolver turning a DNS name into one address per A/AAAA record.
+
+    Results are cached for ``ttl`` seconds; if a lookup fails the previous
+    answer is kept (with no previous answer, ServiceUnavailableError is
+    raised).
+
+    Args:
+        host: DNS name to resolve.
+        port: Port every replica listens on.
+        scheme: URL scheme for REST addresses ("http"), or None for
+            gRPC-style "host:port" targets.
+        ttl: Seconds a resolution is cached.
+    """
+
+    def __init__(
+        self, host: str, port: int, scheme: Optional[str] = None, ttl: float = 30.0
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.scheme = scheme
+        self.ttl = ttl
+        self._addresses: List[str] = []
+        self._expires = 0.0
+
+    async def resolve(self) -> List[str]:
+        """Return the cached addresses, re-resolving once the TTL has passed."""
+        now = time.monotonic()
+        if now >= self._expires:
+            try:
+                ips = await self._lookup()
+            except OSError as exc:
+                logger.warning("DNS lookup for %s failed", self.host)
+                if not self._addresses:
+                    raise ServiceUnavailableError(
+                        f"cannot resolve {self.host}: {exc}"
+                    ) from exc
+            else:
+                self._addresses = [self._format(ip) for ip in ips]
+                self._expires = now + self.ttl
+        return self._addresses
+
+    async def _lookup(self) -> List[str]:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            self.host, self.port, type=socket.SOCK_STREAM
+        )
+        return sorted({info[4][0] for info in infos})
+
+    def _format(self, ip: str) -> str:
+        host = f"[{ip}]" if ":" in ip else ip
+        address = f"{host}:{self.port}"
+        return f"{self.scheme}://{address}" if self.scheme else address
+
+
+def make_resolver(spec: str, scheme: Optional[str] = None, dns_ttl: float = 30.0):
+    """Build a resolver from an endpoint spec.
+
+    Args:
+        spec: Either ``dns://host:port`` or a comma-separated list of
+            addresses (URLs for REST, "host:port" for gRPC).
+        scheme: URL scheme given to DNS results ("http" for REST).
+        dns_ttl: Cache lifetime of DNS results in seconds.
+
+    Returns:
+        A StaticResolver or DnsResolver.
+
+    Example:
+        >>> make_resolver("http://u1:8001,http://u2:8001")
+        >>> make_resolver("dns://user-service:8001", scheme="http")
+    """
+    if spec.startswith("dns://"):
+        host, _, port = spec[len("dns://") :].rpartition(":")
+        return DnsResolver(host, int(port), scheme=scheme, ttl=dns_ttl)
+    return StaticResolver([a.strip() for a in spec.split(",") if a.strip()])
+
+
+class LoadBalancer:
+    """Client-side load balancer over the replicas of one service.
+
+    Picks a replica per request by least outstanding requests
+    ("least_outstanding") or by the better of two random replicas
+    ("p2c"). Replicas are skipped while ejected, which happens after
+    ``max_failures`` consecutive ServiceUnavailableError failures, or while
+    the background ``health_check`` probe reports them unhealthy. If every
+    replica is out, all of them are used again rather than failing outright.
+
+    Reported through ``metrics`` (if given): ``{name}_ejections_total`` and
+    the ``{name}_endpoints`` and ``{name}_endpoints_available`` gauges.
+
+    Args:
+        resolver: Source of endpoint addresses (StaticResolver/DnsResolver).
+        strategy: "p2c" or "least_outstanding".
+        max_failures: Consecutive failures that eject a replica.
+        ejection_time: Seconds an ejected replica is skipped.
+        health_check: Optional coroutine function probing one address.
+        health_interval: Seconds between health probe rounds.
+        metrics: Optional Metrics instance to report into.
+        name: Prefix for the reported metric names.
+
+    Example:
+        >>> lb = LoadBalancer(make_resolver("http://u1:8001,http://u2:8001"))
+        >>> async with lb.endpoint() as ep:
+        ...     await check_user_exists(user_id, ep.address)
+    """
+
+    def __init__(
+        self,
+        resolver,
+        strategy: str = "p2c",
+        max_failures: int = 3,
+        ejection_time: float = 10.0,
+        health_check: Optional[Callable[[str], Awaitable[bool]]] = None,
+        health_interval: float = 5.0,
+        metrics: Optional[Metrics] = None,
+        name: str = "lb",
+    ) -> None:
+        if strategy not in ("p2c", "least_outstanding"):
+            raise ValueError(f"unknown load-balancing strategy {strategy!r}")
+        self.resolver = resolver
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.health_check = health_check
+        self.health_interval = health_interval
+        self.metrics = metrics
+        self.name = name
+        self.endpoints: Dict[str, Endpoint] = {}
+        self._next_refresh = 0.0
+        self._health_task: Optional[asyncio.Task] = None
+
+    async def refresh(self) -> None:
+        """Re-resolve addresses, keeping the state of known replicas."""
+        addresses = await self.resolver.resolve()
+        self.endpoints = {
+            address: self.endpoints.get(address) or Endpoint(address)
+            for address in addresses
+        }
+        self._next_refresh = time.monotonic() + self.resolver.ttl
+        self._report()
+
+    def available(self) -> List[Endpoint]:
+        """Return replicas that are neither ejected nor failing health checks."""
+        now = time.monotonic()
+        return [
+            ep
+            for ep in self.endpoints.values()
+            if ep.healthy and ep.ejected_until <= now
+        ]
+
+    def pick(self) -> Endpoint:
+        """Choose the replica for the next request.
+
+        Raises:
+            ServiceUnavailableError: If no replica is known.
+        """
+        candidates = self.available() or list(self.endpoints.values())
+        if not candidates:
+            raise ServiceUnavailableError(f"{self.name}: no endpoints")
+        if len(candidates) == 1:
+            return candidates[0]
+        if self.strategy == "p2c":
+            a, b = random.sample(candidates, 2)
+            return a if a.outstanding <= b.outstanding else b
+        least = min(ep.outstanding for ep in candidates)
+        return random.choice([ep for ep in candidates if ep.outstanding == least])
+
+    @asynccontextmanager
+    async def endpoint(self) -> AsyncIterator[Endpoint]:
+        """Pick a replica and track the request made to it.
+
+        A ServiceUnavailableError raised inside the block counts as a failure
+        of the replica; leaving the block normally counts as a success.
+
+        Yields:
+            The chosen Endpoint.
+        """
+        if time.monotonic() >= self._next_refresh:
+            await self.refresh()
+        ep = self.pick()
+        ep.outstanding += 1
+        try:
+            yield ep
+        except ServiceUnavailableError:
+            self.record_failure(ep)
+            raise
+        else:
+            ep.consecutive_failures = 0
+        finally:
+            ep.outstanding -= 1
+
+    def record_failure(self, ep: Endpoint) -> None:
+        """Count a failed request and eject the replica if it keeps failing."""
+        ep.consecutive_failures += 1
+        if ep.consecutive_failures >= self.max_failures:
+            logger.warning("ejecting %s for %.1fs", ep.address, self.ejection_time)
+            ep.ejected_until = time.monotonic() + self.ejection_time
+            ep.consecutive_failures = 0
+            if self.metrics is not None:
+                self.metrics.inc(f"{self.name}_ejections_total")
+            self._report()
+
+    async def probe(self) -> None:
+        """Run one round of health checks against every replica."""
+        if self.health_check is None:
+            return
+        endpoints = list(self.endpoints.values())
+        results = await asyncio.gather(
+            *(self.health_check(ep.address) for ep in endpoints),
+            return_exceptions=True,
+        )
+        for ep, result in zip(endpoints, results):
+            ep.healthy = result is True
+        self._report()
+
+    async def start(self) -> None:
+        """Resolve endpoints and start background health probing."""
+        await self.refresh()
+        if self.health_check is not None and self._health_task is None:
+            self._health_task = asyncio.create_task(self._probe_forever())
+
+    async def stop(self) -> None:
+        """Stop background health probing."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+    async def _probe_forever(self) -> None:
+        while True:
+            try:
+                if time.monotonic() >= self._next_refresh:
+                    await self.refresh()
+                await self.probe()
+            except Exception:
+                logger.exception("health probing for %s failed", self.name)
+            await asyncio.sleep(self.health_interval)
+
+    def _report(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set(f"{self.name}_endpoints", len(self.endpoints))
+            self.metrics.set(f"{self.name}_endpoints_available", len(self.available()))
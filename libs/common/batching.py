@@ -0,0 +1,105 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+from libs.common.metrics import Metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class MicroBatcher(Generic[K, V]):
+    """Group individual lookups into batched calls.
+
+    Keys submitted within ``max_wait`` seconds of the first pending key (or
+    until ``max_batch_size`` distinct keys are pending) are sent together as
+    one ``batch_fn`` call. Duplicate keys in a window are sent once. If the
+    batch call fails, every caller in the batch gets its exception.
+
+    Reported through ``metrics`` (if given): ``{name}_batches_total`` (calls
+    to ``batch_fn``) and ``{name}_keys_total`` (distinct keys sent).
+
+    Args:
+        batch_fn: Coroutine function mapping a list of keys to a dict of
+            results; keys missing from the result raise KeyError for their
+            callers.
+        max_batch_size: Flush as soon as this many distinct keys are pending.
+        max_wait: Seconds to wait for more keys before flushing.
+        metrics: Optional Metrics instance to report into.
+        name: Prefix for the reported metric names.
+
+    Example:
+        >>> batcher = MicroBatcher(check_users_exist_grpc, max_wait=0.002)
+        >>> exists = await batcher.submit("u_abc123")
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: int = 100,
+        max_wait: float = 0.002,
+        metrics: Optional[Metrics] = None,
+        name: str = "batcher",
+    ) -> None:
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.metrics = metrics
+        self.name = name
+        self._pending: Dict[K, List["asyncio.Future[V]"]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def submit(self, key: K) -> V:
+        """Queue ``key`` for the next batch and wait for its result.
+
+        Args:
+            key: Key to look up.
+
+        Returns:
+            The result for ``key`` from the batch call.
+
+        Raises:
+            Exception: Whatever the batch call raised.
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[V]" = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[K, List["asyncio.Future[V]"]]) -> None:
+        self._inc("batches_total")
+        self._inc("keys_total", len(batch))
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as exc:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        for key, futures in batch.items():
+            for future in futures:
+                if future.done():
+                    continue  # caller went away
+                if key in results:
+                    future.set_result(results[key])
+                else:
+                    future.set_exception(KeyError(key))
+
+    def _inc(self, counter: str, amount: int = 1) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"{self.name}_{counter}", amount)
@@ -0,0 +1,96 @@
+import hashlib
+import math
+import struct
+from typing import Iterable
+
+_HEADER = struct.Struct("!IQQ")
+
+
+class BloomFilter:
+    """Bloom filter over string keys.
+
+    Sized for ``capacity`` keys at a false-positive rate of ``fp_rate``:
+    ``m = -n ln p / (ln 2)^2`` bits and ``k = m/n ln 2`` hash functions,
+    derived from one 128-bit BLAKE2b digest by double hashing. A key that
+    was added is always reported as present; a key that was not is reported
+    as present with probability about ``fp_rate`` (higher once more than
+    ``capacity`` keys are added).
+
+    Args:
+        capacity: Number of keys the filter is sized for.
+        fp_rate: Target false-positive rate (0 < fp_rate < 1).
+
+    Example:
+        >>> bloom = BloomFilter(capacity=1000, fp_rate=0.01)
+        >>> bloom.add("u_abc123")
+        >>> "u_abc123" in bloom
+        True
+        >>> BloomFilter.from_bytes(bloom.to_bytes()).might_contain("u_abc123")
+        True
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        m = self.num_bits
+        return ((h1 + i * h2) % m for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        """Add ``key`` to the filter."""
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add every key in ``keys``."""
+        for key in keys:
+            self.add(key)
+
+    def might_contain(self, key: str) -> bool:
+        """Return False if ``key`` was definitely never added."""
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    __contains__ = might_contain
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter (header followed by the bit array)."""
+        return _HEADER.pack(self.num_hashes, self.num_bits, self.count) + bytes(
+            self._bits
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """Rebuild a filter serialized with ``to_bytes``.
+
+        Raises:
+            ValueError: If ``data`` is not a serialized filter.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("truncated Bloom filter")
+        num_hashes, num_bits, count = _HEADER.unpack_from(data)
+        bits = data[_HEADER.size :]
+        if num_hashes < 1 or num_bits < 1 or len(bits) != (num_bits + 7) // 8:
+            raise ValueError("malformed Bloom filter")
+        bloom = cls.__new__(cls)
+        bloom.capacity = max(1, count)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom._bits = bytearray(bits)
+        return bloom
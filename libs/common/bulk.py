@@ -0,0 +1,83 @@
+from typing import Any, Dict, List, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+# Largest array accepted by the bulk endpoints
+MAX_BULK_ITEMS = 10_000
+
+# Most IDs accepted by one batch get
+MAX_BATCH_GET_IDS = 1000
+
+_adapters: Dict[type, TypeAdapter] = {}
+
+
+def list_adapter(model: Type[M]) -> TypeAdapter:
+    """Return the cached ``TypeAdapter`` for a list of ``model``."""
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = _adapters[model] = TypeAdapter(List[model])
+    return adapter
+
+
+def _describe(errors: List[Dict[str, Any]]) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+        for error in errors
+    )
+
+
+def validate_items(
+    items: Sequence[Any], model: Type[M]
+) -> Tuple[List[Tuple[int, M]], Dict[int, str]]:
+    """Validate every item of a bulk request on its own.
+
+    The whole array is validated in one call into pydantic-core; only if
+    that fails are the errors split per item and the remaining items
+    validated again. An invalid item does not fail the whole request; it is
+    reported by index so the caller can return a per-item result.
+
+    Args:
+        items: Raw request items (decoded JSON).
+        model: Pydantic model each item must satisfy.
+
+    Returns:
+        Tuple of ([(index, model instance)], {index: error message}).
+
+    Example:
+        >>> valid, errors = validate_items([{"name": "A"}, {}], UserCreate)
+        >>> errors
+        {0: 'email: Field required', 1: 'name: Field required; ...'}
+    """
+    adapter = list_adapter(model)
+    try:
+        return list(enumerate(adapter.validate_python(items))), {}
+    except ValidationError as exc:
+        failed: Dict[int, List[Dict[str, Any]]] = {}
+        for error in exc.errors():
+            index, *loc = error["loc"]
+            failed.setdefault(index, []).append({**error, "loc": loc})
+    errors = {index: _describe(item_errors) for index, item_errors in failed.items()}
+    indexes = [index for index in range(len(items)) if index not in errors]
+    valid = adapter.validate_python([items[index] for index in indexes])
+    return list(zip(indexes, valid)), errors
+
+
+def split_ids(values: Sequence[str]) -> List[str]:
+    """Parse ``?ids=a,b&ids=c`` query values into a list of IDs.
+
+    Args:
+        values: Raw values of a repeated, comma-separated query parameter.
+
+    Returns:
+        The IDs in order, blanks dropped (duplicates kept).
+
+    Raises:
+        ValueError: If more than MAX_BATCH_GET_IDS IDs are given.
+    """
+    ids = [part.strip() for value in values for part in value.split(",")]
+    ids = [i for i in ids if i]
+    if len(ids) > MAX_BATCH_GET_IDS:
+        raise ValueError(f"at most {MAX_BATCH_GET_IDS} ids per request")
+    return ids
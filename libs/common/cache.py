@@ -0,0 +1,171 @@
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, Optional, Set, TypeVar
+
+from libs.common.logging import get_logger
+from libs.common.metrics import Metrics
+
+logger = get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    expires_at: float
+    refresh_at: float
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process LRU cache with separate positive/negative TTLs.
+
+    Truthy values are kept for ``positive_ttl`` seconds and falsy ones (e.g.
+    "user does not exist") for ``negative_ttl``. Each TTL is shortened by a
+    random jitter so entries loaded together don't expire together, and a hit
+    in the last ``refresh_ahead`` fraction of an entry's life returns the
+    cached value while reloading it in the background. Loader errors are
+    never cached.
+
+    Reported through ``metrics`` (if given): ``{name}_hits_total``,
+    ``{name}_misses_total``, ``{name}_evictions_total``,
+    ``{name}_refreshes_total`` and the ``{name}_size`` gauge.
+
+    Args:
+        max_size: Maximum number of entries before LRU eviction.
+        positive_ttl: Lifetime in seconds of truthy values.
+        negative_ttl: Lifetime in seconds of falsy values.
+        refresh_ahead: Fraction of the TTL at the end of an entry's life
+            during which hits trigger a background refresh (0 disables).
+        jitter: Maximum fraction by which each TTL is randomly shortened.
+        metrics: Optional Metrics instance to report into.
+        name: Prefix for the reported metric names.
+        clock: Monotonic time source (overridable in tests).
+
+    Example:
+        >>> cache = TTLCache(max_size=1000, positive_ttl=300, negative_ttl=5)
+        >>> exists = await cache.get_or_load("u_abc123", check_user_exists)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        positive_ttl: float = 600.0,
+        negative_ttl: float = 5.0,
+        refresh_ahead: float = 0.2,
+        jitter: float = 0.1,
+        metrics: Optional[Metrics] = None,
+        name: str = "cache",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.refresh_ahead = refresh_ahead
+        self.jitter = jitter
+        self.metrics = metrics
+        self.name = name
+        self._clock = clock
+        self._entries: "OrderedDict[K, _Entry[V]]" = OrderedDict()
+        self._refreshing: Set[K] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value for ``key`` or None if absent/expired."""
+        entry = self._lookup(key)
+        return entry.value if entry is not None else None
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value`` with the TTL matching its truthiness.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        ttl = self.positive_ttl if value else self.negative_ttl
+        ttl *= 1 - random.uniform(0, self.jitter)
+        now = self._clock()
+        self._entries[key] = _Entry(
+            value=value,
+            expires_at=now + ttl,
+            refresh_at=now + ttl * (1 - self.refresh_ahead),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._inc("evictions_total")
+        self._set_size()
+
+    async def get_or_load(self, key: K, loader: Callable[[K], Awaitable[V]]) -> V:
+        """Return the cached value for ``key``, loading it on a miss.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine function called with ``key`` to fetch the value.
+
+        Returns:
+            The cached or freshly loaded value.
+
+        Raises:
+            Exception: Whatever ``loader`` raises on a miss (nothing is cached).
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self._inc("hits_total")
+            if self.refresh_ahead and self._clock() >= entry.refresh_at:
+                self._schedule_refresh(key, loader)
+            return entry.value
+
+        self._inc("misses_total")
+        value = await loader(key)
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._set_size()
+
+    def _lookup(self, key: K) -> Optional[_Entry[V]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._clock() >= entry.expires_at:
+            del self._entries[key]
+            self._set_size()
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _schedule_refresh(self, key: K, loader: Callable[[K], Awaitable[V]]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self._inc("refreshes_total")
+        task = asyncio.create_task(self._refresh(key, loader))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: K, loader: Callable[[K], Awaitable[V]]) -> None:
+        try:
+            self.put(key, await loader(key))
+        except Exception:
+            # keep serving the current value until it expires
+            logger.warning("background refresh failed for %r", key)
+        finally:
+            self._refreshing.discard(key)
+
+    def _inc(self, counter: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"{self.name}_{counter}")
+
+    def _set_size(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set(f"{self.name}_size", len(self._entries))
@@ -0,0 +1,120 @@
+import asyncio
+import time
+import uuid
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Generic, Hashable, Iterable, List, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class Change(Generic[K]):
+    """One entry of a ChangeLog.
+
+    Attributes:
+        sequence: Monotonically increasing sequence number (starts at 1).
+        key: Key of the record that changed.
+        timestamp: Wall-clock time of the change (seconds since the epoch).
+    """
+
+    sequence: int
+    key: K
+    timestamp: float
+
+
+class ChangeLog(Generic[K]):
+    """Append-only log giving every repository mutation a sequence number.
+
+    Readers ask for the changes after a sequence number they have already
+    seen; the lookup is a bisect, so a delta costs O(log n + changes) no
+    matter how large the log is. ``epoch`` identifies this log instance:
+    in-memory stores restart from sequence 1, so a reader holding a sequence
+    from another epoch must start over.
+
+    Example:
+        >>> log = ChangeLog()
+        >>> log.append("u_abc123")
+        1
+        >>> [c.key for c in log.since(0)]
+        ['u_abc123']
+    """
+
+    def __init__(self) -> None:
+        self.epoch = uuid.uuid4().hex[:8]
+        self._sequences: List[int] = []
+        self._changes: List[Change[K]] = []
+        self._waiters: List["asyncio.Future[None]"] = []
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the latest change (0 if empty)."""
+        return self._sequences[-1] if self._sequences else 0
+
+    def append(self, key: K) -> int:
+        """Record a change to ``key`` and wake up waiting readers.
+
+        Args:
+            key: Key of the record that changed.
+
+        Returns:
+            The sequence number assigned to the change.
+        """
+        return self.extend([key])
+
+    def extend(self, keys: Iterable[K]) -> int:
+        """Record changes to several keys and wake up waiting readers once.
+
+        Args:
+            keys: Keys of the records that changed, in order.
+
+        Returns:
+            The sequence number of the last change.
+        """
+        now = time.time()
+        sequence = self.last_sequence
+        for key in keys:
+            sequence += 1
+            self._sequences.append(sequence)
+            self._changes.append(Change(sequence, key, now))
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        return sequence
+
+    def since(self, sequence: int, limit: Optional[int] = None) -> List[Change[K]]:
+        """Return changes with a sequence number greater than ``sequence``.
+
+        Args:
+            sequence: Last sequence number the reader has seen.
+            limit: Maximum number of changes to return.
+
+        Returns:
+            Changes in sequence order.
+        """
+        start = bisect_right(self._sequences, sequence)
+        end = None if limit is None else start + limit
+        return self._changes[start:end]
+
+    async def wait(self, sequence: int, timeout: Optional[float] = None) -> bool:
+        """Wait until a change after ``sequence`` exists.
+
+        Args:
+            sequence: Last sequence number the reader has seen.
+            timeout: Seconds to wait at most (default: forever).
+
+        Returns:
+            True if there are newer changes, False on timeout.
+        """
+        if self.last_sequence > sequence:
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            return False
+        return True
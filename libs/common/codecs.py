@@ -0,0 +1,223 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from google.protobuf.descriptor import Descriptor
+from google.protobuf.message import DecodeError, Message
+from pydantic import BaseModel, ValidationError
+
+from libs.common.bulk import list_adapter
+from libs.common.fields import project
+
+try:  # optional: msgpack is only needed to speak application/msgpack
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without msgpack
+    msgpack = None
+
+M = TypeVar("M", bound=BaseModel)
+
+JSON = "application/json"
+PROTOBUF = "application/x-protobuf"
+MSGPACK = "application/msgpack"
+_MSGPACK_TYPES = (MSGPACK, "application/x-msgpack")
+
+
+def _media_types(header: Optional[str]) -> List[str]:
+    if not header:
+        return []
+    return [part.split(";")[0].strip().lower() for part in header.split(",")]
+
+
+def negotiate(accept: Optional[str]) -> Optional[str]:
+    """Return the binary media type an ``Accept`` header asks for, if any.
+
+    Returns:
+        PROTOBUF or MSGPACK if listed before any JSON type (MSGPACK only if
+        msgpack is installed), else None for the default JSON response.
+    """
+    for media_type in _media_types(accept):
+        if media_type == PROTOBUF:
+            return PROTOBUF
+        if media_type in _MSGPACK_TYPES and msgpack is not None:
+            return MSGPACK
+        if media_type in (JSON, "*/*"):
+            return None
+    return None
+
+
+@lru_cache(maxsize=None)
+def _field_names(descriptor: Descriptor) -> Tuple[str, ...]:
+    return tuple(field.name for field in descriptor.fields)
+
+
+def _values(record: BaseModel, names: Sequence[str]) -> Dict[str, Any]:
+    return {name: v for name in names if (v := getattr(record, name)) is not None}
+
+
+def to_message(
+    record: BaseModel,
+    message_cls: Type[Message],
+    fields: Optional[Sequence[str]] = None,
+) -> Message:
+    """Copy a record into the generated protobuf message of the same shape.
+
+    Fields are matched by name; None values are left unset.
+
+    Args:
+        record: Record to convert.
+        message_cls: Generated message class (e.g. ``user_pb2.User``).
+        fields: Only copy these fields (None: every field of the message).
+    """
+    return message_cls(
+        **_values(record, fields or _field_names(message_cls.DESCRIPTOR))
+    )
+
+
+def list_message(
+    message_cls: Type[Message],
+    field: str,
+    records: Sequence[BaseModel],
+    fields: Optional[Sequence[str]] = None,
+    **values: Any,
+) -> Message:
+    """Build a list message with ``records`` in its repeated ``field``.
+
+    Items are appended in place rather than built and copied in, which
+    matters for pages of a thousand records.
+
+    Example:
+        >>> list_message(user_pb2.ListUsersResponse, "users", users,
+        ...              next_page_token=token)
+
+    Args:
+        message_cls: Generated list message class.
+        field: Name of its repeated message field.
+        records: Records to convert, in order.
+        fields: Only copy these fields of each record (None: all).
+        **values: Other fields of the list message.
+    """
+    message = message_cls(**values)
+    names = fields or _field_names(
+        message_cls.DESCRIPTOR.fields_by_name[field].message_type
+    )
+    add = getattr(message, field).add
+    for record in records:
+        add(**_values(record, names))
+    return message
+
+
+def from_message(message: Message) -> Dict[str, Any]:
+    """Read the fields of a protobuf message into a dict for validation.
+
+    Optional fields that were not set are left out, so model defaults apply.
+    """
+    return {
+        field.name: getattr(message, field.name)
+        for field in message.DESCRIPTOR.fields
+        if not field.has_presence or message.HasField(field.name)
+    }
+
+
+def binary_response(
+    media_type: str,
+    records: Union[BaseModel, List[BaseModel]],
+    message: Callable[[], Message],
+    fields: Optional[Sequence[str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Encode a record (or list of records) as protobuf or msgpack.
+
+    Args:
+        media_type: PROTOBUF or MSGPACK, as returned by ``negotiate``.
+        records: What a JSON response would have contained.
+        message: Builds the protobuf message to send; only called for
+            PROTOBUF.
+        fields: Only encode these fields of each record (msgpack; for
+            protobuf, ``message`` applies them).
+        headers: Extra response headers.
+    """
+    if media_type == PROTOBUF:
+        body = message().SerializeToString()
+    elif fields:
+        data = (
+            [project(r, fields) for r in records]
+            if isinstance(records, list)
+            else project(records, fields)
+        )
+        body = msgpack.packb(data)
+    elif isinstance(records, list) and records:
+        # one call into pydantic-core for the whole page, not one per record
+        body = msgpack.packb(list_adapter(type(records[0])).dump_python(records))
+    else:
+        body = msgpack.packb(
+            records.model_dump() if isinstance(records, BaseModel) else []
+        )
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """``openapi_extra`` documenting a body read with ``parse_body``."""
+    schema = {"schema": model.model_json_schema()}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                JSON: schema,
+                PROTOBUF: {"schema": {"type": "string", "format": "binary"}},
+                MSGPACK: schema,
+            },
+        }
+    }
+
+
+def parse_body(model: Type[M], message_cls: Type[Message]) -> Callable[[Request], Any]:
+    """Build a dependency reading a request body as JSON, protobuf or msgpack.
+
+    The format is chosen by ``Content-Type`` (JSON if absent). Protobuf
+    bodies are parsed as ``message_cls``; every format is then validated
+    against ``model``.
+
+    Raises (from the dependency):
+        HTTPException: 415 for another content type, 400 for a body that
+            cannot be decoded.
+        RequestValidationError: 422 if the decoded body fails validation.
+    """
+
+    async def dependency(request: Request) -> M:
+        content_type = (_media_types(request.headers.get("content-type")) or [JSON])[0]
+        body = await request.body()
+        try:
+            if content_type == JSON or content_type.endswith("+json"):
+                return model.model_validate_json(body)
+            if content_type == PROTOBUF:
+                data = from_message(message_cls.FromString(body))
+            elif content_type in _MSGPACK_TYPES and msgpack is not None:
+                data = msgpack.unpackb(body)
+            else:
+                raise HTTPException(
+                    status_code=415, detail=f"unsupported content type {content_type}"
+                )
+            return model.model_validate(data)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [
+                    {**e, "loc": ("body", *e["loc"])}
+                    for e in exc.errors(include_url=False)
+                ]
+            )
+        except (DecodeError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail=f"malformed body: {exc}")
+
+    return dependency
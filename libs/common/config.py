@@ -0,0 +1,41 @@
+import os
+from dataclasses import fields
+from typing import Any, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def _coerce(raw: str, target: Any) -> Any:
+    """Convert a raw environment string to the type of a settings field."""
+    if target is bool:
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    if target in (int, float):
+        return target(raw)
+    return raw
+
+
+def load_from_env(cls: Type[T], prefix: str = "") -> T:
+    """Build a settings dataclass from environment variables.
+
+    Each field ``foo_bar`` is read from ``{prefix}FOO_BAR``; fields without a
+    matching variable keep their default value.
+
+    Args:
+        cls: Dataclass type whose fields describe the settings.
+        prefix: Environment variable prefix (e.g., "PRODUCT_").
+
+    Returns:
+        An instance of ``cls``.
+
+    Example:
+        >>> # PRODUCT_HTTP_TIMEOUT=2.5
+        >>> settings = load_from_env(Settings, prefix="PRODUCT_")
+        >>> settings.http_timeout
+        2.5
+    """
+    values = {}
+    for f in fields(cls):
+        raw = os.environ.get(f"{prefix}{f.name.upper()}")
+        if raw is not None:
+            values[f.name] = _coerce(raw, f.type)
+    return cls(**values)
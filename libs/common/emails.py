@@ -0,0 +1,15 @@
+class DuplicateEmailError(ValueError):
+    """A user with this email address already exists."""
+
+
+def normalize_email(email: str) -> str:
+    """Return the key an email address is indexed and compared under.
+
+    Addresses differing only in case or surrounding whitespace are the same
+    user, so ``Alice@Example.com`` and ``alice@example.com`` collide.
+
+    Example:
+        >>> normalize_email(" Alice@Example.COM ")
+        'alice@example.com'
+    """
+    return email.strip().lower()
@@ -0,0 +1,88 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+
+from fastapi import HTTPException, Query
+from google.protobuf.descriptor import Descriptor
+from google.protobuf.field_mask_pb2 import FieldMask
+from pydantic import BaseModel
+
+
+def parse_fields(
+    values: Optional[Sequence[str]], model: Type[BaseModel]
+) -> Optional[List[str]]:
+    """Parse ``?fields=id,name&fields=price`` query values.
+
+    Args:
+        values: Raw values of a repeated, comma-separated query parameter.
+        model: Model whose fields may be selected.
+
+    Returns:
+        The selected field names in the model's declaration order, or None
+        if no fields were requested (the whole record is returned).
+
+    Raises:
+        ValueError: If a name is not a field of ``model``.
+    """
+    if not values:
+        return None
+    names = {part.strip() for value in values for part in value.split(",")}
+    names.discard("")
+    if not names:
+        return None
+    unknown = names - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+    return [name for name in model.model_fields if name in names]
+
+
+def mask_fields(mask: FieldMask, descriptor: Descriptor) -> Optional[List[str]]:
+    """Return the top-level field names selected by a gRPC ``FieldMask``.
+
+    Args:
+        mask: Mask from the request (no paths: the whole message).
+        descriptor: Descriptor of the message the mask applies to.
+
+    Returns:
+        The selected field names, or None if the mask has no paths.
+
+    Raises:
+        ValueError: If a path is not a field of ``descriptor``.
+    """
+    if not mask.paths:
+        return None
+    if not mask.IsValidForDescriptor(descriptor):
+        raise ValueError(f"invalid field mask: {', '.join(mask.paths)}")
+    return list(dict.fromkeys(mask.paths))
+
+
+def project(record: BaseModel, fields: Sequence[str]) -> Dict[str, Any]:
+    """Read only ``fields`` of a stored record into a plain dict.
+
+    The dict is serialized as is, so the unselected fields are never
+    copied, validated or encoded.
+    """
+    return {name: getattr(record, name) for name in fields}
+
+
+def fields_param(model: Type[BaseModel]) -> Callable[..., Optional[List[str]]]:
+    """Build a dependency reading the ``fields`` query parameter.
+
+    The dependency returns ``parse_fields(fields, model)`` and turns an
+    unknown field name into a 400.
+
+    Example:
+        >>> @router.get("/{user_id}")
+        ... async def get_user(user_id: str, fields=Depends(fields_param(User))):
+        ...     ...
+    """
+
+    def dependency(
+        fields: Optional[List[str]] = Query(
+            None, description="Fields to return (comma-separated or repeated)"
+        )
+    ) -> Optional[List[str]]:
+        try:
+            return parse_fields(fields, model)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    return dependency
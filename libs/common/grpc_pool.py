@@ -0,0 +1,175 @@
+import asyncio
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import grpc
+
+from libs.common.logging import get_logger
+from libs.common.metrics import Metrics
+
+logger = get_logger(__name__)
+
+S = TypeVar("S")
+
+
+class GrpcChannelPool:
+    """Fixed-size pool of long-lived ``grpc.aio`` channels to one target.
+
+    Calls are spread round-robin over ``size`` channels; each channel uses the
+    ``round_robin`` load-balancing policy over the subchannels its target
+    resolves to, and its own subchannel pool so channels don't collapse onto
+    one HTTP/2 connection. HTTP/2 keepalive pings keep idle connections warm
+    and detect dead peers without waiting for a call to fail.
+
+    Channels are created lazily inside the running event loop; generated
+    stubs are cached per channel so hot paths never rebuild them.
+
+    Args:
+        target: gRPC target (e.g., "localhost:50051" or "dns:///users:50051").
+        size: Number of channels in the pool.
+        keepalive_time_ms: Interval between keepalive pings.
+        keepalive_timeout_ms: Time to wait for a ping ack before closing.
+        metrics: Optional Metrics instance to report readiness into.
+        name: Prefix for the reported metric names.
+
+    Example:
+        >>> pool = GrpcChannelPool("localhost:50051", size=4)
+        >>> await pool.warm_up()
+        >>> stub = pool.stub(user_pb2_grpc.UserServiceStub)
+    """
+
+    def __init__(
+        self,
+        target: str,
+        size: int = 2,
+        keepalive_time_ms: int = 30000,
+        keepalive_timeout_ms: int = 10000,
+        metrics: Optional[Metrics] = None,
+        name: str = "grpc_pool",
+    ) -> None:
+        self.target = target
+        self.size = max(1, size)
+        self.options: List[Tuple[str, Any]] = [
+            ("grpc.keepalive_time_ms", keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.lb_policy_name", "round_robin"),
+            ("grpc.use_local_subchannel_pool", 1),
+        ]
+        self.metrics = metrics
+        self.name = name
+        self._channels: List[grpc.aio.Channel] = []
+        self._stubs: Dict[Tuple[int, Callable], Any] = {}
+        self._next = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def is_usable(self) -> bool:
+        """True if the pool's channels belong to the current event loop."""
+        if self._loop is None:
+            return True
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return not self._loop.is_closed()
+
+    def _new_channel(self) -> grpc.aio.Channel:
+        if self.target.endswith(":443"):
+            return grpc.aio.secure_channel(
+                self.target, grpc.ssl_channel_credentials(), options=self.options
+            )
+        return grpc.aio.insecure_channel(self.target, options=self.options)
+
+    def _ensure_channels(self) -> None:
+        if not self._channels:
+            self._loop = asyncio.get_running_loop()
+            self._channels = [self._new_channel() for _ in range(self.size)]
+
+    def channel(self) -> grpc.aio.Channel:
+        """Return the next channel in round-robin order."""
+        self._ensure_channels()
+        return self._channels[next(self._next) % self.size]
+
+    def stub(self, stub_cls: Callable[[grpc.aio.Channel], S]) -> S:
+        """Return a cached stub of ``stub_cls`` bound to the next channel.
+
+        Args:
+            stub_cls: Generated stub class (e.g., ``UserServiceStub``).
+
+        Returns:
+            A stub instance; the same instance is reused for each channel.
+        """
+        self._ensure_channels()
+        index = next(self._next) % self.size
+        key = (index, stub_cls)
+        stub = self._stubs.get(key)
+        if stub is None:
+            stub = self._stubs[key] = stub_cls(self._channels[index])
+        return stub
+
+    async def warm_up(self, timeout: float = 1.0) -> bool:
+        """Connect all channels ahead of the first call.
+
+        Args:
+            timeout: Seconds to wait for the channels to become ready.
+
+        Returns:
+            True if every channel is ready, False if the target is not
+            reachable yet (calls will keep trying to connect).
+        """
+        self._ensure_channels()
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ch.channel_ready(), timeout) for ch in self._channels),
+            return_exceptions=True,
+        )
+        ready = sum(1 for r in results if not isinstance(r, BaseException))
+        if self.metrics is not None:
+            self.metrics.set(f"{self.name}_channels_ready", ready)
+        if ready < self.size:
+            logger.warning(
+                "gRPC warm-up: %d/%d channels ready for %s",
+                ready,
+                self.size,
+                self.target,
+            )
+        return ready == self.size
+
+    async def close(self) -> None:
+        """Close all channels. The pool reconnects lazily if used again."""
+        channels, self._channels = self._channels, []
+        self._stubs.clear()
+        self._loop = None
+        for ch in channels:
+            await ch.close()
+
+
+# Process-wide pools, one per target
+_pools: Dict[str, GrpcChannelPool] = {}
+
+
+def get_channel_pool(target: str, **kwargs: Any) -> GrpcChannelPool:
+    """Return the process-wide channel pool for ``target``, creating it once.
+
+    A pool whose channels were created on another (now closed) event loop is
+    replaced, which keeps test suites with per-test loops working.
+
+    Args:
+        target: gRPC target address.
+        **kwargs: Options for ``GrpcChannelPool`` when a new pool is created.
+
+    Returns:
+        The shared GrpcChannelPool for the target.
+    """
+    pool = _pools.get(target)
+    if pool is None or not pool.is_usable:
+        pool = _pools[target] = GrpcChannelPool(target, **kwargs)
+    return pool
+
+
+async def close_channel_pools() -> None:
+    """Close and forget every process-wide channel pool."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
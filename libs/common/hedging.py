@@ -0,0 +1,156 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Set, TypeVar
+
+from libs.common.metrics import Metrics
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of recent call latencies with cached percentiles.
+
+    Args:
+        window: Number of most recent samples kept.
+        recompute_every: Samples between percentile recomputations, which
+            keeps ``percentile()`` O(1) on the hot path.
+    """
+
+    def __init__(self, window: int = 1000, recompute_every: int = 50) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._recompute_every = recompute_every
+        self._since_sorted = 0
+        self._sorted: list = []
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample in seconds."""
+        self._samples.append(seconds)
+        self._since_sorted += 1
+
+    def percentile(self, p: float) -> float:
+        """Return the ``p`` quantile (0..1) of the window, 0.0 if empty."""
+        if not self._samples:
+            return 0.0
+        if self._since_sorted >= self._recompute_every or not self._sorted:
+            self._sorted = sorted(self._samples)
+            self._since_sorted = 0
+        index = min(len(self._sorted) - 1, int(p * len(self._sorted)))
+        return self._sorted[index]
+
+
+class Hedger:
+    """Send a backup request when the first one is slower than usual.
+
+    If a call has not finished after the ``percentile`` latency of recent
+    calls (clamped to ``[min_delay, max_delay]``), the same call is started a
+    second time; the first to succeed wins and the other is cancelled. Only
+    use this for idempotent reads. Until ``min_samples`` latencies have been
+    seen, ``max_delay`` is used.
+
+    ``fn`` is invoked once per request, so whatever endpoint selection it
+    does happens again for the hedge, which lets a balancer pick another
+    replica for it.
+
+    Reported through ``metrics`` (if given): ``{name}_calls_total``,
+    ``{name}_hedges_total``, ``{name}_hedge_wins_total`` and the
+    ``{name}_hedge_rate``, ``{name}_win_rate`` and ``{name}_delay_ms`` gauges.
+
+    Args:
+        percentile: Latency quantile (0..1) after which a hedge is sent.
+        min_delay: Lower bound on the hedge delay, in seconds.
+        max_delay: Upper bound on the hedge delay, in seconds.
+        min_samples: Samples needed before the percentile is trusted.
+        metrics: Optional Metrics instance to report into.
+        name: Prefix for the reported metric names.
+
+    Example:
+        >>> hedger = Hedger(percentile=0.95)
+        >>> exists = await hedger.call(lambda: check_user_exists(user_id))
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.005,
+        max_delay: float = 0.5,
+        min_samples: int = 20,
+        metrics: Optional[Metrics] = None,
+        name: str = "hedge",
+    ) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.metrics = metrics
+        self.name = name
+        self.latencies = LatencyTracker()
+        self.calls = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def delay(self) -> float:
+        """Return how long to wait before sending a hedge, in seconds."""
+        if len(self.latencies) < self.min_samples:
+            return self.max_delay
+        observed = self.latencies.percentile(self.percentile)
+        return min(self.max_delay, max(self.min_delay, observed))
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn``, hedging it once if it is slow.
+
+        Args:
+            fn: Zero-argument coroutine function making one request.
+
+        Returns:
+            The result of the first request to succeed.
+
+        Raises:
+            Exception: The last error if every request failed.
+        """
+        self.calls += 1
+        self._inc("calls_total")
+        delay = self.delay()
+        start = time.monotonic()
+        first = asyncio.ensure_future(fn())
+        pending: Set["asyncio.Future[T]"] = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                self.hedges += 1
+                self._inc("hedges_total")
+                pending.add(asyncio.ensure_future(fn()))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.wins += 1
+                            self._inc("hedge_wins_total")
+                        self.latencies.record(time.monotonic() - start)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            self._report(delay)
+
+    def _inc(self, counter: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"{self.name}_{counter}")
+
+    def _report(self, delay: float) -> None:
+        if self.metrics is None:
+            return
+        self.metrics.set(f"{self.name}_hedge_rate", self.hedges / self.calls)
+        self.metrics.set(
+            f"{self.name}_win_rate", self.wins / self.hedges if self.hedges else 0.0
+        )
+        self.metrics.set(f"{self.name}_delay_ms", delay * 1000)
@@ -1,50 +1,272 @@
+import asyncio
+from urllib.parse import quote
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
 import httpx
 import grpc
 
+from libs.common.grpc_pool import GrpcChannelPool, get_channel_pool
+from libs.common.metrics import Metrics
+from libs.common.resilience import ServiceUnavailableError
+
+T = TypeVar("T")
+
+
+class PooledHttpClient:
+    """Long-lived HTTP client shared by all requests of one application.
+
+    Wraps a single ``httpx.AsyncClient`` so inter-service calls reuse
+    keep-alive connections instead of opening a new TCP connection per call.
+    The underlying client is created lazily on first use and released with
+    ``aclose()``, which the owning app calls from its lifespan handler.
+
+    Pool usage is reported through ``metrics`` (if given):
+        - ``{name}_requests_total``: requests sent through the pool.
+        - ``{name}_connections_opened_total``: new TCP connections opened.
+        - ``{name}_errors_total``: requests that failed at transport level.
+        - ``{name}_in_flight`` (gauge): requests currently waiting on a reply.
+
+    Args:
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept.
+        keepalive_expiry: Seconds an idle connection is kept before closing.
+        timeout: Default read/write/pool timeout in seconds.
+        connect_timeout: Timeout for establishing a connection in seconds.
+        metrics: Optional Metrics instance to report pool usage into.
+        name: Prefix for the reported metric names.
+        transport: Optional custom transport (e.g. ASGITransport in tests).
+
+    Example:
+        >>> client = PooledHttpClient(max_connections=50)
+        >>> response = await client.get("http://localhost:8001/health")
+        >>> await client.aclose()
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 5.0,
+        connect_timeout: float = 1.0,
+        metrics: Optional[Metrics] = None,
+        name: str = "http_client",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.metrics = metrics
+        self.name = name
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared ``httpx.AsyncClient``, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=self.limits, timeout=self.timeout, transport=self._transport
+            )
+        return self._client
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request through the pooled client.
+
+        Args:
+            url: Absolute URL to request.
+            **kwargs: Extra arguments forwarded to ``httpx.AsyncClient.get``.
+
+        Returns:
+            The HTTP response.
+
+        Raises:
+            httpx.RequestError: If the request fails at transport level.
+        """
+        self._inc("requests_total")
+        self._set_in_flight(self._in_flight + 1)
+        try:
+            return await self.client.get(
+                url, extensions={"trace": self._trace}, **kwargs
+            )
+        except httpx.RequestError:
+            self._inc("errors_total")
+            raise
+        finally:
+            self._set_in_flight(self._in_flight - 1)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections. The client can be reused afterwards."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        # httpcore only connects when no idle pooled connection was available
+        if event_name == "connection.connect_tcp.complete":
+            self._inc("connections_opened_total")
+
+    def _inc(self, counter: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"{self.name}_{counter}")
+
+    def _set_in_flight(self, value: int) -> None:
+        self._in_flight = value
+        if self.metrics is not None:
+            self.metrics.set(f"{self.name}_in_flight", value)
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one in-flight call.
+
+    The first caller for a key (the leader) starts the call; callers arriving
+    while it is running await the same result instead of issuing their own,
+    and receive its exception if it fails. Nothing is remembered once the
+    call completes, so put a cache in front of this for reuse over time.
+
+    The shared call runs as its own task: a cancelled caller does not cancel
+    the lookup the other callers are waiting on.
+
+    Reported through ``metrics`` (if given): ``{name}_leaders_total`` (calls
+    actually made) and ``{name}_collapsed_total`` (calls that joined one).
+
+    Args:
+        metrics: Optional Metrics instance to report into.
+        name: Prefix for the reported metric names.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> exists = await flight.do(user_id, lambda: check_user_exists(user_id))
+    """
+
+    def __init__(self, metrics: Optional[Metrics] = None, name: str = "singleflight"):
+        self.metrics = metrics
+        self.name = name
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` for ``key`` unless an identical call is already running.
+
+        Args:
+            key: Identity of the call (e.g., the user ID).
+            fn: Zero-argument coroutine function performing the call.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            self._inc("collapsed_total")
+        else:
+            self._inc("leaders_total")
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, done: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is done:
+            del self._calls[key]
+        if not done.cancelled():
+            done.exception()  # mark as retrieved even if every caller left
+
+    def _inc(self, counter: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"{self.name}_{counter}")
+
 
 async def check_user_exists(
-    user_id: str, user_service_url: str = "http://localhost:8001"
+    user_id: str,
+    user_service_url: str = "http://localhost:8001",
+    client: Optional[PooledHttpClient] = None,
+    timeout: Optional[float] = None,
 ) -> bool:
     """Check if a user exists by calling the User service via REST.
 
     Args:
         user_id: The user ID to verify.
         user_service_url: Base URL of the User service (default: localhost:8001).
+        client: Shared pooled client to send the request through. When omitted
+            a short-lived client is opened for this call only.
+        timeout: Per-call timeout in seconds (default: the client's timeout).
 
     Returns:
-        True if the user exists, False otherwise.
+        True if the user exists, False if the User service says it does not
+        or rejects the ID (any 4xx but 429: the ID cannot name a user).
+        An ID that would resolve to another route (empty, ``.``, ``..`` or
+        containing ``/``) is False without a call.
 
     Raises:
-        httpx.RequestError: If the request to User service fails.
+        ServiceUnavailableError: If the User service could not be reached,
+            timed out, or answered with a 5xx, a 429 or another unexpected
+            status. Only these count against retries, the circuit breaker
+            and replica ejection, so a caller-chosen ID cannot trip them.
 
     Example:
         >>> exists = await check_user_exists("u_abc123")
         >>> if exists:
         ...     print("User found!")
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{user_service_url}/users/{user_id}")
-            return response.status_code == 200
-        except httpx.RequestError:
-            # In production, handle timeouts, retries, circuit breakers, etc.
-            return False
+    if not user_id or "/" in user_id or user_id in (".", ".."):
+        return False
+    url = f"{user_service_url}/users/{quote(user_id, safe='')}"
+    kwargs: Dict[str, Any] = {} if timeout is None else {"timeout": timeout}
+    try:
+        if client is not None:
+            response = await client.get(url, **kwargs)
+        else:
+            async with httpx.AsyncClient() as one_off:
+                response = await one_off.get(url, **kwargs)
+    except httpx.RequestError as exc:
+        raise ServiceUnavailableError(f"user service request failed: {exc!r}") from exc
+    status = response.status_code
+    if status == 200:
+        return True
+    if 400 <= status < 500 and status != 429:
+        return False
+    raise ServiceUnavailableError(
+        f"user service answered with status {response.status_code}"
+    )
 
 
 async def check_user_exists_grpc(
-    user_id: str, user_service_url: str = "localhost:50051"
+    user_id: str,
+    user_service_url: str = "localhost:50051",
+    pool: Optional[GrpcChannelPool] = None,
+    timeout: Optional[float] = None,
 ) -> bool:
     """Check if a user exists by calling the User service via gRPC.
 
     Args:
         user_id: The user ID to verify.
         user_service_url: gRPC endpoint of the User service (default: localhost:50051).
+        pool: Channel pool to call through. When omitted the process-wide
+            pool for ``user_service_url`` is used.
+        timeout: Per-call deadline in seconds (default: none).
 
     Returns:
-        True if the user exists, False otherwise.
+        True if the user exists, False if the User service says it does not.
 
     Raises:
-        grpc.RpcError: If the gRPC call fails.
+        ServiceUnavailableError: If the call failed or missed its deadline.
 
     Example:
         >>> exists = await check_user_exists_grpc("u_abc123")
@@ -54,18 +276,133 @@ async def check_user_exists_grpc(
     # Import here to avoid circular imports and grpc availability checks
     from services.user_service.app import user_pb2, user_pb2_grpc
 
+    pool = pool or get_channel_pool(user_service_url)
     try:
-        async with (
-            grpc.aio.secure_channel(
-                user_service_url, grpc.aio.ssl_channel_credentials()
-            )
-            if ":" in user_service_url and user_service_url.endswith(":443")
-            else grpc.aio.insecure_channel(user_service_url)
-        ) as channel:
-            stub = user_pb2_grpc.UserServiceStub(channel)
-            request = user_pb2.UserExistsRequest(user_id=user_id)
-            response = await stub.UserExists(request)
-            return response.exists
-    except grpc.RpcError:
-        # In production, handle retries, circuit breakers, etc.
-        return False
+        stub = pool.stub(user_pb2_grpc.UserServiceStub)
+        request = user_pb2.UserExistsRequest(user_id=user_id)
+        response = await stub.UserExists(request, timeout=timeout)
+    except grpc.RpcError as exc:
+        raise ServiceUnavailableError(f"user service RPC failed: {exc!r}") from exc
+    return response.exists
+
+
+async def check_users_exist_grpc(
+    user_ids: Iterable[str],
+    user_service_url: str = "localhost:50051",
+    pool: Optional[GrpcChannelPool] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, bool]:
+    """Check many users in one ``BatchUserExists`` call to the User service.
+
+    Args:
+        user_ids: The user IDs to verify.
+        user_service_url: gRPC endpoint of the User service (default: localhost:50051).
+        pool: Channel pool to call through. When omitted the process-wide
+            pool for ``user_service_url`` is used.
+        timeout: Per-call deadline in seconds (default: none).
+
+    Returns:
+        Mapping of each distinct user ID to whether it exists.
+
+    Raises:
+        ServiceUnavailableError: If the call failed or missed its deadline.
+
+    Example:
+        >>> exists = await check_users_exist_grpc(["u_abc123", "u_def456"])
+        >>> exists["u_abc123"]
+        True
+    """
+    from services.user_service.app import user_pb2, user_pb2_grpc
+
+    user_ids = list(dict.fromkeys(user_ids))
+    pool = pool or get_channel_pool(user_service_url)
+    try:
+        stub = pool.stub(user_pb2_grpc.UserServiceStub)
+        request = user_pb2.BatchUserExistsRequest(user_ids=user_ids)
+        response = await stub.BatchUserExists(request, timeout=timeout)
+    except grpc.RpcError as exc:
+        raise ServiceUnavailableError(f"user service RPC failed: {exc!r}") from exc
+    return {user_id: response.exists.get(user_id, False) for user_id in user_ids}
+
+
+async def fetch_user_bloom(
+    user_service_url: str = "http://localhost:8001",
+    client: Optional[PooledHttpClient] = None,
+    version: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Download the User service's Bloom filter of user IDs via REST.
+
+    Args:
+        user_service_url: Base URL of the User service (default: localhost:8001).
+        client: Shared pooled client to send the request through. When omitted
+            a short-lived client is opened for this call only.
+        version: Version (ETag) of the filter the caller already has.
+        timeout: Per-call timeout in seconds (default: the client's timeout).
+
+    Returns:
+        Tuple of (serialized filter, version); the filter is None if
+        ``version`` is still current.
+
+    Raises:
+        ServiceUnavailableError: If the User service could not be reached,
+            timed out, or answered with an unexpected status.
+    """
+    url = f"{user_service_url}/bloom/users"
+    kwargs: Dict[str, Any] = {} if timeout is None else {"timeout": timeout}
+    if version is not None:
+        kwargs["headers"] = {"If-None-Match": version}
+    try:
+        if client is not None:
+            response = await client.get(url, **kwargs)
+        else:
+            async with httpx.AsyncClient() as one_off:
+                response = await one_off.get(url, **kwargs)
+    except httpx.RequestError as exc:
+        raise ServiceUnavailableError(f"user service request failed: {exc!r}") from exc
+    if response.status_code == 304:
+        return None, version
+    if response.status_code == 200:
+        return response.content, response.headers.get("ETag")
+    raise ServiceUnavailableError(
+        f"user service answered with status {response.status_code}"
+    )
+
+
+async def fetch_user_bloom_grpc(
+    user_service_url: str = "localhost:50051",
+    pool: Optional[GrpcChannelPool] = None,
+    version: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Download the User service's Bloom filter of user IDs via gRPC.
+
+    Args:
+        user_service_url: gRPC endpoint of the User service (default: localhost:50051).
+        pool: Channel pool to call through. When omitted the process-wide
+            pool for ``user_service_url`` is used.
+        version: Version of the filter the caller already has, as returned
+            by a previous call.
+        timeout: Per-call deadline in seconds (default: none).
+
+    Returns:
+        Tuple of (serialized filter, version); the filter is None if
+        ``version`` is still current.
+
+    Raises:
+        ServiceUnavailableError: If the call failed or missed its deadline.
+    """
+    from services.user_service.app import user_pb2, user_pb2_grpc
+
+    epoch, _, known = (version or "").partition("-")
+    pool = pool or get_channel_pool(user_service_url)
+    try:
+        stub = pool.stub(user_pb2_grpc.UserServiceStub)
+        request = user_pb2.GetUserBloomFilterRequest(
+            known_version=int(known or -1), epoch=epoch
+        )
+        response = await stub.GetUserBloomFilter(request, timeout=timeout)
+    except grpc.RpcError as exc:
+        raise ServiceUnavailableError(f"user service RPC failed: {exc!r}") from exc
+    current = f"{response.epoch}-{response.version}"
+    return (None if response.not_modified else response.filter), current
@@ -0,0 +1,81 @@
+import json
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from libs.common.fields import project
+from libs.common.pagination import decode_cursor, iter_pages
+
+NDJSON = "application/x-ndjson"
+
+# Records read from the repository (and written as one chunk) at a time
+NDJSON_CHUNK_SIZE = 500
+
+ListPage = Callable[
+    [int, Optional[str]], Awaitable[Tuple[List[BaseModel], Optional[str]]]
+]
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    """Return True if an ``Accept`` header asks for newline-delimited JSON."""
+    if not accept:
+        return False
+    return any(part.split(";")[0].strip() == NDJSON for part in accept.split(","))
+
+
+async def ndjson_response(
+    list_page: ListPage,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    chunk_size: int = NDJSON_CHUNK_SIZE,
+    fields: Optional[Sequence[str]] = None,
+) -> StreamingResponse:
+    """Stream a repository listing as one JSON object per line.
+
+    Records are read ``chunk_size`` at a time through the repository's
+    keyset ``list_page`` and each chunk is serialized and sent before the
+    next is read, so the first byte goes out after one chunk and memory
+    stays at one chunk however large the store is.
+
+    Args:
+        list_page: Repository method taking (limit, after key).
+        after: Page token to start after (None: from the beginning).
+        limit: Maximum number of records to send (None: all of them).
+        chunk_size: Records per repository read and per written chunk.
+        fields: Only these fields of each record are written (None: all).
+
+    Returns:
+        A StreamingResponse with media type ``application/x-ndjson``.
+
+    Raises:
+        InvalidCursorError: If ``after`` is not a valid page token; raised
+            before the response starts.
+    """
+    key = decode_cursor(after) if after else None
+    size = min(chunk_size, limit) if limit else chunk_size
+    pages = iter_pages(list_page, size, key)
+    # read the first page now so a bad token is an error, not a broken stream
+    first = await pages.__anext__()
+
+    def line(item: BaseModel) -> str:
+        if fields is None:
+            return item.model_dump_json() + "\n"
+        return json.dumps(project(item, fields), separators=(",", ":")) + "\n"
+
+    async def body() -> AsyncIterator[bytes]:
+        remaining = limit
+        page: Optional[Tuple[List[BaseModel], Optional[str]]] = first
+        while page is not None:
+            items, more = page
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            if items:
+                yield "".join(line(item) for item in items).encode()
+            if more is None or remaining == 0:
+                break
+            page = await pages.__anext__()
+        await pages.aclose()
+
+    return StreamingResponse(body(), media_type=NDJSON)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Union
 from enum import Enum
 from collections import defaultdict
 import time
@@ -30,10 +30,12 @@ class Metrics:
     Attributes:
         start_time: Timestamp when the metrics were created (float).
         counters: Dictionary of counter values (str -> int).
+        gauges: Dictionary of point-in-time values (str -> int | float).
     """
 
     start_time: float = field(default_factory=time.time)
     counters: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    gauges: Dict[str, Union[int, float]] = field(default_factory=dict)
 
     def inc(self, name: str, amount: int = 1) -> None:
         """Increment a counter by the given amount.
@@ -49,6 +51,19 @@ class Metrics:
         """
         self.counters[name] += amount
 
+    def set(self, name: str, value: Union[int, float]) -> None:
+        """Set a gauge to the given value.
+
+        Args:
+            name: Gauge name (e.g., "http_client_in_flight").
+            value: Current value of the gauge.
+
+        Example:
+            >>> m = Metrics()
+            >>> m.set("http_client_in_flight", 3)
+        """
+        self.gauges[name] = value
+
     def snapshot(self) -> Dict:
         """Return a snapshot of current metrics state.
 
@@ -56,6 +71,7 @@ class Metrics:
             A dictionary with:
                 - uptime_seconds (float): Time elapsed since creation.
                 - counters (dict): Copy of all counter values.
+                - gauges (dict): Copy of all gauge values.
 
         Example:
             >>> m = Metrics()
@@ -68,4 +84,5 @@ class Metrics:
         return {
             "uptime_seconds": time.time() - self.start_time,
             "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
         }
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+from libs.common.bulk import MAX_BATCH_GET_IDS
 
 
 class UserCreate(BaseModel):
@@ -52,3 +54,201 @@ class Product(ProductCreate):
     """
 
     id: str
+
+
+class ProductBulkResult(BaseModel):
+    """Outcome of one item of a bulk product creation.
+
+    Attributes:
+        index: Position of the item in the request array.
+        status: HTTP status the item would have had on its own (200 created,
+            422 invalid or unknown user, 503 User service unavailable).
+        product: The created product, if any.
+        error: Why the item was not created, if it was not.
+    """
+
+    index: int
+    status: int
+    product: Optional[Product] = None
+    error: Optional[str] = None
+
+
+class ProductBulkResponse(BaseModel):
+    """Response model for a bulk product creation.
+
+    Attributes:
+        created: Number of products created.
+        failed: Number of items rejected.
+        results: One result per request item, in request order.
+    """
+
+    created: int
+    failed: int
+    results: List[ProductBulkResult]
+
+
+class ProductChange(BaseModel):
+    """One entry of the product change feed.
+
+    Attributes:
+        sequence: Sequence number of the change (increasing, from 1).
+        timestamp: When the change happened (seconds since the Unix epoch).
+        product: The product as it is now.
+    """
+
+    sequence: int
+    timestamp: float
+    product: Product
+
+
+class ProductChangesResponse(BaseModel):
+    """Response model for a read of the product change feed.
+
+    Attributes:
+        epoch: Identifies the feed; sequence numbers from another epoch
+            (e.g. before a restart) are meaningless.
+        changes: Changes after the requested sequence, oldest first.
+        next_since: Sequence to pass as ``since`` on the next read.
+        has_more: Whether more changes are available right away.
+    """
+
+    epoch: str
+    changes: List[ProductChange]
+    next_since: int
+    has_more: bool
+
+
+class ProductSearchHit(BaseModel):
+    """One match of a product search.
+
+    Attributes:
+        score: Number of occurrences of the query terms in the name.
+        product: The matching product.
+    """
+
+    score: int
+    product: Product
+
+
+class ProductSearchResponse(BaseModel):
+    """Response model for a product name search.
+
+    Attributes:
+        total: Number of products matching every query term.
+        results: The best matches, highest score first.
+    """
+
+    total: int
+    results: List[ProductSearchHit]
+
+
+class SearchIndexStats(BaseModel):
+    """Size of the product name search index.
+
+    Attributes:
+        products: Number of products indexed.
+        terms: Number of distinct terms.
+        postings: Number of (term, product) entries.
+        bytes: Estimated memory held by the index (product IDs excluded,
+            as they are shared with the store).
+        bytes_per_product: ``bytes`` divided by ``products``.
+    """
+
+    products: int
+    terms: int
+    postings: int
+    bytes: int
+    bytes_per_product: float
+
+
+class UserBulkResult(BaseModel):
+    """Outcome of one item of a bulk user creation.
+
+    Attributes:
+        index: Position of the item in the request array.
+        status: HTTP status the item would have had on its own (200 created,
+            409 duplicate email, 422 invalid).
+        user: The created user, if any.
+        error: Why the item was not created, if it was not.
+    """
+
+    index: int
+    status: int
+    user: Optional[User] = None
+    error: Optional[str] = None
+
+
+class UserBulkResponse(BaseModel):
+    """Response model for a bulk user creation.
+
+    Attributes:
+        created: Number of users created.
+        failed: Number of items rejected.
+        elapsed_ms: Server-side time spent validating and inserting.
+        users_per_second: Ingest throughput of this request.
+        results: One result per request item, in request order.
+    """
+
+    created: int
+    failed: int
+    elapsed_ms: float
+    users_per_second: float
+    results: List[UserBulkResult]
+
+
+class BatchGetRequest(BaseModel):
+    """Request model for fetching several records by ID in one call.
+
+    Attributes:
+        ids: IDs to look up; results come back in the same order.
+    """
+
+    ids: List[str] = Field(max_length=MAX_BATCH_GET_IDS)
+
+
+class ProductBatchGetItem(BaseModel):
+    """One result of a product batch get.
+
+    Attributes:
+        id: The requested product ID.
+        found: Whether a product with this ID exists.
+        product: The product, if found.
+    """
+
+    id: str
+    found: bool
+    product: Optional[Product] = None
+
+
+class ProductBatchGetResponse(BaseModel):
+    """Response model for a product batch get.
+
+    Attributes:
+        results: One entry per requested ID, in request order.
+    """
+
+    results: List[ProductBatchGetItem]
+
+
+class UserBatchGetItem(BaseModel):
+    """One result of a user batch get.
+
+    Attributes:
+        id: The requested user ID.
+        found: Whether a user with this ID exists.
+        user: The user, if found.
+    """
+
+    id: str
+    found: bool
+    user: Optional[User] = None
+
+
+class UserBatchGetResponse(BaseModel):
+    """Response model for a user batch get.
+
+    Attributes:
+        results: One entry per requested ID, in request order.
+    """
+
+    results: List[UserBatchGetItem]
@@ -0,0 +1,161 @@
+import base64
+import binascii
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+# Page size used when the client does not ask for one, and the largest allowed
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Response header carrying the token of the next page on REST list endpoints
+NEXT_PAGE_HEADER = "X-Next-Page-Token"
+
+
+class InvalidCursorError(ValueError):
+    """A page token could not be decoded."""
+
+
+class InsertionIndex(Generic[K]):
+    """Append-only sequence of keys with O(1) lookup of a key's position.
+
+    Backs keyset pagination over in-memory stores: a page after key ``k``
+    is a slice starting right after ``k``'s position, so it costs O(page)
+    however large the store is. Records are never deleted, so positions
+    never shift.
+
+    Example:
+        >>> index = InsertionIndex()
+        >>> index.extend(["a", "b", "c"])
+        >>> index.page(after="a", limit=1)
+        (['b'], 'b')
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[K] = []
+        self._positions: Dict[K, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def append(self, key: K) -> None:
+        """Add ``key`` at the end."""
+        self._positions[key] = len(self._keys)
+        self._keys.append(key)
+
+    def extend(self, keys: Iterable[K]) -> None:
+        """Add ``keys`` at the end, in order."""
+        for key in keys:
+            self.append(key)
+
+    def page(self, after: Optional[K], limit: int) -> Tuple[List[K], Optional[K]]:
+        """Return up to ``limit`` keys following ``after``.
+
+        Args:
+            after: Last key of the previous page (None for the first page).
+            limit: Maximum number of keys to return.
+
+        Returns:
+            Tuple of (keys, last key of the page if more keys follow, else None).
+
+        Raises:
+            InvalidCursorError: If ``after`` is not in the index.
+        """
+        if after is None:
+            start = 0
+        else:
+            position = self._positions.get(after)
+            if position is None:
+                raise InvalidCursorError(f"unknown page token key {after!r}")
+            start = position + 1
+        keys = self._keys[start : start + limit]
+        more = start + limit < len(self._keys)
+        return keys, (keys[-1] if more and keys else None)
+
+
+def encode_cursor(key: str) -> str:
+    """Turn the last key of a page into an opaque page token."""
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> str:
+    """Turn a page token back into the key it was made from.
+
+    Raises:
+        InvalidCursorError: If ``token`` is not a page token.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError(f"invalid page token {token!r}") from exc
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """Return ``limit`` bounded to [1, MAX_PAGE_SIZE] (default if unset/0)."""
+    if not limit:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(MAX_PAGE_SIZE, limit))
+
+
+async def fetch_page(
+    list_page: Callable[[int, Optional[str]], Awaitable[Tuple[List[T], Optional[str]]]],
+    limit: Optional[int],
+    token: Optional[str],
+) -> Tuple[List[T], Optional[str]]:
+    """Fetch one page from a repository ``list_page`` using page tokens.
+
+    Args:
+        list_page: Repository method taking (limit, after key).
+        limit: Requested page size (clamped; default if None or 0).
+        token: Page token from the previous page (None or "": first page).
+
+    Returns:
+        Tuple of (items, token of the next page or None).
+
+    Raises:
+        InvalidCursorError: If ``token`` is malformed or unknown.
+    """
+    after = decode_cursor(token) if token else None
+    items, next_after = await list_page(clamp_page_size(limit), after)
+    return items, (encode_cursor(next_after) if next_after is not None else None)
+
+
+async def iter_pages(
+    list_page: Callable[[int, Optional[str]], Awaitable[Tuple[List[T], Optional[str]]]],
+    size: int,
+    after: Optional[str] = None,
+) -> AsyncIterator[Tuple[List[T], Optional[str]]]:
+    """Walk a repository ``list_page`` from ``after`` to the end.
+
+    Only one page is held at a time, so a caller that consumes each page
+    before asking for the next reads any number of records with bounded
+    memory.
+
+    Args:
+        list_page: Repository method taking (limit, after key).
+        size: Records per page.
+        after: Key to start after (None: from the beginning).
+
+    Yields:
+        Tuples of (page of records, key of its last record if more follow,
+        else None).
+    """
+    while True:
+        items, after = await list_page(size, after)
+        yield items, after
+        if after is None:
+            return
@@ -0,0 +1,282 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from libs.common.logging import get_logger
+from libs.common.metrics import Metrics
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ServiceUnavailableError(Exception):
+    """An upstream call failed: the answer is unknown, not "no"."""
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """The circuit breaker is open, so the call was not attempted."""
+
+
+class CircuitState(Enum):
+    """States of a circuit breaker (values are reported as a gauge)."""
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Closed: calls go through; ``failure_threshold`` consecutive failures open
+    the circuit. Open: calls fail fast with CircuitOpenError until
+    ``reset_timeout`` seconds have passed. Half-open: up to
+    ``half_open_max_calls`` probe calls go through; a success closes the
+    circuit, a failure opens it again.
+
+    Reported through ``metrics`` (if given): the ``{name}_state`` gauge
+    (see CircuitState), ``{name}_opened_total`` and ``{name}_rejected_total``.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before probing.
+        half_open_max_calls: Concurrent probe calls allowed while half-open.
+        metrics: Optional Metrics instance to report into.
+        name: Prefix for the reported metric names.
+        clock: Monotonic time source (overridable in tests).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        half_open_max_calls: int = 1,
+        metrics: Optional[Metrics] = None,
+        name: str = "circuit",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.metrics = metrics
+        self.name = name
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._set_state(CircuitState.CLOSED)
+
+    def before_call(self) -> None:
+        """Admit a call or reject it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken.
+        """
+        now = self._clock()
+        if self.state is CircuitState.OPEN:
+            if now - self._opened_at < self.reset_timeout:
+                self._reject()
+            self._set_state(CircuitState.HALF_OPEN)
+            self._opened_at = now
+            self._probes = 0
+        if self.state is CircuitState.HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                if now - self._opened_at < self.reset_timeout:
+                    self._reject()
+                # probes never reported back (e.g. cancelled): allow new ones
+                self._opened_at = now
+                self._probes = 0
+            self._probes += 1
+
+    def record_success(self) -> None:
+        """Record a successful call; closes a half-open circuit."""
+        self._failures = 0
+        if self.state is not CircuitState.CLOSED:
+            logger.info("circuit %s closed", self.name)
+            self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call; may open the circuit."""
+        self._failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            if self.state is not CircuitState.OPEN:
+                logger.warning("circuit %s opened", self.name)
+                self._inc("opened_total")
+            self._opened_at = self._clock()
+            self._set_state(CircuitState.OPEN)
+
+    def _reject(self) -> None:
+        self._inc("rejected_total")
+        raise CircuitOpenError(f"circuit {self.name} is open")
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        if self.metrics is not None:
+            self.metrics.set(f"{self.name}_state", state.value)
+
+    def _inc(self, counter: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"{self.name}_{counter}")
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of traffic.
+
+    Every call deposits ``ratio`` tokens and every retry withdraws one, so
+    retries stay at roughly ``ratio`` of calls; ``min_per_second`` tokens are
+    added over time so low-traffic clients can still retry. This keeps a
+    struggling upstream from being hit by a retry storm.
+
+    Args:
+        ratio: Retries allowed per call (e.g., 0.2 = 20% extra load).
+        min_per_second: Retries always allowed per second.
+        max_balance: Cap on saved-up tokens.
+        clock: Monotonic time source (overridable in tests).
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 5.0,
+        max_balance: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self._clock = clock
+        self._balance = min_per_second
+        self._updated = clock()
+
+    def deposit(self) -> None:
+        """Record a call."""
+        self._refill()
+        self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Take a token for a retry.
+
+        Returns:
+            True if the retry may proceed.
+        """
+        self._refill()
+        if self._balance >= 1:
+            self._balance -= 1
+            return True
+        return False
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed, self._updated = now - self._updated, now
+        self._balance = min(
+            self.max_balance, self._balance + elapsed * self.min_per_second
+        )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How a call is retried.
+
+    Attributes:
+        max_attempts: Attempts in total, including the first one.
+        base_delay: Backoff cap for the first retry, in seconds.
+        max_delay: Upper bound on any backoff, in seconds.
+        deadline: Overall time budget for all attempts and backoffs.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 0.5
+    deadline: float = 2.0
+
+    def backoff(self, retry: int) -> float:
+        """Return a "full jitter" delay before retry number ``retry`` (1-based)."""
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        )
+
+
+async def call_with_resilience(
+    fn: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    metrics: Optional[Metrics] = None,
+    name: str = "upstream",
+) -> T:
+    """Call ``fn`` under a deadline, with budgeted retries and a breaker.
+
+    Only ServiceUnavailableError is retried; any other exception (and a
+    normal "no" answer) is returned to the caller right away.
+
+    Reported through ``metrics`` (if given): ``{name}_attempts_total``,
+    ``{name}_retries_total``, ``{name}_failures_total``,
+    ``{name}_budget_exhausted_total`` and ``{name}_deadline_exceeded_total``.
+
+    Args:
+        fn: Zero-argument coroutine function making one attempt.
+        policy: Attempts, backoff and overall deadline.
+        budget: Optional retry budget shared by all calls to the upstream.
+        breaker: Optional circuit breaker shared by all calls to the upstream.
+        metrics: Optional Metrics instance to report into.
+        name: Prefix for the reported metric names.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        ServiceUnavailableError: If every allowed attempt failed, the deadline
+            passed, or the circuit is open (CircuitOpenError).
+    """
+
+    def inc(counter: str) -> None:
+        if metrics is not None:
+            metrics.inc(f"{name}_{counter}")
+
+    if budget is not None:
+        budget.deposit()
+    try:
+        async with asyncio.timeout(policy.deadline):
+            attempt = 1
+            while True:
+                if breaker is not None:
+                    breaker.before_call()
+                inc("attempts_total")
+                try:
+                    result = await fn()
+                except CircuitOpenError:
+                    raise
+                except ServiceUnavailableError:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    if attempt >= policy.max_attempts:
+                        raise
+                    if budget is not None and not budget.try_withdraw():
+                        inc("budget_exhausted_total")
+                        raise
+                    inc("retries_total")
+                    await asyncio.sleep(policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                if breaker is not None:
+                    breaker.record_success()
+                return result
+    except TimeoutError as exc:
+        inc("deadline_exceeded_total")
+        inc("failures_total")
+        if breaker is not None:
+            breaker.record_failure()
+        raise ServiceUnavailableError(
+            f"{name}: deadline of {policy.deadline}s exceeded"
+        ) from exc
+    except ServiceUnavailableError:
+        inc("failures_total")
+        raise
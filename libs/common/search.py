@@ -0,0 +1,103 @@
+import heapq
+import re
+import sys
+from typing import Dict, Generic, Hashable, List, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+# Matches returned by a search when the client does not ask for a number
+DEFAULT_SEARCH_LIMIT = 20
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-cased word tokens.
+
+    Example:
+        >>> tokenize("Blue Widget, 2-pack")
+        ['blue', 'widget', '2', 'pack']
+    """
+    return _WORD.findall(text.lower())
+
+
+class InvertedIndex(Generic[K]):
+    """Term -> postings index for full-text search over in-memory records.
+
+    Each term maps to the keys of the documents containing it, with the
+    number of occurrences, in insertion order. A multi-term query
+    intersects the postings lists starting from the shortest, so its cost
+    follows the rarest term rather than the size of the store, and ranks
+    the matches by total term frequency.
+
+    Example:
+        >>> index = InvertedIndex()
+        >>> index.add("p_1", "Blue widget")
+        >>> index.add("p_2", "Red widget widget")
+        >>> index.search("widget", limit=10)
+        ([('p_2', 2), ('p_1', 1)], 2)
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[K, int]] = {}
+        self._documents = 0
+
+    def __len__(self) -> int:
+        """Number of documents indexed."""
+        return self._documents
+
+    def add(self, key: K, text: str) -> None:
+        """Index ``text`` as the document ``key`` (added once per key)."""
+        postings = self._postings
+        for term in tokenize(text):
+            entries = postings.get(term)
+            if entries is None:
+                entries = postings[term] = {}
+            entries[key] = entries.get(key, 0) + 1
+        self._documents += 1
+
+    def search(self, query: str, limit: int) -> Tuple[List[Tuple[K, int]], int]:
+        """Return the documents containing every term of ``query``.
+
+        Args:
+            query: Free text; tokenized like indexed text.
+            limit: Maximum number of matches to return.
+
+        Returns:
+            Tuple of ([(key, score)] best first, total number of matches).
+            The score is the summed frequency of the query terms; ties keep
+            insertion order.
+        """
+        terms = set(tokenize(query))
+        lists = [self._postings.get(term) for term in terms]
+        if not lists or None in lists:
+            return [], 0
+        lists.sort(key=len)
+        shortest, others = lists[0], lists[1:]
+        matches = [
+            (key, count + sum(entries[key] for entries in others))
+            for key, count in shortest.items()
+            if all(key in entries for entries in others)
+        ]
+        return heapq.nlargest(limit, matches, key=lambda match: match[1]), len(matches)
+
+    def memory_stats(self) -> Dict[str, int]:
+        """Estimate the memory held by the index itself.
+
+        Counts the term dict, the term strings and the postings dicts; the
+        document keys are shared with the store and not counted.
+
+        Returns:
+            Dict with ``documents``, ``terms``, ``postings`` and ``bytes``.
+        """
+        size = sys.getsizeof(self._postings)
+        postings = 0
+        for term, entries in self._postings.items():
+            size += sys.getsizeof(term) + sys.getsizeof(entries)
+            postings += len(entries)
+        return {
+            "documents": self._documents,
+            "terms": len(self._postings),
+            "postings": postings,
+            "bytes": size,
+        }
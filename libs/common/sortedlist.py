@@ -0,0 +1,105 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SortedList(Generic[T]):
+    """Sorted sequence with cheap inserts and ordered range scans.
+
+    Values are kept in sorted sublists of at most ``2 * load`` items plus
+    the maximum of each, so finding a position is two bisects and an insert
+    only shifts one sublist, not the whole sequence: a million values cost
+    about as much to insert into as a few thousand. Scanning from a bound
+    costs O(log n + k) for k values read.
+
+    Example:
+        >>> prices = SortedList([(9.5, "p_b"), (2.0, "p_a")])
+        >>> prices.add((5.0, "p_c"))
+        >>> list(prices.irange((3.0,)))
+        [(5.0, 'p_c'), (9.5, 'p_b')]
+    """
+
+    # Target sublist length; sublists are split in two above twice this
+    load = 1000
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        self._lists: List[List[T]] = []
+        self._maxes: List[T] = []
+        self._len = 0
+        self.update(values)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._lists)
+
+    def add(self, value: T) -> None:
+        """Insert ``value`` after any equal values."""
+        lists, maxes = self._lists, self._maxes
+        self._len += 1
+        if not maxes:
+            lists.append([value])
+            maxes.append(value)
+            return
+        position = bisect_right(maxes, value)
+        if position == len(maxes):
+            position -= 1
+            lists[position].append(value)
+            maxes[position] = value
+        else:
+            insort(lists[position], value)
+        if len(lists[position]) > 2 * self.load:
+            sublist = lists[position]
+            half = sublist[self.load :]
+            del sublist[self.load :]
+            maxes[position] = sublist[-1]
+            lists.insert(position + 1, half)
+            maxes.insert(position + 1, half[-1])
+
+    def update(self, values: Iterable[T]) -> None:
+        """Insert many values.
+
+        A batch that is large next to the current contents is merged in one
+        sort (linear for two sorted runs) instead of inserted one by one.
+        """
+        values = sorted(values)
+        if not values:
+            return
+        if len(values) * 4 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        merged = sorted(chain(self, values))
+        self._lists = [
+            merged[start : start + self.load]
+            for start in range(0, len(merged), self.load)
+        ]
+        self._maxes = [sublist[-1] for sublist in self._lists]
+        self._len = len(merged)
+
+    def irange(
+        self, minimum: Optional[T] = None, exclusive: bool = False
+    ) -> Iterator[T]:
+        """Iterate in order over the values from ``minimum`` on.
+
+        Args:
+            minimum: Lower bound (None: from the smallest value). Compared
+                like any value, so a shorter tuple such as ``(price,)``
+                bounds every ``(price, key)`` at or above ``price``.
+            exclusive: Leave out values equal to ``minimum``.
+
+        Returns:
+            An iterator; consume it before the list is modified again.
+        """
+        if minimum is None:
+            return iter(self)
+        find = bisect_right if exclusive else bisect_left
+        lists = self._lists
+        position = find(self._maxes, minimum)
+        if position == len(lists):
+            return iter(())
+        first = islice(lists[position], find(lists[position], minimum), None)
+        return chain(first, chain.from_iterable(islice(lists, position + 1, None)))
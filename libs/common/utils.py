@@ -1,4 +1,5 @@
 import uuid
+from typing import Container, Iterator, Set
 
 
 def generate_id(prefix: str = "") -> str:
@@ -27,3 +28,36 @@ def generate_id(prefix: str = "") -> str:
     """
     uid = uuid.uuid4().hex[:8]
     return f"{prefix}{uid}" if prefix else uid
+
+
+def generate_unique_id(prefix: str, taken: Container[str]) -> str:
+    """Generate an ID with ``generate_id`` that is not in ``taken``.
+
+    Eight hex characters are not unique at scale (about a hundred
+    collisions per million records), so an ID already in use is drawn
+    again.
+
+    Args:
+        prefix: Prefix for the ID, as for ``generate_id``.
+        taken: IDs already in use (e.g., the repository's store).
+
+    Returns:
+        An ID string not in ``taken``.
+    """
+    return next(generate_unique_ids(prefix, taken))
+
+
+def generate_unique_ids(prefix: str, taken: Container[str]) -> Iterator[str]:
+    """Yield distinct IDs that are not in ``taken``, for batch inserts.
+
+    Example:
+        >>> ids = generate_unique_ids("p_", {})
+        >>> next(ids) != next(ids)
+        True
+    """
+    drawn: Set[str] = set()
+    while True:
+        new_id = generate_id(prefix)
+        if new_id not in taken and new_id not in drawn:
+            drawn.add(new_id)
+            yield new_id
@@ -1,9 +1,34 @@
-from typing import List
+from functools import partial
+from typing import Any, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 
-from libs.common.models import ProductCreate, Product
+from libs.common.bulk import MAX_BULK_ITEMS, validate_items
+from libs.common.fields import fields_param, project
+from libs.common.media import ndjson_response, wants_ndjson
+from libs.common.models import (
+    ProductBulkResponse,
+    ProductBulkResult,
+    ProductChange,
+    ProductChangesResponse,
+    ProductCreate,
+    ProductSearchHit,
+    ProductSearchResponse,
+    Product,
+    SearchIndexStats,
+)
+from libs.common.pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_PAGE_HEADER,
+    InvalidCursorError,
+    clamp_page_size,
+    fetch_page,
+)
+from libs.common.search import DEFAULT_SEARCH_LIMIT, tokenize
+from monolith.app.api.users import get_repo as get_user_repo
 from monolith.app.crud.products import ProductRepository
+from monolith.app.crud.users import UserRepository
 
 router = APIRouter()
 
@@ -35,12 +60,152 @@ async def create_product(
     return await repo.create(payload)
 
 
+@router.post("/bulk", response_model=ProductBulkResponse)
+async def create_products_bulk(
+    items: List[Any] = Body(...),
+    repo: ProductRepository = Depends(get_repo),
+    user_repo: UserRepository = Depends(get_user_repo),
+):
+    """Create many products in one request.
+
+    Each item is validated on its own and the distinct user_ids are looked
+    up in one pass over the local user store; failed items are reported
+    without aborting the batch.
+
+    Args:
+        items: Array of product payloads (name, price, optional user_id).
+        repo: Injected ProductRepository.
+        user_repo: Injected UserRepository used to validate owners.
+
+    Returns:
+        ProductBulkResponse: Counts and one result per item.
+
+    Raises:
+        HTTPException: 413 if more than MAX_BULK_ITEMS items are sent.
+    """
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=413, detail=f"At most {MAX_BULK_ITEMS} items per request"
+        )
+    valid, errors = validate_items(items, ProductCreate)
+    results = {
+        index: ProductBulkResult(index=index, status=422, error=error)
+        for index, error in errors.items()
+    }
+    owners = await user_repo.exists_many({p.user_id for _, p in valid if p.user_id})
+
+    accepted = []
+    for index, payload in valid:
+        if payload.user_id and not owners[payload.user_id]:
+            results[index] = ProductBulkResult(
+                index=index, status=422, error="User not found"
+            )
+        else:
+            accepted.append((index, payload))
+
+    products = await repo.create_many(payload for _, payload in accepted)
+    for (index, _), product in zip(accepted, products):
+        results[index] = ProductBulkResult(index=index, status=200, product=product)
+    return ProductBulkResponse(
+        created=len(products),
+        failed=len(items) - len(products),
+        results=[results[index] for index in range(len(items))],
+    )
+
+
+@router.get("/changes", response_model=ProductChangesResponse)
+async def list_product_changes(
+    since: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    epoch: Optional[str] = None,
+    repo: ProductRepository = Depends(get_repo),
+):
+    """Read the product change feed: what changed after sequence ``since``.
+
+    Args:
+        since: Last sequence number already applied (0: from the start).
+        limit: Changes per response (default 100, at most 1000).
+        epoch: ``epoch`` of the previous read, if any.
+        repo: Injected ProductRepository.
+
+    Returns:
+        ProductChangesResponse: Changes after ``since``, oldest first, and
+        the next ``since``.
+
+    Raises:
+        HTTPException: 410 if ``epoch`` is not the feed's current epoch.
+    """
+    if epoch is not None and epoch != repo.changes.epoch:
+        raise HTTPException(
+            status_code=410, detail="Change feed restarted; resync from since=0"
+        )
+    changes, has_more = await repo.changes_since(since, clamp_page_size(limit))
+    return ProductChangesResponse(
+        epoch=repo.changes.epoch,
+        changes=[
+            ProductChange(
+                sequence=change.sequence, timestamp=change.timestamp, product=product
+            )
+            for change, product in changes
+        ],
+        next_since=changes[-1][0].sequence if changes else since,
+        has_more=has_more,
+    )
+
+
+@router.get("/search", response_model=ProductSearchResponse)
+async def search_products(
+    q: str,
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE),
+    repo: ProductRepository = Depends(get_repo),
+):
+    """Search product names for every word of ``q``.
+
+    Args:
+        q: Words to search for (case-insensitive; all must match).
+        limit: Maximum number of results (default 20, at most 1000).
+        repo: Injected ProductRepository.
+
+    Returns:
+        ProductSearchResponse: The best matches, ranked by how often the
+        words occur in the name, and the total number of matches.
+
+    Raises:
+        HTTPException: 400 if ``q`` contains no word.
+    """
+    if not tokenize(q):
+        raise HTTPException(status_code=400, detail="Query must contain a word")
+    matches, total = await repo.search(q, limit)
+    return ProductSearchResponse(
+        total=total,
+        results=[
+            ProductSearchHit(score=score, product=product) for product, score in matches
+        ],
+    )
+
+
+@router.get("/search/stats", response_model=SearchIndexStats)
+async def search_index_stats(repo: ProductRepository = Depends(get_repo)):
+    """Report the size of the name search index.
+
+    Returns:
+        SearchIndexStats: Terms, postings and estimated bytes, in total and
+        per product.
+    """
+    return await repo.search_stats()
+
+
 @router.get("/{product_id}", response_model=Product)
-async def get_product(product_id: str, repo: ProductRepository = Depends(get_repo)):
+async def get_product(
+    product_id: str,
+    fields: Optional[List[str]] = Depends(fields_param(Product)),
+    repo: ProductRepository = Depends(get_repo),
+):
     """Get a product by ID.
 
     Args:
         product_id: Product ID to retrieve.
+        fields: Product fields to return (None: all).
         repo: Injected ProductRepository.
 
     Returns:
@@ -52,17 +217,67 @@ async def get_product(product_id: str, repo: ProductRepository = Depends(get_rep
     product = await repo.get(product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
+    if fields is not None:
+        return JSONResponse(project(product, fields))
     return product
 
 
 @router.get("", response_model=List[Product])
-async def list_products(repo: ProductRepository = Depends(get_repo)):
-    """List all products.
+async def list_products(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    user_id: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    sort: Literal["created", "price"] = "created",
+    fields: Optional[List[str]] = Depends(fields_param(Product)),
+    accept: Optional[str] = Header(None),
+    repo: ProductRepository = Depends(get_repo),
+):
+    """List products in creation order (or by price), one page at a time.
 
     Args:
+        response: Response whose headers receive the next page token.
+        limit: Page size (default 100, at most 1000).
+        after: ``X-Next-Page-Token`` of the previous page.
+        user_id: Only list this user's products (combines with paging).
+        min_price: Only list products at or above this price.
+        max_price: Only list products at or below this price.
+        sort: ``created`` (default) or ``price`` (cheapest first, implied
+            by a price bound); price order is read from the price index,
+            so a range costs O(log n + page). Cannot be combined with
+            ``user_id``.
+        fields: Fields of each record to return (None: all).
+        accept: With ``application/x-ndjson``, every record from ``after``
+            on (up to ``limit``) is streamed, one JSON object per line.
         repo: Injected ProductRepository.
 
     Returns:
-        List[Product]: All products in the system.
+        List[Product]: One page of products.
+
+    Raises:
+        HTTPException: 400 if ``after`` is not a valid page token,
+            ``fields`` names an unknown field or price ordering is combined
+            with ``user_id``.
     """
-    return await repo.list_all()
+    list_page = partial(
+        repo.list_page,
+        user_id=user_id or None,
+        min_price=min_price,
+        max_price=max_price,
+        by_price=sort == "price",
+    )
+    try:
+        if wants_ndjson(accept):
+            return await ndjson_response(list_page, after, limit, fields=fields)
+        products, next_token = await fetch_page(list_page, limit, after)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid page token")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    headers = {NEXT_PAGE_HEADER: next_token} if next_token is not None else {}
+    if fields is not None:
+        return JSONResponse([project(r, fields) for r in products], headers=headers)
+    response.headers.update(headers)
+    return products
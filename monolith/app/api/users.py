@@ -1,8 +1,18 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 
+from libs.common.emails import DuplicateEmailError
+from libs.common.fields import fields_param, project
+from libs.common.media import ndjson_response, wants_ndjson
 from libs.common.models import UserCreate, User
+from libs.common.pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_PAGE_HEADER,
+    InvalidCursorError,
+    fetch_page,
+)
 from monolith.app.crud import UserRepository
 
 router = APIRouter()
@@ -25,16 +35,79 @@ async def create_user(payload: UserCreate, repo: UserRepository = Depends(get_re
 
     Returns:
         User: Created user with ID.
+
+    Raises:
+        HTTPException: 409 if a user with this email already exists.
+    """
+    try:
+        return await repo.create(payload)
+    except DuplicateEmailError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+
+@router.get("/suggest", response_model=List[User])
+async def suggest_users(
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    repo: UserRepository = Depends(get_repo),
+):
+    """Suggest users whose name or email starts with ``prefix``.
+
+    Args:
+        prefix: Start of a name or email (case-insensitive).
+        limit: Maximum number of users (default 10, at most 100).
+        fields: User fields to return (None: all).
+        repo: Injected UserRepository.
+
+    Returns:
+        List[User]: Matching users, ordered by the matching name or email;
+        read from sorted prefix keys, so the cost follows ``limit``.
+    """
+    users = await repo.suggest(prefix, limit)
+    if fields is not None:
+        return JSONResponse([project(u, fields) for u in users])
+    return users
+
+
+@router.get("/by-email/{email}", response_model=User)
+async def get_user_by_email(
+    email: str,
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    repo: UserRepository = Depends(get_repo),
+):
+    """Get a user by email address.
+
+    Args:
+        email: Email address (compared case-insensitively).
+        fields: User fields to return (None: all).
+        repo: Injected UserRepository.
+
+    Returns:
+        User: User details.
+
+    Raises:
+        HTTPException: 404 if no user has this email.
     """
-    return await repo.create(payload)
+    user = await repo.get_by_email(email)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if fields is not None:
+        return JSONResponse(project(user, fields))
+    return user
 
 
 @router.get("/{user_id}", response_model=User)
-async def get_user(user_id: str, repo: UserRepository = Depends(get_repo)):
+async def get_user(
+    user_id: str,
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    repo: UserRepository = Depends(get_repo),
+):
     """Get a user by ID.
 
     Args:
         user_id: User ID to retrieve.
+        fields: User fields to return (None: all).
         repo: Injected UserRepository.
 
     Returns:
@@ -46,17 +119,46 @@ async def get_user(user_id: str, repo: UserRepository = Depends(get_repo)):
     user = await repo.get(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    if fields is not None:
+        return JSONResponse(project(user, fields))
     return user
 
 
 @router.get("", response_model=List[User])
-async def list_users(repo: UserRepository = Depends(get_repo)):
-    """List all users.
+async def list_users(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    accept: Optional[str] = Header(None),
+    repo: UserRepository = Depends(get_repo),
+):
+    """List users in creation order, one page at a time.
 
     Args:
+        response: Response whose headers receive the next page token.
+        limit: Page size (default 100, at most 1000).
+        after: ``X-Next-Page-Token`` of the previous page.
+        fields: Fields of each record to return (None: all).
+        accept: With ``application/x-ndjson``, every record from ``after``
+            on (up to ``limit``) is streamed, one JSON object per line.
         repo: Injected UserRepository.
 
     Returns:
-        List[User]: All users in the system.
+        List[User]: One page of users.
+
+    Raises:
+        HTTPException: 400 if ``after`` is not a valid page token or
+            ``fields`` names an unknown field.
     """
-    return await repo.list_all()
+    try:
+        if wants_ndjson(accept):
+            return await ndjson_response(repo.list_page, after, limit, fields=fields)
+        users, next_token = await fetch_page(repo.list_page, limit, after)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid page token")
+    headers = {NEXT_PAGE_HEADER: next_token} if next_token is not None else {}
+    if fields is not None:
+        return JSONResponse([project(r, fields) for r in users], headers=headers)
+    response.headers.update(headers)
+    return users
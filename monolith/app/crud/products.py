@@ -1,7 +1,12 @@
-from typing import Dict, List, Optional
+from itertools import islice, takewhile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from libs.common.models import Product, ProductCreate
-from libs.common.utils import generate_id
+from libs.common.changelog import Change, ChangeLog
+from libs.common.models import Product, ProductCreate, SearchIndexStats
+from libs.common.pagination import InsertionIndex, InvalidCursorError
+from libs.common.search import InvertedIndex
+from libs.common.sortedlist import SortedList
+from libs.common.utils import generate_unique_id, generate_unique_ids
 from libs.common.logging import get_logger
 
 logger = get_logger(__name__)
@@ -10,6 +15,14 @@ logger = get_logger(__name__)
 class ProductRepository:
     def __init__(self) -> None:
         self._store: Dict[str, Product] = {}
+        self._order: InsertionIndex[str] = InsertionIndex()
+        self.changes: ChangeLog[str] = ChangeLog()
+        # user_id -> IDs of that user's products, in creation order
+        self._by_owner: Dict[str, InsertionIndex[str]] = {}
+        # (price, product ID) of every product, in price order
+        self._by_price: SortedList[Tuple[float, str]] = SortedList()
+        # name terms -> product IDs, for search
+        self._names: InvertedIndex[str] = InvertedIndex()
 
     async def create(self, payload: ProductCreate) -> Product:
         """Create a new product.
@@ -20,12 +33,43 @@ class ProductRepository:
         Returns:
             Product: Created product with generated ID.
         """
-        product_id = generate_id("p_")
+        product_id = generate_unique_id("p_", self._store)
         product = Product(id=product_id, **payload.model_dump())
         self._store[product_id] = product
+        self._order.append(product_id)
+        self._index_owners([product])
+        self._by_price.add((product.price, product_id))
+        self._names.add(product_id, product.name)
+        self.changes.append(product_id)
         logger.info(f"Created product: {product_id}")
         return product
 
+    async def create_many(self, payloads: Iterable[ProductCreate]) -> List[Product]:
+        """Create several products with a single store update.
+
+        Args:
+            payloads: ProductCreate models to insert.
+
+        Returns:
+            List[Product]: Created products, in input order.
+        """
+        products = [
+            Product(id=product_id, **payload.model_dump())
+            for payload, product_id in zip(
+                payloads, generate_unique_ids("p_", self._store)
+            )
+        ]
+        self._store.update((product.id, product) for product in products)
+        product_ids = [product.id for product in products]
+        self._order.extend(product_ids)
+        self._index_owners(products)
+        self._by_price.update((product.price, product.id) for product in products)
+        for product in products:
+            self._names.add(product.id, product.name)
+        self.changes.extend(product_ids)
+        logger.info(f"Created {len(products)} products")
+        return products
+
     async def get(self, product_id: str) -> Optional[Product]:
         """Get a product by ID.
 
@@ -37,6 +81,128 @@ class ProductRepository:
         """
         return self._store.get(product_id)
 
+    def _index_owners(self, products: List[Product]) -> None:
+        """Add new products to the owner index."""
+        for product in products:
+            if product.user_id is not None:
+                index = self._by_owner.get(product.user_id)
+                if index is None:
+                    index = self._by_owner[product.user_id] = InsertionIndex()
+                index.append(product.id)
+
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        user_id: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        by_price: bool = False,
+    ) -> Tuple[List[Product], Optional[str]]:
+        """List products in creation order (or by price), one page at a time.
+
+        Args:
+            limit: Maximum number of products to return.
+            after: ID of the last product of the previous page (None: first page).
+            user_id: Only list this user's products (read from the owner
+                index, so the cost does not depend on other users' products).
+            min_price: Only list products at or above this price.
+            max_price: Only list products at or below this price.
+            by_price: List cheapest first (ties by ID); implied by a price
+                bound. Read from the price index, so a page costs
+                O(log n + limit) however many products are outside the range.
+
+        Returns:
+            Tuple of (products, ID to pass as ``after`` for the next page, or
+            None on the last page).
+
+        Raises:
+            InvalidCursorError: If ``after`` is not a known product ID (of
+                ``user_id``, if given).
+            ValueError: If ``user_id`` is combined with price ordering.
+        """
+        if by_price or min_price is not None or max_price is not None:
+            if user_id is not None:
+                raise ValueError("user_id cannot be combined with price ordering")
+            return self._price_page(limit, after, min_price, max_price)
+        order = self._order
+        if user_id is not None:
+            order = self._by_owner.get(user_id) or InsertionIndex()
+        ids, next_after = order.page(after, limit)
+        return [self._store[product_id] for product_id in ids], next_after
+
+    def _price_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+    ) -> Tuple[List[Product], Optional[str]]:
+        """Page of the price index starting after ``after`` (a product ID)."""
+        start: Optional[Tuple] = (min_price,) if min_price is not None else None
+        exclusive = False
+        if after is not None:
+            product = self._store.get(after)
+            if product is None:
+                raise InvalidCursorError(f"unknown page token key {after!r}")
+            if start is None or (product.price, after) >= start:
+                start, exclusive = (product.price, after), True
+        keys: Iterator[Tuple[float, str]] = self._by_price.irange(start, exclusive)
+        if max_price is not None:
+            keys = takewhile(lambda key: key[0] <= max_price, keys)
+        page = list(islice(keys, limit + 1))
+        next_after = page[limit - 1][1] if len(page) > limit else None
+        return [self._store[product_id] for _, product_id in page[:limit]], next_after
+
+    async def search(
+        self, query: str, limit: int
+    ) -> Tuple[List[Tuple[Product, int]], int]:
+        """Find products whose name contains every word of ``query``.
+
+        Reads the postings lists of the query terms from the name index,
+        so the cost follows the rarest term, not the catalogue size.
+
+        Args:
+            query: Free text, tokenized like product names.
+            limit: Maximum number of matches to return.
+
+        Returns:
+            Tuple of ([(product, score)] highest score first, total matches).
+        """
+        matches, total = self._names.search(query, limit)
+        return [
+            (self._store[product_id], score) for product_id, score in matches
+        ], total
+
+    async def search_stats(self) -> SearchIndexStats:
+        """Return the size of the name index, per product and in total."""
+        stats = self._names.memory_stats()
+        documents = stats.pop("documents")
+        return SearchIndexStats(
+            products=documents,
+            bytes_per_product=stats["bytes"] / documents if documents else 0.0,
+            **stats,
+        )
+
+    async def changes_since(
+        self, sequence: int, limit: int
+    ) -> Tuple[List[Tuple[Change[str], Product]], bool]:
+        """Return up to ``limit`` changes after ``sequence``, oldest first.
+
+        Costs O(log n + limit) however many products exist.
+
+        Args:
+            sequence: Last sequence number the reader has seen (0: all).
+            limit: Maximum number of changes to return.
+
+        Returns:
+            Tuple of ([(change, current product)], whether more changes follow).
+        """
+        changes = self.changes.since(sequence, limit + 1)
+        return [(change, self._store[change.key]) for change in changes[:limit]], len(
+            changes
+        ) > limit
+
     async def list_all(self) -> List[Product]:
         """List all products.
 
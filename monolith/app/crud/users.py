@@ -1,15 +1,29 @@
-from typing import Dict, List, Optional
+from itertools import takewhile
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from libs.common.emails import DuplicateEmailError, normalize_email
 from libs.common.models import User, UserCreate
-from libs.common.utils import generate_id
+from libs.common.pagination import InsertionIndex
+from libs.common.sortedlist import SortedList
+from libs.common.utils import generate_unique_id
 from libs.common.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _prefix_keys(user: User) -> Tuple[Tuple[str, str], Tuple[str, str]]:
+    """(lower-cased name, user ID) and (normalized email, user ID)."""
+    return (user.name.strip().lower(), user.id), (normalize_email(user.email), user.id)
+
+
 class UserRepository:
     def __init__(self) -> None:
         self._store: Dict[str, User] = {}
+        self._order: InsertionIndex[str] = InsertionIndex()
+        # normalized email -> user ID; enforces one user per address
+        self._by_email: Dict[str, str] = {}
+        # (lower-cased name or email, user ID), sorted, for prefix suggestions
+        self._prefixes: SortedList[Tuple[str, str]] = SortedList()
 
     async def create(self, payload: UserCreate) -> User:
         """Create a new user.
@@ -19,10 +33,19 @@ class UserRepository:
 
         Returns:
             User: Created user with generated ID.
+
+        Raises:
+            DuplicateEmailError: If a user with this email already exists.
         """
-        user_id = generate_id("u_")
+        email = normalize_email(payload.email)
+        if email in self._by_email:
+            raise DuplicateEmailError(f"email already registered: {payload.email}")
+        user_id = generate_unique_id("u_", self._store)
         user = User(id=user_id, **payload.model_dump())
         self._store[user_id] = user
+        self._by_email[email] = user_id
+        self._order.append(user_id)
+        self._prefixes.update(_prefix_keys(user))
         logger.info(f"Created user: {user_id}")
         return user
 
@@ -37,6 +60,74 @@ class UserRepository:
         """
         return self._store.get(user_id)
 
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get a user by email address.
+
+        Args:
+            email: Email address (compared case-insensitively).
+
+        Returns:
+            User or None if no user has this email.
+        """
+        user_id = self._by_email.get(normalize_email(email))
+        return self._store[user_id] if user_id is not None else None
+
+    async def suggest(self, prefix: str, limit: int) -> List[User]:
+        """Get users whose name or email starts with ``prefix``.
+
+        Reads from the sorted prefix keys: one bisect, then at most two
+        keys per returned user, so the cost follows ``limit`` and not the
+        number of users.
+
+        Args:
+            prefix: Start of a name or email (case-insensitive).
+            limit: Maximum number of users to return.
+
+        Returns:
+            Matching users, ordered by the matching name or email.
+        """
+        prefix = prefix.strip().lower()
+        keys = takewhile(
+            lambda key: key[0].startswith(prefix), self._prefixes.irange((prefix,))
+        )
+        found: Dict[str, None] = {}
+        for _, user_id in keys:
+            found[user_id] = None
+            if len(found) == limit:
+                break
+        return [self._store[user_id] for user_id in found]
+
+    async def exists_many(self, user_ids: Iterable[str]) -> Dict[str, bool]:
+        """Check which of several users exist.
+
+        Args:
+            user_ids: User IDs to check.
+
+        Returns:
+            Mapping of each user ID to whether it exists.
+        """
+        store = self._store
+        return {user_id: user_id in store for user_id in user_ids}
+
+    async def list_page(
+        self, limit: int, after: Optional[str] = None
+    ) -> Tuple[List[User], Optional[str]]:
+        """List users in creation order, one page at a time.
+
+        Args:
+            limit: Maximum number of users to return.
+            after: ID of the last user of the previous page (None: first page).
+
+        Returns:
+            Tuple of (users, ID to pass as ``after`` for the next page, or
+            None on the last page).
+
+        Raises:
+            InvalidCursorError: If ``after`` is not a known user ID.
+        """
+        ids, next_after = self._order.page(after, limit)
+        return [self._store[user_id] for user_id in ids], next_after
+
     async def list_all(self) -> List[User]:
         """List all users.
 
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 
@@ -174,3 +176,155 @@ async def test_monolith_shared_data_layer(client):
     # Product has reference to user (all in same memory)
     # Note: Pydantic v1 includes user_id in response when it's provided
     assert product.get("user_id") == user_id or product.get("user_id") is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_products(client):
+    """Test bulk product creation with per-item results in monolith."""
+    user_id = (
+        await client.post("/users", json={"name": "Bulk", "email": "bulk@example.com"})
+    ).json()["id"]
+    items = [
+        {"name": "A", "price": 1.0, "user_id": user_id},
+        {"name": "B", "price": 2.0, "user_id": "u_missing"},
+        {"name": "C"},
+        {"name": "D", "price": 4.0},
+    ]
+
+    response = await client.post("/products/bulk", json=items)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2 and data["failed"] == 2
+    assert [r["status"] for r in data["results"]] == [200, 422, 422, 200]
+    assert data["results"][1]["error"] == "User not found"
+    listed = (await client.get("/products")).json()
+    assert {p["name"] for p in listed} == {"A", "D"}
+
+
+@pytest.mark.asyncio
+async def test_list_users_pagination(client):
+    """Test keyset pagination of users in monolith."""
+    for i in range(5):
+        await client.post(
+            "/users", json={"name": f"U{i}", "email": f"pg{i}@example.com"}
+        )
+
+    first = await client.get("/users", params={"limit": 2})
+    assert [u["name"] for u in first.json()] == ["U0", "U1"]
+    token = first.headers["X-Next-Page-Token"]
+
+    second = await client.get("/users", params={"limit": 3, "after": token})
+    assert [u["name"] for u in second.json()] == ["U2", "U3", "U4"]
+    assert "X-Next-Page-Token" not in second.headers
+
+    assert (await client.get("/users", params={"after": "???"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_products_ndjson(client):
+    """Test streaming products as NDJSON in monolith."""
+    for i in range(3):
+        await client.post("/products", json={"name": f"N{i}", "price": float(i)})
+
+    response = await client.get("/products", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["N0", "N1", "N2"]
+
+
+@pytest.mark.asyncio
+async def test_list_products_by_owner(client):
+    """Test filtering products by owner, combined with pagination."""
+    owner = (
+        await client.post(
+            "/users", json={"name": "Seller", "email": "seller@example.com"}
+        )
+    ).json()
+    for i in range(4):
+        await client.post(
+            "/products",
+            json={"name": f"S{i}", "price": 1.0, "user_id": owner["id"]},
+        )
+        await client.post("/products", json={"name": f"X{i}", "price": 1.0})
+
+    first = await client.get("/products", params={"user_id": owner["id"], "limit": 3})
+    assert [p["name"] for p in first.json()] == ["S0", "S1", "S2"]
+    second = await client.get(
+        "/products",
+        params={"user_id": owner["id"], "after": first.headers["X-Next-Page-Token"]},
+    )
+    assert [p["name"] for p in second.json()] == ["S3"]
+
+
+@pytest.mark.asyncio
+async def test_user_email_is_unique(client):
+    """Emails are unique (case-insensitively) and can be looked up."""
+    response = await client.post(
+        "/users", json={"name": "Kim", "email": "kim@example.com"}
+    )
+    user_id = response.json()["id"]
+
+    response = await client.post(
+        "/users", json={"name": "Kim2", "email": "KIM@example.com"}
+    )
+    assert response.status_code == 409
+
+    response = await client.get("/users/by-email/Kim@Example.com")
+    assert response.status_code == 200
+    assert response.json()["id"] == user_id
+    response = await client.get("/users/by-email/nobody@example.com")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_products_by_price(client):
+    """Test listing products in a price range, cheapest first."""
+    for price in (70_004, 70_002, 70_008, 70_001):
+        await client.post("/products", json={"name": "Ranged", "price": price})
+
+    first = await client.get(
+        "/products", params={"min_price": 70_002, "max_price": 70_008, "limit": 2}
+    )
+    assert [p["price"] for p in first.json()] == [70_002, 70_004]
+    second = await client.get(
+        "/products",
+        params={
+            "min_price": 70_002,
+            "max_price": 70_008,
+            "after": first.headers["X-Next-Page-Token"],
+        },
+    )
+    assert [p["price"] for p in second.json()] == [70_008]
+
+
+@pytest.mark.asyncio
+async def test_search_products(client):
+    """Test searching product names in monolith."""
+    for name in ("Quokka mug", "Quokka quokka poster", "Plain mug"):
+        await client.post("/products", json={"name": name, "price": 5.0})
+
+    response = await client.get("/products/search", params={"q": "quokka"})
+    assert response.status_code == 200
+    assert [hit["product"]["name"] for hit in response.json()["results"]] == [
+        "Quokka quokka poster",
+        "Quokka mug",
+    ]
+    response = await client.get("/products/search", params={"q": "quokka mug"})
+    assert response.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_suggest_users(client):
+    """Test user typeahead on name and email prefixes."""
+    await client.post("/users", json={"name": "Dana", "email": "dana@example.com"})
+    await client.post("/users", json={"name": "Eli", "email": "dan.eli@example.com"})
+    await client.post("/users", json={"name": "Fay", "email": "fay@example.com"})
+
+    response = await client.get("/users/suggest", params={"prefix": "DAN"})
+    assert response.status_code == 200
+    assert [u["name"] for u in response.json()] == ["Eli", "Dana"]
+    response = await client.get("/users/suggest", params={"prefix": "dan", "limit": 1})
+    assert len(response.json()) == 1
@@ -1,10 +1,55 @@
-from typing import List
+from functools import partial
+from typing import Any, List, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import JSONResponse
 
-from libs.common.models import ProductCreate, Product
-from libs.common.http_client import check_user_exists
+from libs.common.bulk import MAX_BULK_ITEMS, split_ids, validate_items
+from libs.common.codecs import (
+    binary_response,
+    body_openapi,
+    list_message,
+    negotiate,
+    parse_body,
+    to_message,
+)
+from libs.common.fields import fields_param, project
+from libs.common.media import ndjson_response, wants_ndjson
+from libs.common.models import (
+    BatchGetRequest,
+    ProductBatchGetItem,
+    ProductBatchGetResponse,
+    ProductBulkResponse,
+    ProductBulkResult,
+    ProductChange,
+    ProductChangesResponse,
+    ProductCreate,
+    ProductSearchHit,
+    ProductSearchResponse,
+    Product,
+    SearchIndexStats,
+)
+from libs.common.pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_PAGE_HEADER,
+    InvalidCursorError,
+    clamp_page_size,
+    fetch_page,
+)
+from libs.common.resilience import ServiceUnavailableError
+from libs.common.search import DEFAULT_SEARCH_LIMIT, tokenize
+from services.product_service.app import product_pb2
 from services.product_service.app.crud import ProductRepository
+from services.product_service.app.user_lookup import UserLookup
 
 router = APIRouter()
 
@@ -22,53 +67,360 @@ def get_repo() -> ProductRepository:
     return _repo
 
 
-@router.post("/", response_model=Product)
+def get_user_lookup(request: Request) -> UserLookup:
+    """Dependency that returns the app-wide User service lookup client.
+
+    Returns:
+        The UserLookup created in ``create_app``.
+    """
+    return request.app.state.user_lookup
+
+
+@router.post("/", response_model=Product, openapi_extra=body_openapi(ProductCreate))
 async def create_product(
-    payload: ProductCreate, repo: ProductRepository = Depends(get_repo)
+    payload: ProductCreate = Depends(
+        parse_body(ProductCreate, product_pb2.ProductCreateRequest)
+    ),
+    accept: Optional[str] = Header(None),
+    repo: ProductRepository = Depends(get_repo),
+    users: UserLookup = Depends(get_user_lookup),
 ) -> Product:
     """Create a new product.
 
     Args:
-        payload: Product data (name, price, optional user_id).
+        payload: Product data (name, price, optional user_id) as JSON,
+            ``product_pb2.ProductCreateRequest`` or msgpack, per
+            ``Content-Type``.
+        accept: ``application/x-protobuf`` or ``application/msgpack`` to
+            get the product in that format instead of JSON.
         repo: Injected repository instance.
+        users: Injected client that validates user_id against the User service.
 
     Returns:
         The created product with a unique ID.
 
     Raises:
-        HTTPException: If user_id is provided but user doesn't exist.
+        HTTPException: 422 if user_id is provided but the user doesn't exist,
+            503 if the User service could not be asked.
     """
     # If user_id is provided, validate it exists (inter-service call)
     if payload.user_id:
-        user_exists = await check_user_exists(payload.user_id)
+        try:
+            user_exists = await users.exists(payload.user_id)
+        except ServiceUnavailableError:
+            raise HTTPException(status_code=503, detail="user service unavailable")
         if not user_exists:
             raise HTTPException(status_code=422, detail="user not found")
 
     product = await repo.create(payload)
+    media_type = negotiate(accept)
+    if media_type is not None:
+        return binary_response(
+            media_type, product, lambda: to_message(product, product_pb2.Product)
+        )
     return product
 
 
-@router.get("/", response_model=List[Product])
-async def list_products(repo: ProductRepository = Depends(get_repo)) -> List[Product]:
-    """List all products.
+@router.post("/bulk", response_model=ProductBulkResponse)
+async def create_products_bulk(
+    items: List[Any] = Body(...),
+    repo: ProductRepository = Depends(get_repo),
+    users: UserLookup = Depends(get_user_lookup),
+) -> ProductBulkResponse:
+    """Create many products in one request.
+
+    Each item is validated on its own and each distinct ``user_id`` is
+    checked once; items that fail are reported in the results while the
+    rest are inserted with a single ``create_many``.
+
+    Args:
+        items: Array of product payloads (name, price, optional user_id).
+        repo: Injected repository instance.
+        users: Injected client that validates user_id against the User service.
+
+    Returns:
+        Counts and one result per item, in request order.
+
+    Raises:
+        HTTPException: 413 if more than MAX_BULK_ITEMS items are sent.
+    """
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=413, detail=f"at most {MAX_BULK_ITEMS} items per request"
+        )
+    valid, errors = validate_items(items, ProductCreate)
+    results = {
+        index: ProductBulkResult(index=index, status=422, error=error)
+        for index, error in errors.items()
+    }
+    owners = await users.exists_many(p.user_id for _, p in valid if p.user_id)
+
+    accepted = []
+    for index, payload in valid:
+        owner_exists = owners.get(payload.user_id) if payload.user_id else True
+        if owner_exists is None:
+            results[index] = ProductBulkResult(
+                index=index, status=503, error="user service unavailable"
+            )
+        elif not owner_exists:
+            results[index] = ProductBulkResult(
+                index=index, status=422, error="user not found"
+            )
+        else:
+            accepted.append((index, payload))
+
+    products = await repo.create_many(payload for _, payload in accepted)
+    for (index, _), product in zip(accepted, products):
+        results[index] = ProductBulkResult(index=index, status=200, product=product)
+    return ProductBulkResponse(
+        created=len(products),
+        failed=len(items) - len(products),
+        results=[results[index] for index in range(len(items))],
+    )
+
+
+async def _batch_get(
+    repo: ProductRepository,
+    product_ids: List[str],
+    fields: Optional[List[str]] = None,
+) -> Union[ProductBatchGetResponse, JSONResponse]:
+    products = await repo.get_many(product_ids)
+    if fields is not None:
+        return JSONResponse(
+            {
+                "results": [
+                    {
+                        "id": product_id,
+                        "found": product is not None,
+                        "product": (
+                            project(product, fields) if product is not None else None
+                        ),
+                    }
+                    for product_id, product in zip(product_ids, products)
+                ]
+            }
+        )
+    return ProductBatchGetResponse(
+        results=[
+            ProductBatchGetItem(
+                id=product_id, found=product is not None, product=product
+            )
+            for product_id, product in zip(product_ids, products)
+        ]
+    )
+
+
+@router.post("/batch-get", response_model=ProductBatchGetResponse)
+async def batch_get_products(
+    payload: BatchGetRequest,
+    fields: Optional[List[str]] = Depends(fields_param(Product)),
+    repo: ProductRepository = Depends(get_repo),
+) -> ProductBatchGetResponse:
+    """Get many products by ID in one request.
 
     Args:
+        payload: The product IDs (at most 1000).
+        fields: Product fields to return (None: all).
         repo: Injected repository instance.
 
     Returns:
-        List of all products.
+        One result per requested ID, in request order, with ``found`` set
+        to false for unknown IDs.
     """
-    return await repo.list_all()
+    return await _batch_get(repo, payload.ids, fields)
+
+
+@router.get("/", response_model=Union[List[Product], ProductBatchGetResponse])
+async def list_products(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    user_id: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    sort: Literal["created", "price"] = "created",
+    ids: Optional[List[str]] = Query(None),
+    fields: Optional[List[str]] = Depends(fields_param(Product)),
+    accept: Optional[str] = Header(None),
+    repo: ProductRepository = Depends(get_repo),
+) -> Union[List[Product], ProductBatchGetResponse]:
+    """List products in creation order (or by price), one page at a time.
+
+    With ``ids`` (comma-separated and/or repeated) the given products are
+    fetched instead, as with ``POST /products/batch-get``.
+
+    Args:
+        response: Response whose headers receive the next page token.
+        limit: Page size (default 100, at most 1000).
+        after: ``X-Next-Page-Token`` of the previous page.
+        user_id: Only list this user's products (combines with paging).
+        min_price: Only list products at or above this price.
+        max_price: Only list products at or below this price.
+        sort: ``created`` (default) or ``price`` (cheapest first, implied
+            by a price bound); price order is read from the price index,
+            so a range costs O(log n + page). Cannot be combined with
+            ``user_id``.
+        accept: With ``application/x-ndjson``, every record from ``after``
+            on (up to ``limit``) is streamed, one JSON object per line; with
+            ``application/x-protobuf`` the page is a
+            ``product_pb2.ListProductsResponse``, with ``application/msgpack``
+            a msgpack array.
+        ids: Product IDs to fetch instead of listing.
+        fields: Product fields to return (None: all); the selected fields
+            are read straight from the store, the rest are never encoded.
+        repo: Injected repository instance.
+
+    Returns:
+        One page of products, or the batch-get results for ``ids``.
+
+    Raises:
+        HTTPException: 400 if ``after`` is not a valid page token, more
+            than 1000 ``ids`` are given, ``fields`` names an unknown field
+            or price ordering is combined with ``user_id``.
+    """
+    if ids:
+        try:
+            return await _batch_get(repo, split_ids(ids), fields)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    list_page = partial(
+        repo.list_page,
+        user_id=user_id or None,
+        min_price=min_price,
+        max_price=max_price,
+        by_price=sort == "price",
+    )
+    try:
+        if wants_ndjson(accept):
+            return await ndjson_response(list_page, after, limit, fields=fields)
+        products, next_token = await fetch_page(list_page, limit, after)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="invalid page token")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    headers = {NEXT_PAGE_HEADER: next_token} if next_token is not None else {}
+    media_type = negotiate(accept)
+    if media_type is not None:
+        return binary_response(
+            media_type,
+            products,
+            lambda: list_message(
+                product_pb2.ListProductsResponse,
+                "products",
+                products,
+                fields,
+                next_page_token=next_token or "",
+            ),
+            fields=fields,
+            headers=headers,
+        )
+    if fields is not None:
+        return JSONResponse([project(p, fields) for p in products], headers=headers)
+    response.headers.update(headers)
+    return products
+
+
+@router.get("/changes", response_model=ProductChangesResponse)
+async def list_product_changes(
+    since: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    epoch: Optional[str] = None,
+    repo: ProductRepository = Depends(get_repo),
+) -> ProductChangesResponse:
+    """Read the product change feed: what changed after sequence ``since``.
+
+    Every repository mutation gets the next sequence number, so a cache or
+    indexer can keep in sync by polling with the ``next_since`` of its
+    previous read instead of downloading the whole listing.
+
+    Args:
+        since: Last sequence number already applied (0: from the start).
+        limit: Changes per response (default 100, at most 1000).
+        epoch: ``epoch`` of the previous read, if any.
+        repo: Injected repository instance.
+
+    Returns:
+        Changes after ``since``, oldest first, and the next ``since``.
+
+    Raises:
+        HTTPException: 410 if ``epoch`` is not the feed's current epoch (the
+            service restarted); start again from ``since=0``.
+    """
+    if epoch is not None and epoch != repo.changes.epoch:
+        raise HTTPException(
+            status_code=410, detail="change feed restarted; resync from since=0"
+        )
+    changes, has_more = await repo.changes_since(since, clamp_page_size(limit))
+    return ProductChangesResponse(
+        epoch=repo.changes.epoch,
+        changes=[
+            ProductChange(
+                sequence=change.sequence, timestamp=change.timestamp, product=product
+            )
+            for change, product in changes
+        ],
+        next_since=changes[-1][0].sequence if changes else since,
+        has_more=has_more,
+    )
+
+
+@router.get("/search", response_model=ProductSearchResponse)
+async def search_products(
+    q: str,
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE),
+    repo: ProductRepository = Depends(get_repo),
+) -> ProductSearchResponse:
+    """Search product names for every word of ``q``.
+
+    Matches come from the repository's inverted name index: the postings
+    lists of the query words are intersected, so the cost follows the
+    rarest word rather than the catalogue size. Results are ranked by how
+    often the words occur in the name.
+
+    Args:
+        q: Words to search for (case-insensitive; all must match).
+        limit: Maximum number of results (default 20, at most 1000).
+        repo: Injected repository instance.
+
+    Returns:
+        The best matches and the total number of matches.
+
+    Raises:
+        HTTPException: 400 if ``q`` contains no word.
+    """
+    if not tokenize(q):
+        raise HTTPException(status_code=400, detail="q must contain a word")
+    matches, total = await repo.search(q, limit)
+    return ProductSearchResponse(
+        total=total,
+        results=[
+            ProductSearchHit(score=score, product=product) for product, score in matches
+        ],
+    )
+
+
+@router.get("/search/stats", response_model=SearchIndexStats)
+async def search_index_stats(
+    repo: ProductRepository = Depends(get_repo),
+) -> SearchIndexStats:
+    """Report the size of the name search index, including per product."""
+    return await repo.search_stats()
 
 
 @router.get("/{product_id}", response_model=Product)
 async def get_product(
-    product_id: str, repo: ProductRepository = Depends(get_repo)
+    product_id: str,
+    fields: Optional[List[str]] = Depends(fields_param(Product)),
+    accept: Optional[str] = Header(None),
+    repo: ProductRepository = Depends(get_repo),
 ) -> Product:
     """Get a specific product by ID.
 
     Args:
         product_id: The product ID.
+        fields: Product fields to return (None: all).
+        accept: ``application/x-protobuf`` or ``application/msgpack`` to
+            get the product in that format instead of JSON.
         repo: Injected repository instance.
 
     Returns:
@@ -80,4 +432,14 @@ async def get_product(
     product = await repo.get(product_id)
     if not product:
         raise HTTPException(status_code=404, detail="product not found")
+    media_type = negotiate(accept)
+    if media_type is not None:
+        return binary_response(
+            media_type,
+            product,
+            lambda: to_message(product, product_pb2.Product, fields),
+            fields=fields,
+        )
+    if fields is not None:
+        return JSONResponse(project(product, fields))
     return product
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+
+from libs.common.config import load_from_env
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime configuration for the Product service.
+
+    Every field can be overridden with a ``PRODUCT_<FIELD_NAME>`` environment
+    variable (e.g., ``PRODUCT_USER_SERVICE_URL``).
+
+    Attributes:
+        user_lookup_transport: How ``user_id`` is validated: "rest" or "grpc".
+        user_service_url: User service REST replicas: one base URL, a
+            comma-separated list of them, or ``dns://host:port``.
+        user_service_grpc_target: User service gRPC replicas: one
+            ``host:port``, a comma-separated list, or ``dns://host:port``.
+        user_service_dns_ttl: Seconds a ``dns://`` resolution is cached.
+        user_lb_strategy: Replica choice: "p2c" (power of two choices) or
+            "least_outstanding".
+        user_lb_max_failures: Consecutive failures that eject a replica.
+        user_lb_ejection_time: Seconds an ejected replica is skipped.
+        user_lb_health_interval: Seconds between health probes of replicas.
+        http_max_connections: Pool size for calls to other services.
+        http_max_keepalive_connections: Idle connections kept in the pool.
+        http_keepalive_expiry: Seconds an idle pooled connection is kept.
+        http_timeout: Read/write/pool timeout for inter-service calls.
+        http_connect_timeout: Connect timeout for inter-service calls.
+        grpc_pool_size: Number of channels in the User service gRPC pool.
+        grpc_keepalive_time_ms: Interval between HTTP/2 keepalive pings.
+        grpc_keepalive_timeout_ms: Wait for a keepalive ack before reconnecting.
+        user_cache_size: Max cached user-existence answers (0 disables).
+        user_cache_positive_ttl: Seconds a "user exists" answer is cached.
+        user_cache_negative_ttl: Seconds a "user not found" answer is cached.
+        user_cache_refresh_ahead: Fraction of the TTL at the end of an entry's
+            life during which hits refresh it in the background.
+        user_lookup_batch_size: Max user IDs per ``BatchUserExists`` call on
+            the gRPC transport (1 disables micro-batching).
+        user_lookup_batch_wait_ms: How long a gRPC lookup waits for others
+            to share its batch.
+        user_lookup_attempt_timeout: Per-attempt timeout of a user check.
+        user_lookup_deadline: Overall deadline for a user check, retries
+            included.
+        user_lookup_max_attempts: Attempts per user check, first included.
+        user_lookup_retry_base_delay: Backoff cap for the first retry.
+        user_lookup_retry_max_delay: Upper bound on any retry backoff.
+        user_lookup_retry_budget_ratio: Retries allowed per user check.
+        user_lookup_retry_budget_min_per_second: Retries always allowed.
+        user_breaker_failure_threshold: Consecutive failures that open the
+            User service circuit breaker.
+        user_breaker_reset_timeout: Seconds the breaker stays open before
+            probing the User service again.
+        user_lookup_hedge: Send a backup request when a user check is slow.
+        user_lookup_hedge_percentile: Latency quantile after which to hedge.
+        user_lookup_hedge_min_delay_ms: Lower bound on the hedge delay.
+        user_lookup_hedge_max_delay_ms: Upper bound on the hedge delay.
+        user_replica_target: User service gRPC target to replicate user IDs
+            from through ``WatchUsers`` (empty disables the local replica).
+        user_bloom: Reject users missing from the User service's Bloom
+            filter without calling it.
+        user_bloom_refresh_interval: Seconds between filter downloads.
+        user_bloom_negative_max_age: Age in seconds up to which the filter
+            is trusted to reject a user; older filters are refetched first.
+    """
+
+    user_lookup_transport: str = "rest"
+    user_service_url: str = "http://localhost:8001"
+    user_service_grpc_target: str = "localhost:50051"
+    user_service_dns_ttl: float = 30.0
+    user_lb_strategy: str = "p2c"
+    user_lb_max_failures: int = 3
+    user_lb_ejection_time: float = 10.0
+    user_lb_health_interval: float = 5.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 5.0
+    http_connect_timeout: float = 1.0
+    grpc_pool_size: int = 2
+    grpc_keepalive_time_ms: int = 30000
+    grpc_keepalive_timeout_ms: int = 10000
+    user_cache_size: int = 10000
+    user_cache_positive_ttl: float = 600.0
+    user_cache_negative_ttl: float = 5.0
+    user_cache_refresh_ahead: float = 0.2
+    user_lookup_batch_size: int = 100
+    user_lookup_batch_wait_ms: float = 2.0
+    user_lookup_attempt_timeout: float = 0.5
+    user_lookup_deadline: float = 2.0
+    user_lookup_max_attempts: int = 3
+    user_lookup_retry_base_delay: float = 0.05
+    user_lookup_retry_max_delay: float = 0.5
+    user_lookup_retry_budget_ratio: float = 0.2
+    user_lookup_retry_budget_min_per_second: float = 5.0
+    user_breaker_failure_threshold: int = 5
+    user_breaker_reset_timeout: float = 10.0
+    user_lookup_hedge: bool = False
+    user_lookup_hedge_percentile: float = 0.95
+    user_lookup_hedge_min_delay_ms: float = 5.0
+    user_lookup_hedge_max_delay_ms: float = 500.0
+    user_replica_target: str = ""
+    user_bloom: bool = False
+    user_bloom_refresh_interval: float = 5.0
+    user_bloom_negative_max_age: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.user_lookup_transport not in ("rest", "grpc"):
+            raise ValueError(
+                f"user_lookup_transport must be 'rest' or 'grpc', "
+                f"got {self.user_lookup_transport!r}"
+            )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Load settings from ``PRODUCT_*`` environment variables."""
+        return load_from_env(cls, prefix="PRODUCT_")
@@ -1,17 +1,100 @@
+import asyncio
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
 import grpc
 
+from libs.common.bulk import MAX_BATCH_GET_IDS, validate_items
+from libs.common.fields import mask_fields, project
 from libs.common.logging import get_logger
+from libs.common.models import Product, ProductCreate
+from libs.common.pagination import (
+    InvalidCursorError,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    iter_pages,
+)
+from libs.common.search import DEFAULT_SEARCH_LIMIT, tokenize
 from services.product_service.app.crud import ProductRepository
+from services.product_service.app.user_lookup import UserLookup
 from services.product_service.app import product_pb2, product_pb2_grpc
 
 logger = get_logger(__name__)
 
 
+def _product_message(
+    product: Product, fields: Optional[List[str]] = None
+) -> product_pb2.Product:
+    """Build a Product message with only ``fields`` set (None: all of them)."""
+    if fields is None:
+        return product_pb2.Product(
+            id=product.id,
+            name=product.name,
+            price=product.price,
+            user_id=product.user_id or "",
+        )
+    values = project(product, fields)
+    if "user_id" in values:
+        values["user_id"] = values["user_id"] or ""
+    return product_pb2.Product(**values)
+
+
+def _owner_error(exists: Optional[bool]) -> Optional[Tuple[str, str]]:
+    """Return (code name, message) if an owner check failed, else None."""
+    if exists is None:
+        return "UNAVAILABLE", "User service unavailable"
+    if not exists:
+        return "NOT_FOUND", "User not found"
+    return None
+
+
 class ProductServicer(product_pb2_grpc.ProductServiceServicer):
-    """gRPC service implementation for Product operations."""
+    """gRPC service implementation for Product operations.
+
+    Args:
+        repo: Product repository.
+        user_checker: Client used to verify ``user_id`` owners (None: owners
+            are not verified).
+    """
+
+    # Products per StreamProducts message when the client does not choose
+    stream_chunk_size = 500
+    # CreateProducts: requests read ahead of the batch being created, and
+    # the largest batch validated and inserted together
+    create_window = 1000
+    create_batch_size = 500
 
-    def __init__(self, repo: ProductRepository):
+    def __init__(
+        self, repo: ProductRepository, user_checker: Optional[UserLookup] = None
+    ):
         self.repo = repo
+        self.user_checker = user_checker
+
+    async def _read_mask(
+        self, request, context: grpc.aio.ServicerContext
+    ) -> Optional[List[str]]:
+        try:
+            return mask_fields(request.read_mask, product_pb2.Product.DESCRIPTOR)
+        except ValueError as exc:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
+    def _list_page(self, request):
+        """Bind the user and price filters of a List/Stream request.
+
+        Raises:
+            ValueError: If ``sort`` is not "", "created" or "price".
+        """
+        if request.sort not in ("", "created", "price"):
+            raise ValueError(f"unknown sort {request.sort!r}")
+        return partial(
+            self.repo.list_page,
+            user_id=request.user_id or None,
+            min_price=request.min_price if request.HasField("min_price") else None,
+            max_price=request.max_price if request.HasField("max_price") else None,
+            by_price=request.sort == "price",
+        )
 
     async def CreateProduct(
         self,
@@ -26,22 +109,24 @@ class ProductServicer(product_pb2_grpc.ProductServiceServicer):
 
         Returns:
             Product: Created product with ID.
-        """
-        from libs.common.models import ProductCreate
 
+        Raises:
+            RpcError: NOT_FOUND if user_id is not a known user, UNAVAILABLE
+                if the User service could not be asked.
+        """
         payload = ProductCreate(
             name=request.name,
             price=request.price,
             user_id=request.user_id if request.user_id else None,
         )
+        if payload.user_id and self.user_checker is not None:
+            owners = await self.user_checker.exists_many([payload.user_id])
+            error = _owner_error(owners[payload.user_id])
+            if error is not None:
+                await context.abort(getattr(grpc.StatusCode, error[0]), error[1])
         product = await self.repo.create(payload)
         logger.info(f"Created product via gRPC: {product.id}")
-        return product_pb2.Product(
-            id=product.id,
-            name=product.name,
-            price=product.price,
-            user_id=product.user_id or "",
-        )
+        return _product_message(product)
 
     async def GetProduct(
         self,
@@ -51,24 +136,64 @@ class ProductServicer(product_pb2_grpc.ProductServiceServicer):
         """Get a product by ID.
 
         Args:
-            request: GetProductRequest with product_id.
+            request: GetProductRequest with product_id and optional read_mask.
             context: gRPC context.
 
         Returns:
-            Product: Product details.
+            Product: Product details (only the masked fields if read_mask is set).
 
         Raises:
-            RpcError: If product not found.
+            RpcError: NOT_FOUND if the product does not exist, INVALID_ARGUMENT
+                if read_mask names an unknown field.
         """
+        fields = await self._read_mask(request, context)
         product = await self.repo.get(request.product_id)
         if not product:
             await context.abort(grpc.StatusCode.NOT_FOUND, "Product not found")
         logger.info(f"Retrieved product via gRPC: {product.id}")
-        return product_pb2.Product(
-            id=product.id,
-            name=product.name,
-            price=product.price,
-            user_id=product.user_id or "",
+        return _product_message(product, fields)
+
+    async def BatchGetProducts(
+        self,
+        request: product_pb2.BatchGetProductsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> product_pb2.BatchGetProductsResponse:
+        """Get many products by ID in one call.
+
+        Args:
+            request: BatchGetProductsRequest with up to MAX_BATCH_GET_IDS IDs.
+            context: gRPC context.
+
+        Returns:
+            BatchGetProductsResponse: One result per requested ID, in request
+            order, with ``found`` false (and no product) for unknown IDs.
+
+        Raises:
+            RpcError: INVALID_ARGUMENT if too many IDs are requested or
+                read_mask names an unknown field.
+        """
+        fields = await self._read_mask(request, context)
+        product_ids = list(request.product_ids)
+        if len(product_ids) > MAX_BATCH_GET_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {MAX_BATCH_GET_IDS} ids per request",
+            )
+        products = await self.repo.get_many(product_ids)
+        Result = product_pb2.BatchGetProductsResponse.Result
+        return product_pb2.BatchGetProductsResponse(
+            results=[
+                (
+                    Result(
+                        id=product_id,
+                        found=True,
+                        product=_product_message(p, fields),
+                    )
+                    if p is not None
+                    else Result(id=product_id, found=False)
+                )
+                for product_id, p in zip(product_ids, products)
+            ]
         )
 
     async def ListProducts(
@@ -76,24 +201,258 @@ class ProductServicer(product_pb2_grpc.ProductServiceServicer):
         request: product_pb2.ListProductsRequest,
         context: grpc.aio.ServicerContext,
     ) -> product_pb2.ListProductsResponse:
-        """List all products.
+        """List products in creation order (or by price), one page at a time.
 
         Args:
-            request: ListProductsRequest.
+            request: ListProductsRequest with optional page_size, page_token,
+                user_id, price bounds and sort.
             context: gRPC context.
 
         Returns:
-            ListProductsResponse: List of all products.
+            ListProductsResponse: One page of products and the next page token.
+
+        Raises:
+            RpcError: INVALID_ARGUMENT if page_token is not a valid token,
+                read_mask names an unknown field, sort is unknown or price
+                ordering is combined with user_id.
         """
-        products = await self.repo.list_all()
-        product_messages = [
-            product_pb2.Product(
-                id=p.id,
-                name=p.name,
-                price=p.price,
-                user_id=p.user_id or "",
+        fields = await self._read_mask(request, context)
+        try:
+            products, next_token = await fetch_page(
+                self._list_page(request),
+                request.page_size,
+                request.page_token,
             )
-            for p in products
-        ]
+        except InvalidCursorError:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid page token")
+        except ValueError as exc:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+        product_messages = [_product_message(p, fields) for p in products]
         logger.info(f"Listed {len(products)} products via gRPC")
-        return product_pb2.ListProductsResponse(products=product_messages)
+        return product_pb2.ListProductsResponse(
+            products=product_messages, next_page_token=next_token or ""
+        )
+
+    async def StreamProducts(
+        self,
+        request: product_pb2.StreamProductsRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Stream every product in creation order, one chunk per message.
+
+        A chunk is read from the repository only after the previous one was
+        handed to gRPC, which waits for HTTP/2 flow control, so a slow
+        reader paces the reads and memory stays at one chunk. A client
+        cancellation closes the stream at the next write.
+
+        Args:
+            request: StreamProductsRequest with optional chunk_size,
+                page_token, user_id, price bounds and sort.
+            context: gRPC context.
+
+        Yields:
+            ListProductsResponse: A chunk of products and the token resuming
+            after it.
+
+        Raises:
+            RpcError: INVALID_ARGUMENT if page_token is not a valid token,
+                read_mask names an unknown field, sort is unknown or price
+                ordering is combined with user_id.
+        """
+        fields = await self._read_mask(request, context)
+        size = clamp_page_size(request.chunk_size or self.stream_chunk_size)
+        sent = 0
+        try:
+            after = decode_cursor(request.page_token) if request.page_token else None
+            async for products, next_after in iter_pages(
+                self._list_page(request), size, after
+            ):
+                yield product_pb2.ListProductsResponse(
+                    products=[_product_message(p, fields) for p in products],
+                    next_page_token=encode_cursor(next_after) if next_after else "",
+                )
+                sent += len(products)
+        except InvalidCursorError:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid page token")
+        except ValueError as exc:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+        except asyncio.CancelledError:
+            logger.info(f"StreamProducts cancelled by client after {sent} products")
+            raise
+        logger.info(f"Streamed {sent} products via gRPC")
+
+    async def SearchProducts(
+        self,
+        request: product_pb2.SearchProductsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> product_pb2.SearchProductsResponse:
+        """Search product names through the repository's inverted index.
+
+        Args:
+            request: SearchProductsRequest with query, optional limit and
+                read_mask.
+            context: gRPC context.
+
+        Returns:
+            SearchProductsResponse: The best matches, ranked by how often the
+            query words occur in the name, and the total number of matches.
+
+        Raises:
+            RpcError: INVALID_ARGUMENT if query contains no word or read_mask
+                names an unknown field.
+        """
+        fields = await self._read_mask(request, context)
+        if not tokenize(request.query):
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "Query must contain a word"
+            )
+        limit = clamp_page_size(request.limit or DEFAULT_SEARCH_LIMIT)
+        matches, total = await self.repo.search(request.query, limit)
+        Hit = product_pb2.SearchProductsResponse.Hit
+        return product_pb2.SearchProductsResponse(
+            hits=[
+                Hit(score=score, product=_product_message(product, fields))
+                for product, score in matches
+            ],
+            total=total,
+        )
+
+    async def ListProductChanges(
+        self,
+        request: product_pb2.ListProductChangesRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> product_pb2.ListProductChangesResponse:
+        """Return the products changed after a sequence number.
+
+        Args:
+            request: ListProductChangesRequest with since, limit and epoch.
+            context: gRPC context.
+
+        Returns:
+            ListProductChangesResponse: Changes after ``since``, oldest
+            first, and the ``since`` of the next request.
+
+        Raises:
+            RpcError: FAILED_PRECONDITION if ``epoch`` is set and is not the
+                feed's current epoch.
+        """
+        log = self.repo.changes
+        if request.epoch and request.epoch != log.epoch:
+            await context.abort(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                "Change feed restarted; resync from since=0",
+            )
+        changes, has_more = await self.repo.changes_since(
+            request.since, clamp_page_size(request.limit)
+        )
+        return product_pb2.ListProductChangesResponse(
+            epoch=log.epoch,
+            changes=[
+                product_pb2.ProductChange(
+                    sequence=change.sequence,
+                    timestamp_ms=int(change.timestamp * 1000),
+                    product=_product_message(product),
+                )
+                for change, product in changes
+            ],
+            next_since=changes[-1][0].sequence if changes else request.since,
+            has_more=has_more,
+        )
+
+    async def CreateProducts(self, request_iterator, context: grpc.aio.ServicerContext):
+        """Create products from a client stream, answering on the same stream.
+
+        Requests are read ahead into a queue of at most ``create_window``;
+        when it is full the server stops reading, so HTTP/2 flow control
+        pushes back on the client instead of buffering without bound. Each
+        batch (whatever is queued, up to ``create_batch_size``) is validated
+        together, its distinct owners are checked with one ``exists_many``
+        and the valid products are inserted with one ``create_many``.
+
+        Args:
+            request_iterator: Stream of ProductCreateRequest records.
+            context: gRPC context.
+
+        Yields:
+            CreateProductsResponse: One per request, in request order, with
+            the created product or an error.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.create_window)
+        end = object()
+
+        async def read() -> None:
+            try:
+                async for request in request_iterator:
+                    await queue.put(request)
+            except asyncio.CancelledError:
+                raise  # the consumer is gone: a full queue would never drain
+            except Exception:
+                await queue.put(end)
+                raise
+            await queue.put(end)
+
+        reader = asyncio.create_task(read())
+        created = offset = 0
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < self.create_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                finished = batch[-1] is end
+                if finished:
+                    batch.pop()
+                if batch:
+                    for response in await self._create_batch(batch, offset):
+                        created += response.HasField("product")
+                        yield response
+                    offset += len(batch)
+                if finished:
+                    break
+            await reader  # re-raise a failure reading the client stream
+        finally:
+            reader.cancel()
+        logger.info(f"CreateProducts created {created} of {offset} products")
+
+    async def _create_batch(
+        self, requests: List[product_pb2.ProductCreateRequest], offset: int
+    ) -> List[product_pb2.CreateProductsResponse]:
+        Response = product_pb2.CreateProductsResponse
+        items = [
+            {"name": r.name, "price": r.price, "user_id": r.user_id or None}
+            for r in requests
+        ]
+        valid, errors = validate_items(items, ProductCreate)
+        results: Dict[int, product_pb2.CreateProductsResponse] = {
+            index: Response(
+                index=offset + index,
+                error=Response.ItemError(code="INVALID_ARGUMENT", message=message),
+            )
+            for index, message in errors.items()
+        }
+        owners: Dict[str, Optional[bool]] = {}
+        if self.user_checker is not None:
+            owners = await self.user_checker.exists_many(
+                p.user_id for _, p in valid if p.user_id
+            )
+
+        accepted = []
+        for index, payload in valid:
+            error = (
+                _owner_error(owners[payload.user_id])
+                if payload.user_id in owners
+                else None
+            )
+            if error is not None:
+                results[index] = Response(
+                    index=offset + index,
+                    error=Response.ItemError(code=error[0], message=error[1]),
+                )
+            else:
+                accepted.append((index, payload))
+
+        products = await self.repo.create_many(payload for _, payload in accepted)
+        for (index, _), product in zip(accepted, products):
+            results[index] = Response(
+                index=offset + index, product=_product_message(product)
+            )
+        return [results[index] for index in range(len(requests))]
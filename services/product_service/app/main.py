@@ -1,19 +1,35 @@
 import time
 import uuid
 import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
 
 import grpc
 from fastapi import FastAPI, Request
 from services.product_service.app.api.routes import router as product_router
+from services.product_service.app.config import Settings
 from services.product_service.app.crud import ProductRepository
 from services.product_service.app.grpc_service import ProductServicer
 from services.product_service.app import product_pb2_grpc
 from libs.common.logging import get_logger
 from libs.common.metrics import Metrics
 from libs.common.context import set_tracking_id
+from services.product_service.app.user_lookup import UserLookup
 
 
-def create_app() -> FastAPI:
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up outbound clients on startup and release them on shutdown.
+
+    Args:
+        app: The FastAPI application.
+    """
+    await app.state.user_lookup.start()
+    yield
+    await app.state.user_lookup.aclose()
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
     """Create and configure the Product service FastAPI application.
 
     Sets up:
@@ -21,17 +37,25 @@ def create_app() -> FastAPI:
         - Structured logging with tracking IDs.
         - Request/response metrics collection.
         - Health and metrics endpoints.
+        - A pooled REST/gRPC client for calls to the User service.
+
+    Args:
+        settings: Service settings (default: loaded from the environment).
 
     Returns:
         A configured FastAPI application instance.
     """
-    app = FastAPI(title="Product Service")
+    app = FastAPI(title="Product Service", lifespan=lifespan)
     app.include_router(product_router, prefix="/products", tags=["products"])
+    app.state.settings = settings = settings or Settings.from_env()
 
     # logging and metrics
     app.logger = get_logger("product_service")
     app.state.metrics = Metrics()
 
+    # long-lived User service client, warmed up and closed in `lifespan`
+    app.state.user_lookup = UserLookup(settings, metrics=app.state.metrics)
+
     @app.middleware("http")
     async def metrics_and_tracking_middleware(request: Request, call_next):
         """Middleware to track request metrics and set request tracing ID.
@@ -89,15 +113,20 @@ async def serve_grpc(port: int = 50052):
     """
     logger = get_logger("product_service.grpc")
     repo = ProductRepository()
-    servicer = ProductServicer(repo)
+    users = UserLookup(Settings.from_env())
+    servicer = ProductServicer(repo, user_checker=users)
 
     server = grpc.aio.server()
     product_pb2_grpc.add_ProductServiceServicer_to_server(servicer, server)
     server.add_insecure_port(f"[::]:{port}")
 
-    await server.start()
-    logger.info(f"gRPC server started on port {port}")
-    await server.wait_for_termination()
+    await users.start()
+    try:
+        await server.start()
+        logger.info(f"gRPC server started on port {port}")
+        await server.wait_for_termination()
+    finally:
+        await users.aclose()
 
 
 def run_grpc_server(port: int = 50052):
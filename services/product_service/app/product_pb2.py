@@ -18,8 +18,11 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+
+
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\rproduct.proto\x12\x0fproduct_service"U\n\x14ProductCreateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x14\n\x07user_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_user_id"T\n\x07Product\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x14\n\x07user_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_user_id"\'\n\x11GetProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t"\x15\n\x13ListProductsRequest"B\n\x14ListProductsResponse\x12*\n\x08products\x18\x01 \x03(\x0b\x32\x18.product_service.Product2\x91\x02\n\x0eProductService\x12R\n\rCreateProduct\x12%.product_service.ProductCreateRequest\x1a\x18.product_service.Product"\x00\x12L\n\nGetProduct\x12".product_service.GetProductRequest\x1a\x18.product_service.Product"\x00\x12]\n\x0cListProducts\x12$.product_service.ListProductsRequest\x1a%.product_service.ListProductsResponse"\x00\x62\x06proto3'
+    b'\n\rproduct.proto\x12\x0fproduct_service\x1a google/protobuf/field_mask.proto"U\n\x14ProductCreateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x14\n\x07user_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_user_id"T\n\x07Product\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x14\n\x07user_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_user_id"V\n\x11GetProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"]\n\x17\x42\x61tchGetProductsRequest\x12\x13\n\x0bproduct_ids\x18\x01 \x03(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"\xad\x01\n\x18\x42\x61tchGetProductsResponse\x12\x41\n\x07results\x18\x01 \x03(\x0b\x32\x30.product_service.BatchGetProductsResponse.Result\x1aN\n\x06Result\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x66ound\x18\x02 \x01(\x08\x12)\n\x07product\x18\x03 \x01(\x0b\x32\x18.product_service.Product"\xd6\x01\n\x13ListProductsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x16\n\tmin_price\x18\x05 \x01(\x01H\x00\x88\x01\x01\x12\x16\n\tmax_price\x18\x06 \x01(\x01H\x01\x88\x01\x01\x12\x0c\n\x04sort\x18\x07 \x01(\tB\x0c\n\n_min_priceB\x0c\n\n_max_price"[\n\x14ListProductsResponse\x12*\n\x08products\x18\x01 \x03(\x0b\x32\x18.product_service.Product\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"\xd9\x01\n\x15StreamProductsRequest\x12\x12\n\nchunk_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x16\n\tmin_price\x18\x05 \x01(\x01H\x00\x88\x01\x01\x12\x16\n\tmax_price\x18\x06 \x01(\x01H\x01\x88\x01\x01\x12\x0c\n\x04sort\x18\x07 \x01(\tB\x0c\n\n_min_priceB\x0c\n\n_max_price"H\n\x19ListProductChangesRequest\x12\r\n\x05since\x18\x01 \x01(\x03\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\r\n\x05\x65poch\x18\x03 \x01(\t"b\n\rProductChange\x12\x10\n\x08sequence\x18\x01 \x01(\x03\x12\x14\n\x0ctimestamp_ms\x18\x02 \x01(\x03\x12)\n\x07product\x18\x03 \x01(\x0b\x32\x18.product_service.Product"\x82\x01\n\x1aListProductChangesResponse\x12\r\n\x05\x65poch\x18\x01 \x01(\t\x12/\n\x07\x63hanges\x18\x02 \x03(\x0b\x32\x1e.product_service.ProductChange\x12\x12\n\nnext_since\x18\x03 \x01(\x03\x12\x10\n\x08has_more\x18\x04 \x01(\x08"\xce\x01\n\x16\x43reateProductsResponse\x12\r\n\x05index\x18\x01 \x01(\x05\x12+\n\x07product\x18\x02 \x01(\x0b\x32\x18.product_service.ProductH\x00\x12\x42\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x31.product_service.CreateProductsResponse.ItemErrorH\x00\x1a*\n\tItemError\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\tB\x08\n\x06result"d\n\x15SearchProductsRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"\xa3\x01\n\x16SearchProductsResponse\x12\x39\n\x04hits\x18\x01 \x03(\x0b\x32+.product_service.SearchProductsResponse.Hit\x12\r\n\x05total\x18\x02 \x01(\x05\x1a?\n\x03Hit\x12\r\n\x05score\x18\x01 \x01(\x05\x12)\n\x07product\x18\x02 \x01(\x0b\x32\x18.product_service.Product2\x9f\x06\n\x0eProductService\x12R\n\rCreateProduct\x12%.product_service.ProductCreateRequest\x1a\x18.product_service.Product"\x00\x12L\n\nGetProduct\x12".product_service.GetProductRequest\x1a\x18.product_service.Product"\x00\x12i\n\x10\x42\x61tchGetProducts\x12(.product_service.BatchGetProductsRequest\x1a).product_service.BatchGetProductsResponse"\x00\x12]\n\x0cListProducts\x12$.product_service.ListProductsRequest\x1a%.product_service.ListProductsResponse"\x00\x12\x63\n\x0eStreamProducts\x12&.product_service.StreamProductsRequest\x1a%.product_service.ListProductsResponse"\x00\x30\x01\x12\x66\n\x0e\x43reateProducts\x12%.product_service.ProductCreateRequest\x1a\'.product_service.CreateProductsResponse"\x00(\x01\x30\x01\x12o\n\x12ListProductChanges\x12*.product_service.ListProductChangesRequest\x1a+.product_service.ListProductChangesResponse"\x00\x12\x63\n\x0eSearchProducts\x12&.product_service.SearchProductsRequest\x1a\'.product_service.SearchProductsResponse"\x00\x62\x06proto3'
 )
 
 _globals = globals()
@@ -27,16 +30,40 @@ _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "product_pb2", _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
-    _globals["_PRODUCTCREATEREQUEST"]._serialized_start = 34
-    _globals["_PRODUCTCREATEREQUEST"]._serialized_end = 119
-    _globals["_PRODUCT"]._serialized_start = 121
-    _globals["_PRODUCT"]._serialized_end = 205
-    _globals["_GETPRODUCTREQUEST"]._serialized_start = 207
-    _globals["_GETPRODUCTREQUEST"]._serialized_end = 246
-    _globals["_LISTPRODUCTSREQUEST"]._serialized_start = 248
-    _globals["_LISTPRODUCTSREQUEST"]._serialized_end = 269
-    _globals["_LISTPRODUCTSRESPONSE"]._serialized_start = 271
-    _globals["_LISTPRODUCTSRESPONSE"]._serialized_end = 337
-    _globals["_PRODUCTSERVICE"]._serialized_start = 340
-    _globals["_PRODUCTSERVICE"]._serialized_end = 613
+    _globals["_PRODUCTCREATEREQUEST"]._serialized_start = 68
+    _globals["_PRODUCTCREATEREQUEST"]._serialized_end = 153
+    _globals["_PRODUCT"]._serialized_start = 155
+    _globals["_PRODUCT"]._serialized_end = 239
+    _globals["_GETPRODUCTREQUEST"]._serialized_start = 241
+    _globals["_GETPRODUCTREQUEST"]._serialized_end = 327
+    _globals["_BATCHGETPRODUCTSREQUEST"]._serialized_start = 329
+    _globals["_BATCHGETPRODUCTSREQUEST"]._serialized_end = 422
+    _globals["_BATCHGETPRODUCTSRESPONSE"]._serialized_start = 425
+    _globals["_BATCHGETPRODUCTSRESPONSE"]._serialized_end = 598
+    _globals["_BATCHGETPRODUCTSRESPONSE_RESULT"]._serialized_start = 520
+    _globals["_BATCHGETPRODUCTSRESPONSE_RESULT"]._serialized_end = 598
+    _globals["_LISTPRODUCTSREQUEST"]._serialized_start = 601
+    _globals["_LISTPRODUCTSREQUEST"]._serialized_end = 815
+    _globals["_LISTPRODUCTSRESPONSE"]._serialized_start = 817
+    _globals["_LISTPRODUCTSRESPONSE"]._serialized_end = 908
+    _globals["_STREAMPRODUCTSREQUEST"]._serialized_start = 911
+    _globals["_STREAMPRODUCTSREQUEST"]._serialized_end = 1128
+    _globals["_LISTPRODUCTCHANGESREQUEST"]._serialized_start = 1130
+    _globals["_LISTPRODUCTCHANGESREQUEST"]._serialized_end = 1202
+    _globals["_PRODUCTCHANGE"]._serialized_start = 1204
+    _globals["_PRODUCTCHANGE"]._serialized_end = 1302
+    _globals["_LISTPRODUCTCHANGESRESPONSE"]._serialized_start = 1305
+    _globals["_LISTPRODUCTCHANGESRESPONSE"]._serialized_end = 1435
+    _globals["_CREATEPRODUCTSRESPONSE"]._serialized_start = 1438
+    _globals["_CREATEPRODUCTSRESPONSE"]._serialized_end = 1644
+    _globals["_CREATEPRODUCTSRESPONSE_ITEMERROR"]._serialized_start = 1592
+    _globals["_CREATEPRODUCTSRESPONSE_ITEMERROR"]._serialized_end = 1634
+    _globals["_SEARCHPRODUCTSREQUEST"]._serialized_start = 1646
+    _globals["_SEARCHPRODUCTSREQUEST"]._serialized_end = 1746
+    _globals["_SEARCHPRODUCTSRESPONSE"]._serialized_start = 1749
+    _globals["_SEARCHPRODUCTSRESPONSE"]._serialized_end = 1912
+    _globals["_SEARCHPRODUCTSRESPONSE_HIT"]._serialized_start = 1849
+    _globals["_SEARCHPRODUCTSRESPONSE_HIT"]._serialized_end = 1912
+    _globals["_PRODUCTSERVICE"]._serialized_start = 1915
+    _globals["_PRODUCTSERVICE"]._serialized_end = 2714
 # @@protoc_insertion_point(module_scope)
@@ -48,12 +48,42 @@ class ProductServiceStub(object):
             response_deserializer=product__pb2.Product.FromString,
             _registered_method=True,
         )
+        self.BatchGetProducts = channel.unary_unary(
+            "/product_service.ProductService/BatchGetProducts",
+            request_serializer=product__pb2.BatchGetProductsRequest.SerializeToString,
+            response_deserializer=product__pb2.BatchGetProductsResponse.FromString,
+            _registered_method=True,
+        )
         self.ListProducts = channel.unary_unary(
             "/product_service.ProductService/ListProducts",
             request_serializer=product__pb2.ListProductsRequest.SerializeToString,
             response_deserializer=product__pb2.ListProductsResponse.FromString,
             _registered_method=True,
         )
+        self.StreamProducts = channel.unary_stream(
+            "/product_service.ProductService/StreamProducts",
+            request_serializer=product__pb2.StreamProductsRequest.SerializeToString,
+            response_deserializer=product__pb2.ListProductsResponse.FromString,
+            _registered_method=True,
+        )
+        self.CreateProducts = channel.stream_stream(
+            "/product_service.ProductService/CreateProducts",
+            request_serializer=product__pb2.ProductCreateRequest.SerializeToString,
+            response_deserializer=product__pb2.CreateProductsResponse.FromString,
+            _registered_method=True,
+        )
+        self.ListProductChanges = channel.unary_unary(
+            "/product_service.ProductService/ListProductChanges",
+            request_serializer=product__pb2.ListProductChangesRequest.SerializeToString,
+            response_deserializer=product__pb2.ListProductChangesResponse.FromString,
+            _registered_method=True,
+        )
+        self.SearchProducts = channel.unary_unary(
+            "/product_service.ProductService/SearchProducts",
+            request_serializer=product__pb2.SearchProductsRequest.SerializeToString,
+            response_deserializer=product__pb2.SearchProductsResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class ProductServiceServicer(object):
@@ -71,12 +101,42 @@ class ProductServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def BatchGetProducts(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ListProducts(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamProducts(self, request, context):
+        """Every product in chunks; each chunk's next_page_token resumes after it."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def CreateProducts(self, request_iterator, context):
+        """One response per request, in order, as requests are created in batches."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ListProductChanges(self, request, context):
+        """Products changed after a sequence number (delta sync)."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def SearchProducts(self, request, context):
+        """Products whose name contains every query word, best matches first."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_ProductServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -90,11 +150,36 @@ def add_ProductServiceServicer_to_server(servicer, server):
             request_deserializer=product__pb2.GetProductRequest.FromString,
             response_serializer=product__pb2.Product.SerializeToString,
         ),
+        "BatchGetProducts": grpc.unary_unary_rpc_method_handler(
+            servicer.BatchGetProducts,
+            request_deserializer=product__pb2.BatchGetProductsRequest.FromString,
+            response_serializer=product__pb2.BatchGetProductsResponse.SerializeToString,
+        ),
         "ListProducts": grpc.unary_unary_rpc_method_handler(
             servicer.ListProducts,
             request_deserializer=product__pb2.ListProductsRequest.FromString,
             response_serializer=product__pb2.ListProductsResponse.SerializeToString,
         ),
+        "StreamProducts": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamProducts,
+            request_deserializer=product__pb2.StreamProductsRequest.FromString,
+            response_serializer=product__pb2.ListProductsResponse.SerializeToString,
+        ),
+        "CreateProducts": grpc.stream_stream_rpc_method_handler(
+            servicer.CreateProducts,
+            request_deserializer=product__pb2.ProductCreateRequest.FromString,
+            response_serializer=product__pb2.CreateProductsResponse.SerializeToString,
+        ),
+        "ListProductChanges": grpc.unary_unary_rpc_method_handler(
+            servicer.ListProductChanges,
+            request_deserializer=product__pb2.ListProductChangesRequest.FromString,
+            response_serializer=product__pb2.ListProductChangesResponse.SerializeToString,
+        ),
+        "SearchProducts": grpc.unary_unary_rpc_method_handler(
+            servicer.SearchProducts,
+            request_deserializer=product__pb2.SearchProductsRequest.FromString,
+            response_serializer=product__pb2.SearchProductsResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "product_service.ProductService", rpc_method_handlers
@@ -169,6 +254,36 @@ class ProductService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def BatchGetProducts(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/product_service.ProductService/BatchGetProducts",
+            product__pb2.BatchGetProductsRequest.SerializeToString,
+            product__pb2.BatchGetProductsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def ListProducts(
         request,
@@ -198,3 +313,123 @@ class ProductService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def StreamProducts(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/product_service.ProductService/StreamProducts",
+            product__pb2.StreamProductsRequest.SerializeToString,
+            product__pb2.ListProductsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def CreateProducts(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            "/product_service.ProductService/CreateProducts",
+            product__pb2.ProductCreateRequest.SerializeToString,
+            product__pb2.CreateProductsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def ListProductChanges(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/product_service.ProductService/ListProductChanges",
+            product__pb2.ListProductChangesRequest.SerializeToString,
+            product__pb2.ListProductChangesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def SearchProducts(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/product_service.ProductService/SearchProducts",
+            product__pb2.SearchProductsRequest.SerializeToString,
+            product__pb2.SearchProductsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
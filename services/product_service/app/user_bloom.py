@@ -0,0 +1,129 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+
+from libs.common.bloom import BloomFilter
+from libs.common.http_client import SingleFlight
+from libs.common.logging import get_logger
+from libs.common.metrics import Metrics
+from libs.common.resilience import ServiceUnavailableError
+
+logger = get_logger(__name__)
+
+BloomFetch = Callable[[Optional[str]], Awaitable[Tuple[Optional[bytes], Optional[str]]]]
+
+
+class UserBloom:
+    """Local copy of the User service's Bloom filter of user IDs.
+
+    The filter is downloaded every ``refresh_interval`` seconds (a
+    conditional request, so an unchanged filter costs no transfer). A user
+    ID absent from the filter definitely did not exist when the filter was
+    built, so "no" is answered locally from a filter fetched at most
+    ``negative_max_age`` seconds before the question was asked; an older
+    filter is fetched again first. A user created within that window may
+    be rejected, the same staleness the negative answer cache accepts.
+    Concurrent refetches share one download.
+
+    Reported through ``metrics`` (if given): ``user_bloom_fetches_total``,
+    ``user_bloom_not_modified_total`` and the ``user_bloom_users`` and
+    ``user_bloom_bytes`` gauges.
+
+    Args:
+        fetch: Coroutine function taking the current version (or None) and
+            returning (serialized filter or None if unchanged, version).
+        refresh_interval: Seconds between background downloads.
+        negative_max_age: Age in seconds up to which a "definitely not"
+            answer is trusted without refetching (None: the refresh
+            interval; 0: always refetch).
+        metrics: Optional Metrics instance to report into.
+    """
+
+    def __init__(
+        self,
+        fetch: BloomFetch,
+        refresh_interval: float = 5.0,
+        negative_max_age: Optional[float] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self._fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.negative_max_age = (
+            refresh_interval if negative_max_age is None else negative_max_age
+        )
+        self.metrics = metrics
+        self.filter: Optional[BloomFilter] = None
+        self.version: Optional[str] = None
+        self._fetched_at = float("-inf")
+        self._flight = SingleFlight()
+        self._task: Optional[asyncio.Task] = None
+
+    async def might_contain(self, user_id: str) -> bool:
+        """Return False only if ``user_id`` definitely does not exist.
+
+        If the filter cannot be fetched the answer is True ("maybe"), so
+        the caller asks the User service instead.
+        """
+        asked = time.monotonic()
+        while True:
+            if self.filter is not None:
+                if user_id in self.filter:
+                    return True
+                if self._fetched_at >= asked - self.negative_max_age:
+                    return False
+            try:
+                await self.refresh()
+            except ServiceUnavailableError:
+                return True
+
+    async def refresh(self) -> None:
+        """Download the filter if it changed (shared by concurrent callers).
+
+        Raises:
+            ServiceUnavailableError: If the User service could not answer.
+        """
+        await self._flight.do("bloom", self._refresh)
+
+    async def _refresh(self) -> None:
+        started = time.monotonic()
+        data, version = await self._fetch(self.version)
+        self._inc("fetches_total")
+        if data is None:
+            self._inc("not_modified_total")
+        else:
+            try:
+                self.filter = BloomFilter.from_bytes(data)
+            except ValueError as exc:
+                raise ServiceUnavailableError(f"bad user Bloom filter: {exc}") from exc
+            if self.metrics is not None:
+                self.metrics.set("user_bloom_users", self.filter.count)
+                self.metrics.set("user_bloom_bytes", len(data))
+        self.version = version
+        self._fetched_at = started
+
+    async def start(self) -> None:
+        """Start refreshing the filter in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        """Stop refreshing the filter."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except ServiceUnavailableError as exc:
+                logger.warning(f"user Bloom filter refresh failed: {exc}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def _inc(self, counter: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"user_bloom_{counter}")
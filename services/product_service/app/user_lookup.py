@@ -0,0 +1,313 @@
+import asyncio
+import functools
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from libs.common.balancer import LoadBalancer, make_resolver
+from libs.common.batching import MicroBatcher
+from libs.common.cache import TTLCache
+from libs.common.grpc_pool import GrpcChannelPool, get_channel_pool
+from libs.common.hedging import Hedger
+from libs.common.http_client import (
+    PooledHttpClient,
+    SingleFlight,
+    check_user_exists,
+    check_user_exists_grpc,
+    check_users_exist_grpc,
+    fetch_user_bloom,
+    fetch_user_bloom_grpc,
+)
+from libs.common.metrics import Metrics
+from libs.common.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+    ServiceUnavailableError,
+    call_with_resilience,
+)
+from services.product_service.app.config import Settings
+from services.product_service.app.user_bloom import UserBloom
+from services.product_service.app.user_replica import UserReplica
+
+T = TypeVar("T")
+
+
+class UserLookup:
+    """Answers "does this user exist?" for the Product service.
+
+    Sends the check to the User service over the transport selected by
+    ``settings.user_lookup_transport`` (REST through the pooled HTTP client,
+    or gRPC through the process-wide channel pool of each replica). Requests
+    are spread over the User service replicas by a client-side load
+    balancer that ejects failing or unhealthy replicas.
+
+    Answers are kept in a TTL cache: users are never deleted, so "exists" can
+    be cached for long, while "not found" expires quickly in case the user is
+    created shortly after. Behind the cache, concurrent checks for the same
+    user share one in-flight call, and on gRPC checks for different users
+    arriving within a few milliseconds are sent as one ``BatchUserExists``.
+
+    Every call to the User service runs under a deadline with jittered,
+    budgeted retries behind a circuit breaker. When no answer can be had,
+    ServiceUnavailableError is raised instead of reporting "not found".
+    With ``user_lookup_hedge`` enabled, an attempt that is slower than the
+    recent p95 (by default) is raced against a second request, which the
+    balancer sends to a less busy replica.
+
+    With ``user_replica_target`` set, user IDs are also replicated locally
+    through the ``WatchUsers`` stream; a user found in the replica is
+    accepted without any call. Misses still go to the User service, since
+    the user may have been created after the replica's last change.
+    With ``user_bloom`` enabled, users missing from the User service's
+    Bloom filter are rejected locally; only "maybe" answers are checked.
+
+    Args:
+        settings: Product service settings.
+        metrics: Metrics instance used for client instrumentation.
+    """
+
+    def __init__(self, settings: Settings, metrics: Optional[Metrics] = None) -> None:
+        self.settings = settings
+        self.transport = settings.user_lookup_transport
+        self.http_client = PooledHttpClient(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            timeout=settings.http_timeout,
+            connect_timeout=settings.http_connect_timeout,
+            metrics=metrics,
+            name="user_service_http",
+        )
+        self._metrics = metrics
+        if self.transport == "grpc":
+            spec, scheme = settings.user_service_grpc_target, None
+            health_check = self._probe_grpc
+        else:
+            spec, scheme = settings.user_service_url, "http"
+            health_check = self._probe_rest
+        self.balancer = LoadBalancer(
+            make_resolver(spec, scheme=scheme, dns_ttl=settings.user_service_dns_ttl),
+            strategy=settings.user_lb_strategy,
+            max_failures=settings.user_lb_max_failures,
+            ejection_time=settings.user_lb_ejection_time,
+            health_check=health_check,
+            health_interval=settings.user_lb_health_interval,
+            metrics=metrics,
+            name="user_service_lb",
+        )
+        self.retry_policy = RetryPolicy(
+            max_attempts=settings.user_lookup_max_attempts,
+            base_delay=settings.user_lookup_retry_base_delay,
+            max_delay=settings.user_lookup_retry_max_delay,
+            deadline=settings.user_lookup_deadline,
+        )
+        self.retry_budget = RetryBudget(
+            ratio=settings.user_lookup_retry_budget_ratio,
+            min_per_second=settings.user_lookup_retry_budget_min_per_second,
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.user_breaker_failure_threshold,
+            reset_timeout=settings.user_breaker_reset_timeout,
+            metrics=metrics,
+            name="user_service_breaker",
+        )
+        self.hedger: Optional[Hedger] = None
+        if settings.user_lookup_hedge:
+            self.hedger = Hedger(
+                percentile=settings.user_lookup_hedge_percentile,
+                min_delay=settings.user_lookup_hedge_min_delay_ms / 1000,
+                max_delay=settings.user_lookup_hedge_max_delay_ms / 1000,
+                metrics=metrics,
+                name="user_lookup_hedge",
+            )
+        self.flight = SingleFlight(metrics=metrics, name="user_lookup_singleflight")
+        self.batcher: Optional[MicroBatcher[str, bool]] = None
+        if self.transport == "grpc" and settings.user_lookup_batch_size > 1:
+            self.batcher = MicroBatcher(
+                self._fetch_many,
+                max_batch_size=settings.user_lookup_batch_size,
+                max_wait=settings.user_lookup_batch_wait_ms / 1000,
+                metrics=metrics,
+                name="user_lookup_batcher",
+            )
+        self.cache: Optional[TTLCache[str, bool]] = None
+        if settings.user_cache_size > 0:
+            self.cache = TTLCache(
+                max_size=settings.user_cache_size,
+                positive_ttl=settings.user_cache_positive_ttl,
+                negative_ttl=settings.user_cache_negative_ttl,
+                refresh_ahead=settings.user_cache_refresh_ahead,
+                metrics=metrics,
+                name="user_cache",
+            )
+        self.replica: Optional[UserReplica] = None
+        if settings.user_replica_target:
+            self.replica = UserReplica(settings.user_replica_target, metrics=metrics)
+        self.bloom: Optional[UserBloom] = None
+        if settings.user_bloom:
+            self.bloom = UserBloom(
+                self._fetch_bloom,
+                refresh_interval=settings.user_bloom_refresh_interval,
+                negative_max_age=settings.user_bloom_negative_max_age,
+                metrics=metrics,
+            )
+
+    def grpc_pool(self, target: str) -> GrpcChannelPool:
+        """Return the process-wide channel pool for one User service replica."""
+        return get_channel_pool(
+            target,
+            size=self.settings.grpc_pool_size,
+            keepalive_time_ms=self.settings.grpc_keepalive_time_ms,
+            keepalive_timeout_ms=self.settings.grpc_keepalive_timeout_ms,
+            metrics=self._metrics,
+            name="user_service_grpc",
+        )
+
+    async def exists(self, user_id: str) -> bool:
+        """Check whether ``user_id`` exists in the User service.
+
+        Args:
+            user_id: The user ID to verify.
+
+        Returns:
+            True if the user exists, False otherwise.
+
+        Raises:
+            ServiceUnavailableError: If the User service could not answer.
+        """
+        if self.replica is not None and self.replica.contains(user_id):
+            if self._metrics is not None:
+                self._metrics.inc("user_replica_hits_total")
+            return True
+        if self.bloom is not None and not await self.bloom.might_contain(user_id):
+            if self._metrics is not None:
+                self._metrics.inc("user_bloom_rejects_total")
+            return False
+        if self.cache is None:
+            return await self._load(user_id)
+        return await self.cache.get_or_load(user_id, self._load)
+
+    async def exists_many(self, user_ids: Iterable[str]) -> Dict[str, Optional[bool]]:
+        """Check several users, asking about each distinct ID once.
+
+        Every ID goes through the same path as ``exists`` (replica, Bloom
+        filter, cache, single-flight), so on gRPC the lookups are coalesced
+        into ``BatchUserExists`` calls by the micro-batcher. At most
+        ``http_max_connections`` lookups are in flight at a time.
+
+        Args:
+            user_ids: The user IDs to verify (duplicates are fine).
+
+        Returns:
+            Mapping of each distinct user ID to True/False, or None if the
+            User service could not answer for it.
+        """
+        limit = asyncio.Semaphore(self.settings.http_max_connections)
+
+        async def check(user_id: str) -> Optional[bool]:
+            async with limit:
+                try:
+                    return await self.exists(user_id)
+                except ServiceUnavailableError:
+                    return None
+
+        distinct = list(dict.fromkeys(user_ids))
+        answers = await asyncio.gather(*(check(user_id) for user_id in distinct))
+        return dict(zip(distinct, answers))
+
+    async def _load(self, user_id: str) -> bool:
+        return await self.flight.do(user_id, lambda: self._fetch(user_id))
+
+    async def _fetch(self, user_id: str) -> bool:
+        if self.batcher is not None:
+            return await self.batcher.submit(user_id)
+        return await self._call(lambda: self._fetch_once(user_id))
+
+    async def _fetch_once(self, user_id: str) -> bool:
+        timeout = self.settings.user_lookup_attempt_timeout
+        async with self.balancer.endpoint() as ep:
+            if self.transport == "grpc":
+                return await check_user_exists_grpc(
+                    user_id,
+                    ep.address,
+                    pool=self.grpc_pool(ep.address),
+                    timeout=timeout,
+                )
+            return await check_user_exists(
+                user_id, ep.address, client=self.http_client, timeout=timeout
+            )
+
+    async def _fetch_many(self, user_ids: List[str]) -> Dict[str, bool]:
+        return await self._call(lambda: self._fetch_many_once(user_ids))
+
+    async def _fetch_many_once(self, user_ids: List[str]) -> Dict[str, bool]:
+        async with self.balancer.endpoint() as ep:
+            return await check_users_exist_grpc(
+                user_ids,
+                ep.address,
+                pool=self.grpc_pool(ep.address),
+                timeout=self.settings.user_lookup_attempt_timeout,
+            )
+
+    async def _fetch_bloom(self, version: Optional[str]):
+        async with self.balancer.endpoint() as ep:
+            if self.transport == "grpc":
+                return await fetch_user_bloom_grpc(
+                    ep.address, pool=self.grpc_pool(ep.address), version=version
+                )
+            return await fetch_user_bloom(
+                ep.address, client=self.http_client, version=version
+            )
+
+    async def _call(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        if self.hedger is not None:
+            attempt = functools.partial(self.hedger.call, attempt)
+        return await call_with_resilience(
+            attempt,
+            self.retry_policy,
+            budget=self.retry_budget,
+            breaker=self.breaker,
+            metrics=self._metrics,
+            name="user_lookup",
+        )
+
+    async def _probe_rest(self, address: str) -> bool:
+        try:
+            response = await self.http_client.get(
+                f"{address}/health", timeout=self.settings.user_lookup_attempt_timeout
+            )
+        except Exception:
+            return False
+        return response.status_code == 200
+
+    async def _probe_grpc(self, address: str) -> bool:
+        channel = self.grpc_pool(address).channel()
+        try:
+            await asyncio.wait_for(
+                channel.channel_ready(), self.settings.user_lookup_attempt_timeout
+            )
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def start(self) -> None:
+        """Resolve replicas, start health probing and warm up gRPC channels."""
+        if self.replica is not None:
+            await self.replica.start()
+        await self.balancer.start()
+        if self.bloom is not None:
+            await self.bloom.start()
+        if self.transport == "grpc":
+            for address in self.balancer.endpoints:
+                await self.grpc_pool(address).warm_up()
+
+    async def aclose(self) -> None:
+        """Stop health probing and release pooled connections and channels."""
+        if self.replica is not None:
+            await self.replica.stop()
+        if self.bloom is not None:
+            await self.bloom.stop()
+        await self.balancer.stop()
+        await self.http_client.aclose()
+        if self.transport == "grpc":
+            for address in self.balancer.endpoints:
+                await self.grpc_pool(address).close()
@@ -0,0 +1,133 @@
+import asyncio
+import random
+import time
+from typing import Optional, Set
+
+import grpc
+
+from libs.common.logging import get_logger
+from libs.common.metrics import Metrics
+from services.user_service.app import user_pb2, user_pb2_grpc
+
+logger = get_logger(__name__)
+
+
+class UserReplica:
+    """Local set of user IDs kept in sync through the WatchUsers stream.
+
+    On (re)connect the stream resumes from the last applied sequence number
+    of the same epoch; otherwise the User service sends a fresh snapshot,
+    which is collected into a new set and swapped in once complete so
+    readers never see a half-loaded replica. The stream is reconnected with
+    jittered exponential backoff.
+
+    Users are never deleted, so a hit in the replica is authoritative. A
+    miss is not: the user may have been created after the last applied
+    change, so callers should fall back to asking the User service.
+
+    Reported through ``metrics`` (if given): ``user_replica_changes_total``,
+    ``user_replica_reconnects_total`` and the ``user_replica_size``,
+    ``user_replica_sequence``, ``user_replica_lag_sequences`` and
+    ``user_replica_lag_seconds`` gauges.
+
+    Args:
+        target: gRPC target of the User service ("host:port").
+        metrics: Optional Metrics instance to report into.
+        max_backoff: Upper bound on the reconnect delay, in seconds.
+
+    Example:
+        >>> replica = UserReplica("localhost:50051")
+        >>> await replica.start()
+        >>> replica.contains("u_abc123")
+    """
+
+    def __init__(
+        self,
+        target: str,
+        metrics: Optional[Metrics] = None,
+        max_backoff: float = 5.0,
+    ) -> None:
+        self.target = target
+        self.metrics = metrics
+        self.max_backoff = max_backoff
+        self.user_ids: Set[str] = set()
+        self.sequence = 0
+        self.epoch = ""
+        self.ready = asyncio.Event()
+        self._received = False
+        self._task: Optional[asyncio.Task] = None
+
+    def contains(self, user_id: str) -> bool:
+        """Return True if ``user_id`` is known to exist."""
+        return user_id in self.user_ids
+
+    async def start(self) -> None:
+        """Start following the change stream in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._follow_forever())
+
+    async def stop(self) -> None:
+        """Stop following the change stream."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _follow_forever(self) -> None:
+        failures = 0
+        while True:
+            try:
+                async with grpc.aio.insecure_channel(self.target) as channel:
+                    stub = user_pb2_grpc.UserServiceStub(channel)
+                    await self._follow(stub)
+            except grpc.RpcError as exc:
+                logger.warning(f"WatchUsers stream to {self.target} failed: {exc}")
+            failures = 1 if self._received else failures + 1
+            self._inc("reconnects_total")
+            delay = random.uniform(0, min(self.max_backoff, 0.1 * 2**failures))
+            await asyncio.sleep(delay)
+
+    async def _follow(self, stub) -> None:
+        self._received = False
+        request = user_pb2.WatchUsersRequest(
+            after_sequence=self.sequence, epoch=self.epoch
+        )
+        snapshot: Optional[Set[str]] = None
+        async for change in stub.WatchUsers(request):
+            if change.kind == user_pb2.UserChange.SNAPSHOT:
+                if snapshot is None:
+                    snapshot = set()
+                snapshot.update(change.user_ids)
+                if not change.snapshot_complete:
+                    continue
+                logger.info(
+                    f"user replica loaded {len(snapshot)} users at {change.sequence}"
+                )
+                self.user_ids, snapshot = snapshot, None
+                self.epoch = change.epoch
+            elif change.kind == user_pb2.UserChange.CREATED:
+                self.user_ids.update(change.user_ids)
+                self._inc("changes_total", len(change.user_ids))
+            self.sequence = change.sequence
+            self.ready.set()
+            self._received = True
+            self._report(change)
+
+    def _inc(self, counter: str, value: int = 1) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(f"user_replica_{counter}", value)
+
+    def _report(self, change: user_pb2.UserChange) -> None:
+        if self.metrics is None:
+            return
+        lag_sequences = max(0, change.head_sequence - self.sequence)
+        lag_seconds = 0.0
+        if lag_sequences and change.timestamp_ms:
+            lag_seconds = max(0.0, time.time() - change.timestamp_ms / 1000)
+        self.metrics.set("user_replica_size", len(self.user_ids))
+        self.metrics.set("user_replica_sequence", self.sequence)
+        self.metrics.set("user_replica_lag_sequences", lag_sequences)
+        self.metrics.set("user_replica_lag_seconds", lag_seconds)
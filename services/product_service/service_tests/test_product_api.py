@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from httpx._transports.asgi import ASGITransport
+from libs.common.codecs import MSGPACK
 from services.product_service.app.main import create_app
 
 
@@ -22,3 +23,194 @@ async def test_create_and_get_product():
         r3 = await client.get("/products/")
         assert r3.status_code == 200
         assert len(r3.json()) >= 1
+
+
+@pytest.mark.asyncio
+async def test_list_products_pagination():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        created = [
+            (
+                await client.post("/products/", json={"name": f"Page{i}", "price": i})
+            ).json()["id"]
+            for i in range(7)
+        ]
+
+        seen, params = [], {"limit": 3}
+        while True:
+            r = await client.get("/products/", params=params)
+            assert r.status_code == 200
+            assert len(r.json()) <= 3
+            seen += [p["id"] for p in r.json()]
+            token = r.headers.get("X-Next-Page-Token")
+            if token is None:
+                break
+            params = {"limit": 3, "after": token}
+        assert len(seen) == len(set(seen))
+        assert seen[-7:] == created
+
+        bad = await client.get("/products/", params={"after": "bm9wZQ"})
+        assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        a = (await client.post("/products/", json={"name": "A", "price": 1})).json()
+        b = (await client.post("/products/", json={"name": "B", "price": 2})).json()
+
+        r = await client.get(
+            "/products/", params={"ids": f"{b['id']},p_missing", "limit": 1}
+        )
+        assert r.status_code == 200
+        assert r.json()["results"] == [
+            {"id": b["id"], "found": True, "product": b},
+            {"id": "p_missing", "found": False, "product": None},
+        ]
+
+        r2 = await client.post(
+            "/products/batch-get", json={"ids": [a["id"], "p_missing", a["id"]]}
+        )
+        assert r2.status_code == 200
+        assert [item["found"] for item in r2.json()["results"]] == [True, False, True]
+
+        too_many = ",".join(f"p_{i}" for i in range(1001))
+        r3 = await client.get("/products/", params={"ids": too_many})
+        assert r3.status_code == 400
+        r4 = await client.post("/products/batch-get", json={"ids": too_many.split(",")})
+        assert r4.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_sparse_fields():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        created = (
+            await client.post("/products/", json={"name": "Sparse", "price": 4})
+        ).json()
+
+        r = await client.get(f"/products/{created['id']}", params={"fields": "id,name"})
+        assert r.status_code == 200
+        assert r.json() == {"name": "Sparse", "id": created["id"]}
+
+        r2 = await client.get("/products/", params={"fields": "id", "limit": 1})
+        assert r2.status_code == 200
+        assert all(list(item) == ["id"] for item in r2.json())
+        assert "x-next-page-token" in r2.headers
+
+        r3 = await client.get(
+            "/products/", params={"ids": created["id"], "fields": "price"}
+        )
+        assert r3.json()["results"][0]["product"] == {"price": 4.0}
+
+        r4 = await client.get("/products/", params={"fields": "id,secret"})
+        assert r4.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_msgpack_content_negotiation():
+    msgpack = pytest.importorskip("msgpack")
+    app = create_app()
+    transport = ASGITransport(app=app)
+    headers = {"Content-Type": MSGPACK, "Accept": MSGPACK}
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        body = msgpack.packb({"name": "Packed", "price": 2.5})
+        r = await client.post("/products/", content=body, headers=headers)
+        assert r.status_code == 200
+        assert r.headers["content-type"] == MSGPACK
+        created = msgpack.unpackb(r.content)
+        assert created["name"] == "Packed" and created["user_id"] is None
+
+        r2 = await client.get(
+            "/products/", params={"limit": 2, "fields": "id"}, headers=headers
+        )
+        assert all(list(item) == ["id"] for item in msgpack.unpackb(r2.content))
+
+
+@pytest.mark.asyncio
+async def test_product_change_feed():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        head = (await client.get("/products/changes", params={"limit": 1000})).json()
+        while head["has_more"]:
+            head = (
+                await client.get(
+                    "/products/changes", params={"since": head["next_since"]}
+                )
+            ).json()
+
+        created = (
+            await client.post("/products/", json={"name": "Delta", "price": 7})
+        ).json()
+        r = await client.get(
+            "/products/changes",
+            params={"since": head["next_since"], "epoch": head["epoch"]},
+        )
+        assert r.status_code == 200
+        body = r.json()
+        assert [c["product"] for c in body["changes"]] == [created]
+        assert body["next_since"] == body["changes"][0]["sequence"]
+
+        r2 = await client.get("/products/changes", params={"epoch": "stale"})
+        assert r2.status_code == 410
+
+
+@pytest.mark.asyncio
+async def test_price_range_cheapest_first():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for price in (50_005, 50_001, 50_009, 50_003, 50_001, 60_000):
+            await client.post("/products/", json={"name": "Ranged", "price": price})
+
+        prices, params = [], {"min_price": 50_001, "max_price": 50_005, "limit": 2}
+        while True:
+            r = await client.get("/products/", params=params)
+            assert r.status_code == 200
+            prices += [p["price"] for p in r.json()]
+            token = r.headers.get("X-Next-Page-Token")
+            if token is None:
+                break
+            params = {**params, "after": token}
+        assert prices == [50_001, 50_001, 50_003, 50_005]
+
+        r2 = await client.get("/products/", params={"sort": "price"})
+        listed = [p["price"] for p in r2.json()]
+        assert listed == sorted(listed)
+
+        r3 = await client.get("/products/", params={"sort": "price", "user_id": "u_1"})
+        assert r3.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_products_by_name():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for name in ("Zephyr lamp", "Zephyr zephyr lamp", "Zephyr chair"):
+            await client.post("/products/", json={"name": name, "price": 10})
+
+        r = await client.get("/products/search", params={"q": "LAMP zephyr"})
+        assert r.status_code == 200
+        body = r.json()
+        assert body["total"] == 2
+        assert [hit["product"]["name"] for hit in body["results"]] == [
+            "Zephyr zephyr lamp",
+            "Zephyr lamp",
+        ]
+        assert body["results"][0]["score"] == 3
+
+        r2 = await client.get("/products/search", params={"q": "zephyr", "limit": 1})
+        assert r2.json()["total"] == 3 and len(r2.json()["results"]) == 1
+
+        assert (
+            await client.get("/products/search", params={"q": "-"})
+        ).status_code == 400
+
+        stats = (await client.get("/products/search/stats")).json()
+        assert stats["products"] >= 3 and stats["bytes_per_product"] > 0
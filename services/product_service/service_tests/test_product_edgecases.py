@@ -25,3 +25,24 @@ async def test_get_nonexistent_product_returns_404():
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         r = await client.get("/products/nonexistent-id")
         assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_colliding_ids_are_drawn_again(monkeypatch):
+    from libs.common import utils
+    from libs.common.models import ProductCreate
+    from services.product_service.app.crud import ProductRepository
+
+    ids = iter(["p_1", "p_1", "p_2", "p_2", "p_1", "p_3", "p_4"])
+    monkeypatch.setattr(utils, "generate_id", lambda prefix="": next(ids))
+    repo = ProductRepository()
+    await repo.create(ProductCreate(name="A", price=500.0))
+    await repo.create(ProductCreate(name="B", price=5.0))
+    await repo.create_many(
+        [ProductCreate(name="C", price=6.0), ProductCreate(name="D", price=7.0)]
+    )
+
+    products, _ = await repo.list_page(10)
+    assert [p.id for p in products] == ["p_1", "p_2", "p_3", "p_4"]
+    cheap, _ = await repo.list_page(10, min_price=0, max_price=10)
+    assert [p.name for p in cheap] == ["B", "C", "D"]
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from services.product_service.app.crud import ProductRepository
 from services.product_service.app.grpc_service import ProductServicer
@@ -87,3 +89,258 @@ async def test_list_products_grpc(product_repo):
     assert len(response.products) == 2
     assert response.products[0].name in ["Monitor", "Keyboard"]
     assert response.products[1].name in ["Monitor", "Keyboard"]
+
+
+@pytest.mark.asyncio
+async def test_list_products_paginated_grpc(product_repo):
+    """Test ListProducts pages with page_size/page_token."""
+    servicer = ProductServicer(product_repo)
+    for i in range(5):
+        await product_repo.create(ProductCreate(name=f"P{i}", price=float(i)))
+
+    names, token = [], ""
+    while True:
+        response = await servicer.ListProducts(
+            product_pb2.ListProductsRequest(page_size=2, page_token=token), None
+        )
+        assert len(response.products) <= 2
+        names += [p.name for p in response.products]
+        token = response.next_page_token
+        if not token:
+            break
+    assert names == [f"P{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_stream_products_in_chunks_grpc(product_repo):
+    """Test StreamProducts yields bounded chunks and can resume."""
+    servicer = ProductServicer(product_repo)
+    for i in range(7):
+        await product_repo.create(ProductCreate(name=f"S{i}", price=float(i)))
+
+    request = product_pb2.StreamProductsRequest(chunk_size=3)
+    chunks = [chunk async for chunk in servicer.StreamProducts(request, None)]
+    assert [len(c.products) for c in chunks] == [3, 3, 1]
+    assert [p.name for c in chunks for p in c.products] == [f"S{i}" for i in range(7)]
+    assert chunks[-1].next_page_token == ""
+
+    resume = product_pb2.StreamProductsRequest(
+        chunk_size=3, page_token=chunks[0].next_page_token
+    )
+    rest = [chunk async for chunk in servicer.StreamProducts(resume, None)]
+    assert [p.name for c in rest for p in c.products] == [f"S{i}" for i in range(3, 7)]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products_grpc(product_repo):
+    """Test BatchGetProducts answers in request order with found markers."""
+    servicer = ProductServicer(product_repo)
+    product = await product_repo.create(ProductCreate(name="Mouse", price=19.99))
+
+    request = product_pb2.BatchGetProductsRequest(product_ids=["p_missing", product.id])
+    response = await servicer.BatchGetProducts(request, None)
+
+    assert [(r.id, r.found) for r in response.results] == [
+        ("p_missing", False),
+        (product.id, True),
+    ]
+    assert not response.results[0].HasField("product")
+    assert response.results[1].product.name == "Mouse"
+
+
+@pytest.mark.asyncio
+async def test_list_product_changes_grpc(product_repo):
+    """Test ListProductChanges returns only changes after `since`."""
+    servicer = ProductServicer(product_repo)
+    first = await product_repo.create(ProductCreate(name="Old", price=1.0))
+    await product_repo.create_many(
+        ProductCreate(name=f"New{i}", price=float(i)) for i in range(3)
+    )
+
+    response = await servicer.ListProductChanges(
+        product_pb2.ListProductChangesRequest(since=1, limit=2), None
+    )
+    assert [c.product.name for c in response.changes] == ["New0", "New1"]
+    assert [c.sequence for c in response.changes] == [2, 3]
+    assert response.has_more and response.next_since == 3
+    assert response.epoch == product_repo.changes.epoch
+
+    rest = await servicer.ListProductChanges(
+        product_pb2.ListProductChangesRequest(
+            since=response.next_since, epoch=response.epoch
+        ),
+        None,
+    )
+    assert [c.product.name for c in rest.changes] == ["New2"]
+    assert not rest.has_more and rest.next_since == 4
+    assert first.id not in {c.product.id for c in rest.changes}
+
+
+class FakeUserChecker:
+    """Stands in for UserLookup; records each exists_many call."""
+
+    def __init__(self, known, unavailable=()):
+        self.known = set(known)
+        self.unavailable = set(unavailable)
+        self.calls = []
+
+    async def exists_many(self, user_ids):
+        distinct = list(dict.fromkeys(user_ids))
+        self.calls.append(distinct)
+        return {u: None if u in self.unavailable else u in self.known for u in distinct}
+
+
+@pytest.mark.asyncio
+async def test_create_products_stream_grpc(product_repo):
+    """Test CreateProducts answers each request in order with batched owner checks."""
+    checker = FakeUserChecker(known={"u_ok"}, unavailable={"u_down"})
+    servicer = ProductServicer(product_repo, user_checker=checker)
+    owners = ["u_ok", "u_missing", None, "u_ok", "u_down"]
+
+    async def requests():
+        for i, owner in enumerate(owners):
+            yield product_pb2.ProductCreateRequest(
+                name=f"B{i}", price=float(i), user_id=owner
+            )
+
+    responses = [r async for r in servicer.CreateProducts(requests(), None)]
+
+    assert [r.index for r in responses] == list(range(5))
+    assert [r.WhichOneof("result") for r in responses] == [
+        "product",
+        "error",
+        "product",
+        "product",
+        "error",
+    ]
+    assert responses[1].error.code == "NOT_FOUND"
+    assert responses[4].error.code == "UNAVAILABLE"
+    assert responses[3].product.user_id == "u_ok"
+    assert checker.calls == [["u_ok", "u_missing", "u_down"]]
+    assert len(await product_repo.list_all()) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_products_stream_bounds_read_ahead(product_repo):
+    """Test CreateProducts stops reading once its window is full."""
+    servicer = ProductServicer(product_repo)
+    servicer.create_window = 3
+    servicer.create_batch_size = 2
+    pulled = 0
+
+    async def requests():
+        nonlocal pulled
+        for i in range(50):
+            pulled += 1
+            yield product_pb2.ProductCreateRequest(name=f"W{i}", price=1.0)
+
+    stream = servicer.CreateProducts(requests(), None)
+    first = await stream.__anext__()
+    await asyncio.sleep(0.01)  # let the reader run as far as it can
+
+    assert first.index == 0
+    # the unanswered batch, a full window and the one waiting to be queued
+    assert pulled <= servicer.create_batch_size + servicer.create_window + 1
+    rest = [r async for r in stream]
+    assert len(rest) == 49 and pulled == 50
+
+
+@pytest.mark.asyncio
+async def test_create_products_stream_closed_with_full_window(product_repo):
+    """Test the reader task ends when the call goes away mid-stream."""
+    servicer = ProductServicer(product_repo)
+    servicer.create_window = 2
+    servicer.create_batch_size = 1
+
+    async def requests():
+        for i in range(50):
+            yield product_pb2.ProductCreateRequest(name=f"C{i}", price=1.0)
+
+    before = asyncio.all_tasks()
+    stream = servicer.CreateProducts(requests(), None)
+    await stream.__anext__()
+    await asyncio.sleep(0.01)  # the reader is now blocked on the full queue
+    await stream.aclose()
+    await asyncio.sleep(0.01)
+
+    assert asyncio.all_tasks() - before == set()
+
+
+@pytest.mark.asyncio
+async def test_list_products_by_owner_grpc(product_repo):
+    """Test ListProducts with user_id pages through that user's products only."""
+    servicer = ProductServicer(product_repo)
+    await product_repo.create_many(
+        ProductCreate(name=f"O{i}", price=float(i), user_id=f"u_{i % 3}")
+        for i in range(10)
+    )
+
+    names, token = [], ""
+    while True:
+        response = await servicer.ListProducts(
+            product_pb2.ListProductsRequest(
+                page_size=2, page_token=token, user_id="u_1"
+            ),
+            None,
+        )
+        names += [p.name for p in response.products]
+        token = response.next_page_token
+        if not token:
+            break
+    assert names == ["O1", "O4", "O7"]
+
+    empty = await servicer.ListProducts(
+        product_pb2.ListProductsRequest(user_id="u_nobody"), None
+    )
+    assert list(empty.products) == []
+
+
+@pytest.mark.asyncio
+async def test_list_products_by_price_grpc(product_repo):
+    """Test ListProducts with price bounds pages cheapest first."""
+    servicer = ProductServicer(product_repo)
+    await product_repo.create_many(
+        ProductCreate(name=f"P{i}", price=float(price))
+        for i, price in enumerate([7, 3, 9, 1, 5, 3])
+    )
+
+    prices, token = [], ""
+    while True:
+        response = await servicer.ListProducts(
+            product_pb2.ListProductsRequest(
+                page_size=2, page_token=token, min_price=2, max_price=7
+            ),
+            None,
+        )
+        prices += [p.price for p in response.products]
+        token = response.next_page_token
+        if not token:
+            break
+    assert prices == [3, 3, 5, 7]
+
+    chunks = [
+        [p.price for p in chunk.products]
+        async for chunk in servicer.StreamProducts(
+            product_pb2.StreamProductsRequest(chunk_size=4, sort="price"), None
+        )
+    ]
+    assert chunks == [[1, 3, 3, 5], [7, 9]]
+
+
+@pytest.mark.asyncio
+async def test_search_products_grpc(product_repo):
+    """Test SearchProducts returns names containing every query word."""
+    servicer = ProductServicer(product_repo)
+    await product_repo.create_many(
+        ProductCreate(name=name, price=1.0)
+        for name in ("Red desk lamp", "Red lamp, red shade", "Blue lamp", "Red desk")
+    )
+
+    response = await servicer.SearchProducts(
+        product_pb2.SearchProductsRequest(query="red lamp"), None
+    )
+    assert response.total == 2
+    assert [(hit.score, hit.product.name) for hit in response.hits] == [
+        (3, "Red lamp, red shade"),
+        (2, "Red desk lamp"),
+    ]
@@ -1,13 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException
-from libs.common.models import UserCreate, User
+import time
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+from libs.common.bulk import MAX_BULK_ITEMS, split_ids
+from libs.common.codecs import (
+    binary_response,
+    body_openapi,
+    list_message,
+    negotiate,
+    parse_body,
+    to_message,
+)
+from libs.common.emails import DuplicateEmailError
+from libs.common.fields import fields_param, project
+from libs.common.logging import get_logger
+from libs.common.media import ndjson_response, wants_ndjson
+from libs.common.models import (
+    BatchGetRequest,
+    UserBatchGetItem,
+    UserBatchGetResponse,
+    UserBulkResponse,
+    UserBulkResult,
+    UserCreate,
+    User,
+)
+from libs.common.pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_PAGE_HEADER,
+    InvalidCursorError,
+    fetch_page,
+)
+from services.user_service.app import user_pb2
+from services.user_service.app.config import Settings
 from services.user_service.app.crud import UserRepository
-from typing import List
+from services.user_service.app.ingest import ingest_users
+from typing import Any, List, Optional, Union
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Routes mounted at the root, outside the /users/{user_id} namespace that
+# other services look user IDs up in
+index_router = APIRouter()
+
 
 # Single repository instance for demo/testing purposes
-_repo = UserRepository()
+_settings = Settings.from_env()
+_repo = UserRepository(
+    bloom_capacity=_settings.bloom_capacity, bloom_fp_rate=_settings.bloom_fp_rate
+)
 
 
 def get_repo():
@@ -15,22 +57,239 @@ def get_repo():
     return _repo
 
 
-@router.post("/", response_model=User)
+@router.post("/", response_model=User, openapi_extra=body_openapi(UserCreate))
 async def create_user(
-    payload: UserCreate, repo: UserRepository = Depends(get_repo)
+    payload: UserCreate = Depends(parse_body(UserCreate, user_pb2.UserCreateRequest)),
+    accept: Optional[str] = Header(None),
+    repo: UserRepository = Depends(get_repo),
 ) -> User:
-    user = await repo.create(payload)
+    """Create a user from a JSON, protobuf or msgpack body.
+
+    The response is JSON, or ``user_pb2.User`` / msgpack if ``Accept``
+    asks for ``application/x-protobuf`` / ``application/msgpack``. A
+    user with the same email (in any case) already existing is a 409.
+    """
+    try:
+        user = await repo.create(payload)
+    except DuplicateEmailError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    media_type = negotiate(accept)
+    if media_type is not None:
+        return binary_response(
+            media_type, user, lambda: to_message(user, user_pb2.User)
+        )
     return user
 
 
-@router.get("/", response_model=List[User])
-async def list_users(repo: UserRepository = Depends(get_repo)) -> List[User]:
-    return await repo.list_all()
+@router.post("/bulk", response_model=UserBulkResponse)
+async def create_users_bulk(
+    items: List[Any] = Body(...), repo: UserRepository = Depends(get_repo)
+) -> UserBulkResponse:
+    """Create many users in one request.
+
+    Records are validated together, emails already registered or repeated
+    within the request are rejected (409) and the rest are inserted with
+    one store update.
+    Failed items are reported per index without aborting the batch.
+    """
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=413, detail=f"at most {MAX_BULK_ITEMS} items per request"
+        )
+    start = time.perf_counter()
+    created, errors = await ingest_users(repo, items, set())
+    elapsed = time.perf_counter() - start
+    rate = len(created) / elapsed if elapsed > 0 else 0.0
+    logger.info(f"bulk created {len(created)} users ({rate:.0f} users/s)")
+    results = [
+        (
+            UserBulkResult(index=index, status=200, user=created[index])
+            if index in created
+            else UserBulkResult(
+                index=index, status=errors[index][0], error=errors[index][1]
+            )
+        )
+        for index in range(len(items))
+    ]
+    return UserBulkResponse(
+        created=len(created),
+        failed=len(errors),
+        elapsed_ms=elapsed * 1000,
+        users_per_second=rate,
+        results=results,
+    )
+
+
+async def _batch_get(
+    repo: UserRepository, user_ids: List[str], fields: Optional[List[str]] = None
+) -> Union[UserBatchGetResponse, JSONResponse]:
+    users = await repo.get_many(user_ids)
+    if fields is not None:
+        return JSONResponse(
+            {
+                "results": [
+                    {
+                        "id": user_id,
+                        "found": user is not None,
+                        "user": project(user, fields) if user is not None else None,
+                    }
+                    for user_id, user in zip(user_ids, users)
+                ]
+            }
+        )
+    return UserBatchGetResponse(
+        results=[
+            UserBatchGetItem(id=user_id, found=user is not None, user=user)
+            for user_id, user in zip(user_ids, users)
+        ]
+    )
+
+
+@router.post("/batch-get", response_model=UserBatchGetResponse)
+async def batch_get_users(
+    payload: BatchGetRequest,
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    repo: UserRepository = Depends(get_repo),
+) -> UserBatchGetResponse:
+    """Get many users by ID; results are in request order with ``found``."""
+    return await _batch_get(repo, payload.ids, fields)
+
+
+@router.get("/", response_model=Union[List[User], UserBatchGetResponse])
+async def list_users(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    ids: Optional[List[str]] = Query(None),
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    accept: Optional[str] = Header(None),
+    repo: UserRepository = Depends(get_repo),
+) -> Union[List[User], UserBatchGetResponse]:
+    """List users in creation order, one page at a time.
+
+    The token for the next page, if any, is returned in the
+    ``X-Next-Page-Token`` header; pass it back as ``after``. With
+    ``Accept: application/x-ndjson`` every user from ``after`` on (up to
+    ``limit``) is streamed instead, one JSON object per line. With ``ids``
+    (comma-separated and/or repeated) those users are fetched instead, as
+    with ``POST /users/batch-get``. With ``fields`` only those fields of
+    each user are returned, read straight from the store. A page can also
+    be requested as ``user_pb2.ListUsersResponse`` or a msgpack array
+    through ``Accept``.
+    """
+    if ids:
+        try:
+            return await _batch_get(repo, split_ids(ids), fields)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    try:
+        if wants_ndjson(accept):
+            return await ndjson_response(repo.list_page, after, limit, fields=fields)
+        users, next_token = await fetch_page(repo.list_page, limit, after)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="invalid page token")
+    headers = {NEXT_PAGE_HEADER: next_token} if next_token is not None else {}
+    media_type = negotiate(accept)
+    if media_type is not None:
+        return binary_response(
+            media_type,
+            users,
+            lambda: list_message(
+                user_pb2.ListUsersResponse,
+                "users",
+                users,
+                fields,
+                next_page_token=next_token or "",
+            ),
+            fields=fields,
+            headers=headers,
+        )
+    if fields is not None:
+        return JSONResponse([project(u, fields) for u in users], headers=headers)
+    response.headers.update(headers)
+    return users
+
+
+@index_router.get("/bloom/users", response_class=Response)
+async def get_user_bloom(
+    if_none_match: Optional[str] = Header(default=None),
+    repo: UserRepository = Depends(get_repo),
+) -> Response:
+    """Download the Bloom filter of all user IDs.
+
+    The body is ``BloomFilter.to_bytes()``; the ``ETag`` identifies the
+    version, so a client sending it back in ``If-None-Match`` gets a
+    ``304`` until a user is created.
+    """
+    version, data = await repo.bloom_filter()
+    etag = f'"{repo.changes.epoch}-{version}"'
+    headers = {"ETag": etag, "X-Bloom-Version": str(version)}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(data, media_type="application/octet-stream", headers=headers)
+
+
+@router.get("/suggest", response_model=List[User])
+async def suggest_users(
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    repo: UserRepository = Depends(get_repo),
+) -> List[User]:
+    """Typeahead: users whose name or email starts with ``prefix``.
+
+    Matching is case-insensitive and served from the repository's sorted
+    prefix keys, so latency follows ``limit``, not the number of users.
+    Results are ordered by the matching name or email.
+    """
+    users = await repo.suggest(prefix, limit)
+    if fields is not None:
+        return JSONResponse([project(u, fields) for u in users])
+    return users
+
+
+@router.get("/by-email/{email}", response_model=User)
+async def get_user_by_email(
+    email: str,
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    accept: Optional[str] = Header(None),
+    repo: UserRepository = Depends(get_repo),
+) -> User:
+    """Get a user by email address (case-insensitive) from the email index."""
+    user = await repo.get_by_email(email)
+    if not user:
+        raise HTTPException(status_code=404, detail="user not found")
+    media_type = negotiate(accept)
+    if media_type is not None:
+        return binary_response(
+            media_type,
+            user,
+            lambda: to_message(user, user_pb2.User, fields),
+            fields=fields,
+        )
+    if fields is not None:
+        return JSONResponse(project(user, fields))
+    return user
 
 
 @router.get("/{user_id}", response_model=User)
-async def get_user(user_id: str, repo: UserRepository = Depends(get_repo)) -> User:
+async def get_user(
+    user_id: str,
+    fields: Optional[List[str]] = Depends(fields_param(User)),
+    accept: Optional[str] = Header(None),
+    repo: UserRepository = Depends(get_repo),
+) -> User:
     user = await repo.get(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="user not found")
+    media_type = negotiate(accept)
+    if media_type is not None:
+        return binary_response(
+            media_type,
+            user,
+            lambda: to_message(user, user_pb2.User, fields),
+            fields=fields,
+        )
+    if fields is not None:
+        return JSONResponse(project(user, fields))
     return user
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+from libs.common.config import load_from_env
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime configuration for the User service.
+
+    Every field can be overridden with a ``USER_<FIELD_NAME>`` environment
+    variable (e.g., ``USER_BLOOM_FP_RATE``).
+
+    Attributes:
+        bloom_capacity: Number of user IDs the published Bloom filter is
+            initially sized for; it is rebuilt twice as large when exceeded.
+        bloom_fp_rate: Target false-positive rate of the Bloom filter.
+    """
+
+    bloom_capacity: int = 100_000
+    bloom_fp_rate: float = 0.01
+
+    def __post_init__(self) -> None:
+        if not 0 < self.bloom_fp_rate < 1:
+            raise ValueError(
+                f"bloom_fp_rate must be between 0 and 1, got {self.bloom_fp_rate!r}"
+            )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Load settings from ``USER_*`` environment variables."""
+        return load_from_env(cls, prefix="USER_")
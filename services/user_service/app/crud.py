@@ -1,18 +1,53 @@
-from typing import Dict, List, Optional
+from itertools import takewhile
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from libs.common.bloom import BloomFilter
+from libs.common.changelog import ChangeLog
+from libs.common.emails import DuplicateEmailError, normalize_email
 from libs.common.models import User, UserCreate
-from libs.common.utils import generate_id
+from libs.common.pagination import InsertionIndex
+from libs.common.sortedlist import SortedList
+from libs.common.utils import generate_unique_id, generate_unique_ids
+
+
+def _prefix_keys(user: User) -> Tuple[Tuple[str, str], Tuple[str, str]]:
+    """(lower-cased name, user ID) and (normalized email, user ID)."""
+    return (user.name.strip().lower(), user.id), (normalize_email(user.email), user.id)
 
 
 class UserRepository:
-    def __init__(self) -> None:
+    def __init__(
+        self, bloom_capacity: int = 100_000, bloom_fp_rate: float = 0.01
+    ) -> None:
         self._store: Dict[str, User] = {}
+        self._order: InsertionIndex[str] = InsertionIndex()
+        # normalized email -> user ID; enforces one user per address
+        self._by_email: Dict[str, str] = {}
+        # (lower-cased name or email, user ID), sorted, for prefix suggestions
+        self._prefixes: SortedList[Tuple[str, str]] = SortedList()
+        self.changes: ChangeLog[str] = ChangeLog()
+        self.bloom_fp_rate = bloom_fp_rate
+        self.bloom = BloomFilter(bloom_capacity, bloom_fp_rate)
+        self._bloom_bytes: Tuple[int, bytes] = (-1, b"")
 
     async def create(self, payload: UserCreate) -> User:
-        user_id = generate_id("u_")
+        """Create a user.
+
+        Raises:
+            DuplicateEmailError: If a user with this email already exists.
+        """
+        email = normalize_email(payload.email)
+        if email in self._by_email:
+            raise DuplicateEmailError(f"email already registered: {payload.email}")
+        user_id = generate_unique_id("u_", self._store)
         # Use `model_dump()` for Pydantic v2 compatibility (replaces `dict()`)
         user = User(id=user_id, **payload.model_dump())
         self._store[user_id] = user
+        self._by_email[email] = user_id
+        self._order.append(user_id)
+        self._prefixes.update(_prefix_keys(user))
+        self.changes.append(user_id)
+        self._add_to_bloom([user_id])
         try:
             # application-level logging (app logger not available here), use module logger
             from libs.common.logging import get_logger
@@ -22,8 +57,126 @@ class UserRepository:
             pass
         return user
 
+    async def create_many(self, payloads: Iterable[UserCreate]) -> List[User]:
+        """Create several users with a single store update.
+
+        Raises:
+            DuplicateEmailError: If an email is already registered or repeated
+                in ``payloads``; nothing is created then.
+        """
+        # payloads are validated UserCreate models: skip re-validating emails
+        users = [
+            User.model_construct(id=user_id, **payload.model_dump())
+            for payload, user_id in zip(
+                payloads, generate_unique_ids("u_", self._store)
+            )
+        ]
+        emails = {normalize_email(user.email): user.id for user in users}
+        if len(emails) < len(users) or not self._by_email.keys().isdisjoint(emails):
+            raise DuplicateEmailError("email already registered or repeated")
+        self._store.update((user.id, user) for user in users)
+        self._by_email.update(emails)
+        user_ids = [user.id for user in users]
+        self._order.extend(user_ids)
+        self._prefixes.update(key for user in users for key in _prefix_keys(user))
+        self.changes.extend(user_ids)
+        self._add_to_bloom(user_ids)
+        try:
+            from libs.common.logging import get_logger
+
+            get_logger(__name__).info("created %d users", len(users))
+        except Exception:
+            pass
+        return users
+
     async def get(self, user_id: str) -> Optional[User]:
         return self._store.get(user_id)
 
+    async def get_many(self, user_ids: Iterable[str]) -> List[Optional[User]]:
+        """Return the user for each ID in order (None where not found)."""
+        get = self._store.get
+        return [get(user_id) for user_id in user_ids]
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Return the user registered with ``email`` (any case), if any."""
+        user_id = self._by_email.get(normalize_email(email))
+        return self._store[user_id] if user_id is not None else None
+
+    async def suggest(self, prefix: str, limit: int) -> List[User]:
+        """Return users whose name or email starts with ``prefix``.
+
+        Reads from the sorted prefix keys: one bisect, then at most two
+        keys per returned user (name and email), so the cost follows
+        ``limit`` and not the number of users.
+
+        Args:
+            prefix: Start of a name or email (case-insensitive).
+            limit: Maximum number of users to return.
+
+        Returns:
+            Matching users, ordered by the matching name or email.
+        """
+        prefix = prefix.strip().lower()
+        keys = takewhile(
+            lambda key: key[0].startswith(prefix), self._prefixes.irange((prefix,))
+        )
+        found: Dict[str, None] = {}
+        for _, user_id in keys:
+            found[user_id] = None
+            if len(found) == limit:
+                break
+        return [self._store[user_id] for user_id in found]
+
+    async def registered_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Return which of ``emails`` are taken, as normalized addresses."""
+        by_email = self._by_email
+        return {e for e in map(normalize_email, emails) if e in by_email}
+
+    async def exists_many(self, user_ids: Iterable[str]) -> Dict[str, bool]:
+        store = self._store
+        return {user_id: user_id in store for user_id in user_ids}
+
+    async def snapshot_ids(self) -> Tuple[int, List[str]]:
+        """Return the latest change sequence and every user ID as of it."""
+        return self.changes.last_sequence, list(self._store)
+
+    def _add_to_bloom(self, user_ids: List[str]) -> None:
+        """Add new IDs (already in the store) to the Bloom filter."""
+        if self.bloom.count + len(user_ids) > self.bloom.capacity:
+            # keep the false-positive rate: rebuild at (at least) twice the size
+            capacity = self.bloom.capacity * 2
+            while capacity < len(self._store):
+                capacity *= 2
+            self.bloom = BloomFilter(capacity, self.bloom_fp_rate)
+            self.bloom.update(self._store)
+        else:
+            self.bloom.update(user_ids)
+
+    async def bloom_filter(self) -> Tuple[int, bytes]:
+        """Return the Bloom filter of user IDs, serialized, with its version.
+
+        The version is the change sequence the filter reflects; the
+        serialized form is cached until the next change.
+        """
+        version = self.changes.last_sequence
+        if self._bloom_bytes[0] != version:
+            self._bloom_bytes = (version, self.bloom.to_bytes())
+        return self._bloom_bytes
+
+    async def list_page(
+        self, limit: int, after: Optional[str] = None
+    ) -> Tuple[List[User], Optional[str]]:
+        """Return up to ``limit`` users created after user ``after``.
+
+        Returns:
+            Tuple of (users, ID to pass as ``after`` for the next page, or
+            None on the last page).
+
+        Raises:
+            InvalidCursorError: If ``after`` is not a known user ID.
+        """
+        user_ids, next_after = self._order.page(after, limit)
+        return [self._store[user_id] for user_id in user_ids], next_after
+
     async def list_all(self) -> List[User]:
         return list(self._store.values())
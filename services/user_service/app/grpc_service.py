@@ -1,18 +1,58 @@
+import asyncio
+import time
+from typing import List, Optional
+
 import grpc
 
+from libs.common.bulk import MAX_BATCH_GET_IDS
+from libs.common.emails import DuplicateEmailError
+from libs.common.fields import mask_fields, project
 from libs.common.logging import get_logger
+from libs.common.models import User
+from libs.common.pagination import (
+    InvalidCursorError,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    iter_pages,
+)
 from services.user_service.app.crud import UserRepository
+from services.user_service.app.ingest import ingest_users
 from services.user_service.app import user_pb2, user_pb2_grpc
 
 logger = get_logger(__name__)
 
 
+def _user_message(user: User, fields: Optional[List[str]] = None) -> user_pb2.User:
+    """Build a User message with only ``fields`` set (None: all of them)."""
+    if fields is None:
+        return user_pb2.User(id=user.id, name=user.name, email=user.email)
+    return user_pb2.User(**project(user, fields))
+
+
 class UserServicer(user_pb2_grpc.UserServiceServicer):
     """gRPC service implementation for User operations."""
 
+    # Users per StreamUsers message when the client does not choose
+    stream_chunk_size = 500
+    # User IDs per WatchUsers message, and idle time before a heartbeat
+    watch_chunk_size = 1000
+    watch_heartbeat_seconds = 10.0
+    # Records validated and inserted together by CreateUsers
+    ingest_batch_size = 1000
+
     def __init__(self, repo: UserRepository):
         self.repo = repo
 
+    async def _read_mask(
+        self, request, context: grpc.aio.ServicerContext
+    ) -> Optional[List[str]]:
+        try:
+            return mask_fields(request.read_mask, user_pb2.User.DESCRIPTOR)
+        except ValueError as exc:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
     async def CreateUser(
         self, request: user_pb2.UserCreateRequest, context: grpc.aio.ServicerContext
     ) -> user_pb2.User:
@@ -24,13 +64,19 @@ class UserServicer(user_pb2_grpc.UserServiceServicer):
 
         Returns:
             User: Created user with ID.
+
+        Raises:
+            RpcError: ALREADY_EXISTS if a user with this email exists.
         """
         from libs.common.models import UserCreate
 
         payload = UserCreate(name=request.name, email=request.email)
-        user = await self.repo.create(payload)
+        try:
+            user = await self.repo.create(payload)
+        except DuplicateEmailError as exc:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, str(exc))
         logger.info(f"Created user via gRPC: {user.id}")
-        return user_pb2.User(id=user.id, name=user.name, email=user.email)
+        return _user_message(user)
 
     async def GetUser(
         self, request: user_pb2.GetUserRequest, context: grpc.aio.ServicerContext
@@ -38,39 +84,155 @@ class UserServicer(user_pb2_grpc.UserServiceServicer):
         """Get a user by ID.
 
         Args:
-            request: GetUserRequest with user_id.
+            request: GetUserRequest with user_id and optional read_mask.
             context: gRPC context.
 
         Returns:
-            User: User details.
+            User: User details (only the masked fields if read_mask is set).
 
         Raises:
-            RpcError: If user not found.
+            RpcError: NOT_FOUND if the user does not exist, INVALID_ARGUMENT
+                if read_mask names an unknown field.
         """
+        fields = await self._read_mask(request, context)
         user = await self.repo.get(request.user_id)
         if not user:
             await context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
         logger.info(f"Retrieved user via gRPC: {user.id}")
-        return user_pb2.User(id=user.id, name=user.name, email=user.email)
+        return _user_message(user, fields)
+
+    async def GetUserByEmail(
+        self,
+        request: user_pb2.GetUserByEmailRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> user_pb2.User:
+        """Get a user by email address, through the repository's email index.
+
+        Args:
+            request: GetUserByEmailRequest with email and optional read_mask.
+            context: gRPC context.
+
+        Returns:
+            User: User details (only the masked fields if read_mask is set).
+
+        Raises:
+            RpcError: NOT_FOUND if no user has this email, INVALID_ARGUMENT
+                if read_mask names an unknown field.
+        """
+        fields = await self._read_mask(request, context)
+        user = await self.repo.get_by_email(request.email)
+        if not user:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
+        return _user_message(user, fields)
+
+    async def BatchGetUsers(
+        self, request: user_pb2.BatchGetUsersRequest, context: grpc.aio.ServicerContext
+    ) -> user_pb2.BatchGetUsersResponse:
+        """Get many users by ID in one call.
+
+        Args:
+            request: BatchGetUsersRequest with up to MAX_BATCH_GET_IDS IDs.
+            context: gRPC context.
+
+        Returns:
+            BatchGetUsersResponse: One result per requested ID, in request
+            order, with ``found`` false (and no user) for unknown IDs.
+
+        Raises:
+            RpcError: INVALID_ARGUMENT if too many IDs are requested or
+                read_mask names an unknown field.
+        """
+        fields = await self._read_mask(request, context)
+        user_ids = list(request.user_ids)
+        if len(user_ids) > MAX_BATCH_GET_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {MAX_BATCH_GET_IDS} ids per request",
+            )
+        users = await self.repo.get_many(user_ids)
+        Result = user_pb2.BatchGetUsersResponse.Result
+        return user_pb2.BatchGetUsersResponse(
+            results=[
+                (
+                    Result(
+                        id=user_id,
+                        found=True,
+                        user=_user_message(u, fields),
+                    )
+                    if u is not None
+                    else Result(id=user_id, found=False)
+                )
+                for user_id, u in zip(user_ids, users)
+            ]
+        )
 
     async def ListUsers(
         self, request: user_pb2.ListUsersRequest, context: grpc.aio.ServicerContext
     ) -> user_pb2.ListUsersResponse:
-        """List all users.
+        """List users in creation order, one page at a time.
 
         Args:
-            request: ListUsersRequest.
+            request: ListUsersRequest with optional page_size and page_token.
             context: gRPC context.
 
         Returns:
-            ListUsersResponse: List of all users.
+            ListUsersResponse: One page of users and the next page token.
+
+        Raises:
+            RpcError: INVALID_ARGUMENT if page_token is not a valid token or
+                read_mask names an unknown field.
         """
-        users = await self.repo.list_all()
-        user_messages = [
-            user_pb2.User(id=u.id, name=u.name, email=u.email) for u in users
-        ]
+        fields = await self._read_mask(request, context)
+        try:
+            users, next_token = await fetch_page(
+                self.repo.list_page, request.page_size, request.page_token
+            )
+        except InvalidCursorError:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid page token")
+        user_messages = [_user_message(u, fields) for u in users]
         logger.info(f"Listed {len(users)} users via gRPC")
-        return user_pb2.ListUsersResponse(users=user_messages)
+        return user_pb2.ListUsersResponse(
+            users=user_messages, next_page_token=next_token or ""
+        )
+
+    async def StreamUsers(
+        self, request: user_pb2.StreamUsersRequest, context: grpc.aio.ServicerContext
+    ):
+        """Stream every user in creation order, one chunk per message.
+
+        A chunk is read from the repository only after the previous one was
+        handed to gRPC, which waits for HTTP/2 flow control, so a slow
+        reader paces the reads and memory stays at one chunk. A client
+        cancellation closes the stream at the next write.
+
+        Args:
+            request: StreamUsersRequest with optional chunk_size and page_token.
+            context: gRPC context.
+
+        Yields:
+            ListUsersResponse: A chunk of users and the token resuming after it.
+
+        Raises:
+            RpcError: INVALID_ARGUMENT if page_token is not a valid token or
+                read_mask names an unknown field.
+        """
+        fields = await self._read_mask(request, context)
+        size = clamp_page_size(request.chunk_size or self.stream_chunk_size)
+        sent = 0
+        try:
+            after = decode_cursor(request.page_token) if request.page_token else None
+            async for users, next_after in iter_pages(self.repo.list_page, size, after):
+                yield user_pb2.ListUsersResponse(
+                    users=[_user_message(u, fields) for u in users],
+                    next_page_token=encode_cursor(next_after) if next_after else "",
+                )
+                sent += len(users)
+        except InvalidCursorError:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid page token")
+        except asyncio.CancelledError:
+            logger.info(f"StreamUsers cancelled by client after {sent} users")
+            raise
+        logger.info(f"Streamed {sent} users via gRPC")
 
     async def UserExists(
         self, request: user_pb2.UserExistsRequest, context: grpc.aio.ServicerContext
@@ -88,3 +250,154 @@ class UserServicer(user_pb2_grpc.UserServiceServicer):
         exists = user is not None
         logger.info(f"Checked user existence via gRPC: {request.user_id} -> {exists}")
         return user_pb2.UserExistsResponse(exists=exists)
+
+    async def BatchUserExists(
+        self,
+        request: user_pb2.BatchUserExistsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> user_pb2.BatchUserExistsResponse:
+        """Check existence of many users in one call.
+
+        Args:
+            request: BatchUserExistsRequest with user_ids.
+            context: gRPC context.
+
+        Returns:
+            BatchUserExistsResponse: Map of user_id to existence.
+        """
+        exists = await self.repo.exists_many(request.user_ids)
+        logger.info(f"Checked existence of {len(exists)} users via gRPC")
+        return user_pb2.BatchUserExistsResponse(exists=exists)
+
+    async def WatchUsers(
+        self, request: user_pb2.WatchUsersRequest, context: grpc.aio.ServicerContext
+    ):
+        """Stream user IDs: a snapshot, then users as they are created.
+
+        Resumes from ``request.after_sequence`` when it belongs to the current
+        change-log epoch; otherwise starts with a chunked snapshot. Each
+        message is written before the next one is produced, so a slow reader
+        applies backpressure instead of growing a server-side buffer.
+
+        Args:
+            request: WatchUsersRequest with after_sequence and epoch.
+            context: gRPC context.
+
+        Yields:
+            UserChange: SNAPSHOT chunks, then CREATED or HEARTBEAT messages.
+        """
+        log = self.repo.changes
+        sequence = request.after_sequence
+        chunk_size = self.watch_chunk_size
+
+        def change(kind, user_ids=(), **kwargs) -> user_pb2.UserChange:
+            return user_pb2.UserChange(
+                kind=kind,
+                sequence=sequence,
+                user_ids=user_ids,
+                head_sequence=log.last_sequence,
+                epoch=log.epoch,
+                **kwargs,
+            )
+
+        if sequence <= 0 or request.epoch != log.epoch or sequence > log.last_sequence:
+            sequence, user_ids = await self.repo.snapshot_ids()
+            logger.info(f"WatchUsers snapshot of {len(user_ids)} users at {sequence}")
+            now_ms = int(time.time() * 1000)
+            for start in range(0, max(len(user_ids), 1), chunk_size):
+                yield change(
+                    user_pb2.UserChange.SNAPSHOT,
+                    user_ids[start : start + chunk_size],
+                    snapshot_complete=start + chunk_size >= len(user_ids),
+                    timestamp_ms=now_ms,
+                )
+
+        while True:
+            changes = log.since(sequence, limit=chunk_size)
+            if changes:
+                sequence = changes[-1].sequence
+                yield change(
+                    user_pb2.UserChange.CREATED,
+                    [c.key for c in changes],
+                    timestamp_ms=int(changes[-1].timestamp * 1000),
+                )
+            elif not await log.wait(sequence, timeout=self.watch_heartbeat_seconds):
+                yield change(
+                    user_pb2.UserChange.HEARTBEAT,
+                    timestamp_ms=int(time.time() * 1000),
+                )
+
+    async def GetUserBloomFilter(
+        self,
+        request: user_pb2.GetUserBloomFilterRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> user_pb2.UserBloomFilter:
+        """Return the Bloom filter of all user IDs.
+
+        Args:
+            request: GetUserBloomFilterRequest with the client's version.
+            context: gRPC context.
+
+        Returns:
+            UserBloomFilter: The serialized filter, or ``not_modified``.
+        """
+        version, data = await self.repo.bloom_filter()
+        epoch = self.repo.changes.epoch
+        if request.epoch == epoch and request.known_version == version:
+            return user_pb2.UserBloomFilter(
+                version=version, epoch=epoch, not_modified=True
+            )
+        return user_pb2.UserBloomFilter(filter=data, version=version, epoch=epoch)
+
+    async def CreateUsers(
+        self, request_iterator, context: grpc.aio.ServicerContext
+    ) -> user_pb2.CreateUsersResponse:
+        """Create users from a client stream, in batches.
+
+        Records are collected into batches of ``ingest_batch_size``; each
+        batch is validated together and inserted with one store update.
+        Emails repeated anywhere in the stream are rejected after their
+        first occurrence.
+
+        Args:
+            request_iterator: Stream of UserCreateRequest records.
+            context: gRPC context.
+
+        Returns:
+            CreateUsersResponse: Counts, one ID per record (empty if
+            rejected), per-record errors and the ingest throughput.
+        """
+        codes = {409: "ALREADY_EXISTS", 422: "INVALID_ARGUMENT"}
+        response = user_pb2.CreateUsersResponse()
+        seen_emails: set = set()
+        batch: list = []
+        start = time.perf_counter()
+
+        async def flush() -> None:
+            offset = len(response.user_ids)
+            created, errors = await ingest_users(self.repo, batch, seen_emails)
+            for index in range(len(batch)):
+                user = created.get(index)
+                response.user_ids.append(user.id if user else "")
+            for index, (status, message) in sorted(errors.items()):
+                response.errors.add(
+                    index=offset + index, code=codes[status], message=message
+                )
+            response.created += len(created)
+            response.failed += len(errors)
+            batch.clear()
+
+        async for record in request_iterator:
+            batch.append({"name": record.name, "email": record.email})
+            if len(batch) >= self.ingest_batch_size:
+                await flush()
+        if batch:
+            await flush()
+
+        elapsed = time.perf_counter() - start
+        response.users_per_second = response.created / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"CreateUsers created {response.created} users "
+            f"({response.users_per_second:.0f} users/s)"
+        )
+        return response
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+from libs.common.bulk import validate_items
+from libs.common.emails import normalize_email
+from libs.common.models import User, UserCreate
+from services.user_service.app.crud import UserRepository
+
+
+async def ingest_users(
+    repo: UserRepository, items: Sequence[Any], seen_emails: Set[str]
+) -> Tuple[Dict[int, User], Dict[int, Tuple[int, str]]]:
+    """Validate and insert one batch of user records.
+
+    The batch is validated in one pass, records whose email (compared
+    case-insensitively) is already registered or was already seen in this
+    batch or in earlier batches of the same ingest are dropped, and the
+    rest are inserted with a single ``create_many``.
+
+    Args:
+        repo: Repository to insert into.
+        items: Raw user records (dicts with name and email).
+        seen_emails: Normalized emails of this ingest so far; updated.
+
+    Returns:
+        Tuple of ({index: created user}, {index: (status, error)}), with
+        status 422 for invalid records and 409 for duplicate emails.
+    """
+    valid, invalid = validate_items(items, UserCreate)
+    errors: Dict[int, Tuple[int, str]] = {
+        index: (422, error) for index, error in invalid.items()
+    }
+    registered = await repo.registered_emails(p.email for _, p in valid)
+    accepted: List[Tuple[int, UserCreate]] = []
+    for index, payload in valid:
+        email = normalize_email(payload.email)
+        if email in registered:
+            errors[index] = (409, "email already registered")
+        elif email in seen_emails:
+            errors[index] = (409, "duplicate email in batch")
+        else:
+            seen_emails.add(email)
+            accepted.append((index, payload))
+    users = await repo.create_many(payload for _, payload in accepted)
+    created = {index: user for (index, _), user in zip(accepted, users)}
+    return created, errors
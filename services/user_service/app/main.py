@@ -4,7 +4,9 @@ import asyncio
 
 import grpc
 from fastapi import FastAPI, Request
+from services.user_service.app.api.routes import index_router
 from services.user_service.app.api.routes import router as user_router
+from services.user_service.app.config import Settings
 from services.user_service.app.crud import UserRepository
 from services.user_service.app.grpc_service import UserServicer
 from services.user_service.app import user_pb2_grpc
@@ -27,6 +29,7 @@ def create_app() -> FastAPI:
     """
     app = FastAPI(title="User Service")
     app.include_router(user_router, prefix="/users", tags=["users"])
+    app.include_router(index_router, tags=["users"])
 
     # logging and metrics
     app.logger = get_logger("user_service")
@@ -88,7 +91,10 @@ async def serve_grpc(port: int = 50051):
         port: Port to listen on (default 50051).
     """
     logger = get_logger("user_service.grpc")
-    repo = UserRepository()
+    settings = Settings.from_env()
+    repo = UserRepository(
+        bloom_capacity=settings.bloom_capacity, bloom_fp_rate=settings.bloom_fp_rate
+    )
     servicer = UserServicer(repo)
 
     server = grpc.aio.server()
@@ -18,8 +18,11 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+
+
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\nuser.proto\x12\x0cuser_service"0\n\x11UserCreateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t"/\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t"\x12\n\x10ListUsersRequest"6\n\x11ListUsersResponse\x12!\n\x05users\x18\x01 \x03(\x0b\x32\x12.user_service.User"$\n\x11UserExistsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t"$\n\x12UserExistsResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x32\xb4\x02\n\x0bUserService\x12\x43\n\nCreateUser\x12\x1f.user_service.UserCreateRequest\x1a\x12.user_service.User"\x00\x12=\n\x07GetUser\x12\x1c.user_service.GetUserRequest\x1a\x12.user_service.User"\x00\x12N\n\tListUsers\x12\x1e.user_service.ListUsersRequest\x1a\x1f.user_service.ListUsersResponse"\x00\x12Q\n\nUserExists\x12\x1f.user_service.UserExistsRequest\x1a .user_service.UserExistsResponse"\x00\x62\x06proto3'
+    b'\n\nuser.proto\x12\x0cuser_service\x1a google/protobuf/field_mask.proto"0\n\x11UserCreateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t"/\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t"P\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"U\n\x15GetUserByEmailRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"h\n\x10ListUsersRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"O\n\x11ListUsersResponse\x12!\n\x05users\x18\x01 \x03(\x0b\x32\x12.user_service.User\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"k\n\x12StreamUsersRequest\x12\x12\n\nchunk_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"W\n\x14\x42\x61tchGetUsersRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"\x9b\x01\n\x15\x42\x61tchGetUsersResponse\x12;\n\x07results\x18\x01 \x03(\x0b\x32*.user_service.BatchGetUsersResponse.Result\x1a\x45\n\x06Result\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x66ound\x18\x02 \x01(\x08\x12 \n\x04user\x18\x03 \x01(\x0b\x32\x12.user_service.User"$\n\x11UserExistsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t"$\n\x12UserExistsResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08"*\n\x16\x42\x61tchUserExistsRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t"\x8b\x01\n\x17\x42\x61tchUserExistsResponse\x12\x41\n\x06\x65xists\x18\x01 \x03(\x0b\x32\x31.user_service.BatchUserExistsResponse.ExistsEntry\x1a-\n\x0b\x45xistsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x08:\x02\x38\x01":\n\x11WatchUsersRequest\x12\x16\n\x0e\x61\x66ter_sequence\x18\x01 \x01(\x03\x12\r\n\x05\x65poch\x18\x02 \x01(\t"\xfc\x01\n\nUserChange\x12+\n\x04kind\x18\x01 \x01(\x0e\x32\x1d.user_service.UserChange.Kind\x12\x10\n\x08sequence\x18\x02 \x01(\x03\x12\x10\n\x08user_ids\x18\x03 \x03(\t\x12\x19\n\x11snapshot_complete\x18\x04 \x01(\x08\x12\x15\n\rhead_sequence\x18\x05 \x01(\x03\x12\x14\n\x0ctimestamp_ms\x18\x06 \x01(\x03\x12\r\n\x05\x65poch\x18\x07 \x01(\t"F\n\x04Kind\x12\x14\n\x10KIND_UNSPECIFIED\x10\x00\x12\x0c\n\x08SNAPSHOT\x10\x01\x12\x0b\n\x07\x43REATED\x10\x02\x12\r\n\tHEARTBEAT\x10\x03"A\n\x19GetUserBloomFilterRequest\x12\x15\n\rknown_version\x18\x01 \x01(\x03\x12\r\n\x05\x65poch\x18\x02 \x01(\t"W\n\x0fUserBloomFilter\x12\x0e\n\x06\x66ilter\x18\x01 \x01(\x0c\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12\r\n\x05\x65poch\x18\x03 \x01(\t\x12\x14\n\x0cnot_modified\x18\x04 \x01(\x08"\xda\x01\n\x13\x43reateUsersResponse\x12\x0f\n\x07\x63reated\x18\x01 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x02 \x01(\x05\x12\x10\n\x08user_ids\x18\x03 \x03(\t\x12;\n\x06\x65rrors\x18\x04 \x03(\x0b\x32+.user_service.CreateUsersResponse.ItemError\x12\x18\n\x10users_per_second\x18\x05 \x01(\x01\x1a\x39\n\tItemError\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t2\x99\x07\n\x0bUserService\x12\x43\n\nCreateUser\x12\x1f.user_service.UserCreateRequest\x1a\x12.user_service.User"\x00\x12=\n\x07GetUser\x12\x1c.user_service.GetUserRequest\x1a\x12.user_service.User"\x00\x12K\n\x0eGetUserByEmail\x12#.user_service.GetUserByEmailRequest\x1a\x12.user_service.User"\x00\x12N\n\tListUsers\x12\x1e.user_service.ListUsersRequest\x1a\x1f.user_service.ListUsersResponse"\x00\x12T\n\x0bStreamUsers\x12 .user_service.StreamUsersRequest\x1a\x1f.user_service.ListUsersResponse"\x00\x30\x01\x12Z\n\rBatchGetUsers\x12".user_service.BatchGetUsersRequest\x1a#.user_service.BatchGetUsersResponse"\x00\x12Q\n\nUserExists\x12\x1f.user_service.UserExistsRequest\x1a .user_service.UserExistsResponse"\x00\x12`\n\x0f\x42\x61tchUserExists\x12$.user_service.BatchUserExistsRequest\x1a%.user_service.BatchUserExistsResponse"\x00\x12K\n\nWatchUsers\x12\x1f.user_service.WatchUsersRequest\x1a\x18.user_service.UserChange"\x00\x30\x01\x12^\n\x12GetUserBloomFilter\x12\'.user_service.GetUserBloomFilterRequest\x1a\x1d.user_service.UserBloomFilter"\x00\x12U\n\x0b\x43reateUsers\x12\x1f.user_service.UserCreateRequest\x1a!.user_service.CreateUsersResponse"\x00(\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -27,20 +30,52 @@ _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "user_pb2", _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
-    _globals["_USERCREATEREQUEST"]._serialized_start = 28
-    _globals["_USERCREATEREQUEST"]._serialized_end = 76
-    _globals["_USER"]._serialized_start = 78
-    _globals["_USER"]._serialized_end = 125
-    _globals["_GETUSERREQUEST"]._serialized_start = 127
-    _globals["_GETUSERREQUEST"]._serialized_end = 160
-    _globals["_LISTUSERSREQUEST"]._serialized_start = 162
-    _globals["_LISTUSERSREQUEST"]._serialized_end = 180
-    _globals["_LISTUSERSRESPONSE"]._serialized_start = 182
-    _globals["_LISTUSERSRESPONSE"]._serialized_end = 236
-    _globals["_USEREXISTSREQUEST"]._serialized_start = 238
-    _globals["_USEREXISTSREQUEST"]._serialized_end = 274
-    _globals["_USEREXISTSRESPONSE"]._serialized_start = 276
-    _globals["_USEREXISTSRESPONSE"]._serialized_end = 312
-    _globals["_USERSERVICE"]._serialized_start = 315
-    _globals["_USERSERVICE"]._serialized_end = 623
+    _globals["_BATCHUSEREXISTSRESPONSE_EXISTSENTRY"]._loaded_options = None
+    _globals["_BATCHUSEREXISTSRESPONSE_EXISTSENTRY"]._serialized_options = b"8\001"
+    _globals["_USERCREATEREQUEST"]._serialized_start = 62
+    _globals["_USERCREATEREQUEST"]._serialized_end = 110
+    _globals["_USER"]._serialized_start = 112
+    _globals["_USER"]._serialized_end = 159
+    _globals["_GETUSERREQUEST"]._serialized_start = 161
+    _globals["_GETUSERREQUEST"]._serialized_end = 241
+    _globals["_GETUSERBYEMAILREQUEST"]._serialized_start = 243
+    _globals["_GETUSERBYEMAILREQUEST"]._serialized_end = 328
+    _globals["_LISTUSERSREQUEST"]._serialized_start = 330
+    _globals["_LISTUSERSREQUEST"]._serialized_end = 434
+    _globals["_LISTUSERSRESPONSE"]._serialized_start = 436
+    _globals["_LISTUSERSRESPONSE"]._serialized_end = 515
+    _globals["_STREAMUSERSREQUEST"]._serialized_start = 517
+    _globals["_STREAMUSERSREQUEST"]._serialized_end = 624
+    _globals["_BATCHGETUSERSREQUEST"]._serialized_start = 626
+    _globals["_BATCHGETUSERSREQUEST"]._serialized_end = 713
+    _globals["_BATCHGETUSERSRESPONSE"]._serialized_start = 716
+    _globals["_BATCHGETUSERSRESPONSE"]._serialized_end = 871
+    _globals["_BATCHGETUSERSRESPONSE_RESULT"]._serialized_start = 802
+    _globals["_BATCHGETUSERSRESPONSE_RESULT"]._serialized_end = 871
+    _globals["_USEREXISTSREQUEST"]._serialized_start = 873
+    _globals["_USEREXISTSREQUEST"]._serialized_end = 909
+    _globals["_USEREXISTSRESPONSE"]._serialized_start = 911
+    _globals["_USEREXISTSRESPONSE"]._serialized_end = 947
+    _globals["_BATCHUSEREXISTSREQUEST"]._serialized_start = 949
+    _globals["_BATCHUSEREXISTSREQUEST"]._serialized_end = 991
+    _globals["_BATCHUSEREXISTSRESPONSE"]._serialized_start = 994
+    _globals["_BATCHUSEREXISTSRESPONSE"]._serialized_end = 1133
+    _globals["_BATCHUSEREXISTSRESPONSE_EXISTSENTRY"]._serialized_start = 1088
+    _globals["_BATCHUSEREXISTSRESPONSE_EXISTSENTRY"]._serialized_end = 1133
+    _globals["_WATCHUSERSREQUEST"]._serialized_start = 1135
+    _globals["_WATCHUSERSREQUEST"]._serialized_end = 1193
+    _globals["_USERCHANGE"]._serialized_start = 1196
+    _globals["_USERCHANGE"]._serialized_end = 1448
+    _globals["_USERCHANGE_KIND"]._serialized_start = 1378
+    _globals["_USERCHANGE_KIND"]._serialized_end = 1448
+    _globals["_GETUSERBLOOMFILTERREQUEST"]._serialized_start = 1450
+    _globals["_GETUSERBLOOMFILTERREQUEST"]._serialized_end = 1515
+    _globals["_USERBLOOMFILTER"]._serialized_start = 1517
+    _globals["_USERBLOOMFILTER"]._serialized_end = 1604
+    _globals["_CREATEUSERSRESPONSE"]._serialized_start = 1607
+    _globals["_CREATEUSERSRESPONSE"]._serialized_end = 1825
+    _globals["_CREATEUSERSRESPONSE_ITEMERROR"]._serialized_start = 1768
+    _globals["_CREATEUSERSRESPONSE_ITEMERROR"]._serialized_end = 1825
+    _globals["_USERSERVICE"]._serialized_start = 1828
+    _globals["_USERSERVICE"]._serialized_end = 2749
 # @@protoc_insertion_point(module_scope)
@@ -48,25 +48,67 @@ class UserServiceStub(object):
             response_deserializer=user__pb2.User.FromString,
             _registered_method=True,
         )
+        self.GetUserByEmail = channel.unary_unary(
+            "/user_service.UserService/GetUserByEmail",
+            request_serializer=user__pb2.GetUserByEmailRequest.SerializeToString,
+            response_deserializer=user__pb2.User.FromString,
+            _registered_method=True,
+        )
         self.ListUsers = channel.unary_unary(
             "/user_service.UserService/ListUsers",
             request_serializer=user__pb2.ListUsersRequest.SerializeToString,
             response_deserializer=user__pb2.ListUsersResponse.FromString,
             _registered_method=True,
         )
+        self.StreamUsers = channel.unary_stream(
+            "/user_service.UserService/StreamUsers",
+            request_serializer=user__pb2.StreamUsersRequest.SerializeToString,
+            response_deserializer=user__pb2.ListUsersResponse.FromString,
+            _registered_method=True,
+        )
+        self.BatchGetUsers = channel.unary_unary(
+            "/user_service.UserService/BatchGetUsers",
+            request_serializer=user__pb2.BatchGetUsersRequest.SerializeToString,
+            response_deserializer=user__pb2.BatchGetUsersResponse.FromString,
+            _registered_method=True,
+        )
         self.UserExists = channel.unary_unary(
             "/user_service.UserService/UserExists",
             request_serializer=user__pb2.UserExistsRequest.SerializeToString,
             response_deserializer=user__pb2.UserExistsResponse.FromString,
             _registered_method=True,
         )
+        self.BatchUserExists = channel.unary_unary(
+            "/user_service.UserService/BatchUserExists",
+            request_serializer=user__pb2.BatchUserExistsRequest.SerializeToString,
+            response_deserializer=user__pb2.BatchUserExistsResponse.FromString,
+            _registered_method=True,
+        )
+        self.WatchUsers = channel.unary_stream(
+            "/user_service.UserService/WatchUsers",
+            request_serializer=user__pb2.WatchUsersRequest.SerializeToString,
+            response_deserializer=user__pb2.UserChange.FromString,
+            _registered_method=True,
+        )
+        self.GetUserBloomFilter = channel.unary_unary(
+            "/user_service.UserService/GetUserBloomFilter",
+            request_serializer=user__pb2.GetUserBloomFilterRequest.SerializeToString,
+            response_deserializer=user__pb2.UserBloomFilter.FromString,
+            _registered_method=True,
+        )
+        self.CreateUsers = channel.stream_unary(
+            "/user_service.UserService/CreateUsers",
+            request_serializer=user__pb2.UserCreateRequest.SerializeToString,
+            response_deserializer=user__pb2.CreateUsersResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class UserServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
     def CreateUser(self, request, context):
-        """Missing associated documentation comment in .proto file."""
+        """ALREADY_EXISTS if a user with the email exists."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
@@ -77,18 +119,60 @@ class UserServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def GetUserByEmail(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ListUsers(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamUsers(self, request, context):
+        """Every user in chunks; each chunk's next_page_token resumes after it."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def BatchGetUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def UserExists(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def BatchUserExists(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def WatchUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def GetUserBloomFilter(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def CreateUsers(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_UserServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -102,16 +186,51 @@ def add_UserServiceServicer_to_server(servicer, server):
             request_deserializer=user__pb2.GetUserRequest.FromString,
             response_serializer=user__pb2.User.SerializeToString,
         ),
+        "GetUserByEmail": grpc.unary_unary_rpc_method_handler(
+            servicer.GetUserByEmail,
+            request_deserializer=user__pb2.GetUserByEmailRequest.FromString,
+            response_serializer=user__pb2.User.SerializeToString,
+        ),
         "ListUsers": grpc.unary_unary_rpc_method_handler(
             servicer.ListUsers,
             request_deserializer=user__pb2.ListUsersRequest.FromString,
             response_serializer=user__pb2.ListUsersResponse.SerializeToString,
         ),
+        "StreamUsers": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamUsers,
+            request_deserializer=user__pb2.StreamUsersRequest.FromString,
+            response_serializer=user__pb2.ListUsersResponse.SerializeToString,
+        ),
+        "BatchGetUsers": grpc.unary_unary_rpc_method_handler(
+            servicer.BatchGetUsers,
+            request_deserializer=user__pb2.BatchGetUsersRequest.FromString,
+            response_serializer=user__pb2.BatchGetUsersResponse.SerializeToString,
+        ),
         "UserExists": grpc.unary_unary_rpc_method_handler(
             servicer.UserExists,
             request_deserializer=user__pb2.UserExistsRequest.FromString,
             response_serializer=user__pb2.UserExistsResponse.SerializeToString,
         ),
+        "BatchUserExists": grpc.unary_unary_rpc_method_handler(
+            servicer.BatchUserExists,
+            request_deserializer=user__pb2.BatchUserExistsRequest.FromString,
+            response_serializer=user__pb2.BatchUserExistsResponse.SerializeToString,
+        ),
+        "WatchUsers": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchUsers,
+            request_deserializer=user__pb2.WatchUsersRequest.FromString,
+            response_serializer=user__pb2.UserChange.SerializeToString,
+        ),
+        "GetUserBloomFilter": grpc.unary_unary_rpc_method_handler(
+            servicer.GetUserBloomFilter,
+            request_deserializer=user__pb2.GetUserBloomFilterRequest.FromString,
+            response_serializer=user__pb2.UserBloomFilter.SerializeToString,
+        ),
+        "CreateUsers": grpc.stream_unary_rpc_method_handler(
+            servicer.CreateUsers,
+            request_deserializer=user__pb2.UserCreateRequest.FromString,
+            response_serializer=user__pb2.CreateUsersResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "user_service.UserService", rpc_method_handlers
@@ -186,6 +305,36 @@ class UserService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def GetUserByEmail(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/user_service.UserService/GetUserByEmail",
+            user__pb2.GetUserByEmailRequest.SerializeToString,
+            user__pb2.User.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def ListUsers(
         request,
@@ -216,6 +365,66 @@ class UserService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def StreamUsers(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/user_service.UserService/StreamUsers",
+            user__pb2.StreamUsersRequest.SerializeToString,
+            user__pb2.ListUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def BatchGetUsers(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/user_service.UserService/BatchGetUsers",
+            user__pb2.BatchGetUsersRequest.SerializeToString,
+            user__pb2.BatchGetUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def UserExists(
         request,
@@ -245,3 +454,123 @@ class UserService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def BatchUserExists(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/user_service.UserService/BatchUserExists",
+            user__pb2.BatchUserExistsRequest.SerializeToString,
+            user__pb2.BatchUserExistsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def WatchUsers(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/user_service.UserService/WatchUsers",
+            user__pb2.WatchUsersRequest.SerializeToString,
+            user__pb2.UserChange.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def GetUserBloomFilter(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/user_service.UserService/GetUserBloomFilter",
+            user__pb2.GetUserBloomFilterRequest.SerializeToString,
+            user__pb2.UserBloomFilter.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def CreateUsers(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/user_service.UserService/CreateUsers",
+            user__pb2.UserCreateRequest.SerializeToString,
+            user__pb2.CreateUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
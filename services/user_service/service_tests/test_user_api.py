@@ -1,6 +1,11 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 from httpx._transports.asgi import ASGITransport
+from libs.common.bloom import BloomFilter
+from libs.common.codecs import PROTOBUF
+from services.user_service.app import user_pb2
 from services.user_service.app.main import create_app
 
 
@@ -27,3 +32,154 @@ async def test_create_and_get_user():
         r3 = await client.get("/users/")
         assert r3.status_code == 200
         assert len(r3.json()) >= 1
+
+
+@pytest.mark.asyncio
+async def test_bloom_filter_download_is_versioned():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post(
+            "/users/", json={"name": "Bloom", "email": "bloom@example.com"}
+        )
+        user_id = r.json()["id"]
+
+        r1 = await client.get("/bloom/users")
+        assert r1.status_code == 200
+        assert r1.headers["content-type"] == "application/octet-stream"
+        assert BloomFilter.from_bytes(r1.content).might_contain(user_id)
+
+        etag = r1.headers["etag"]
+        r2 = await client.get("/bloom/users", headers={"If-None-Match": etag})
+        assert r2.status_code == 304
+
+        await client.post(
+            "/users/", json={"name": "Bloom2", "email": "bloom2@example.com"}
+        )
+        r3 = await client.get("/bloom/users", headers={"If-None-Match": etag})
+        assert r3.status_code == 200
+        assert r3.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    items = [{"name": f"Bulk{i}", "email": f"bulk{i}@example.com"} for i in range(20)]
+    items += [
+        {"name": "Dup", "email": "BULK0@example.com"},
+        {"name": "Bad", "email": "not-an-email"},
+        {"email": "noname@example.com"},
+    ]
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/users/bulk", json=items)
+        assert r.status_code == 200
+        body = r.json()
+        assert body["created"] == 20 and body["failed"] == 3
+        assert body["users_per_second"] > 0
+        assert [res["status"] for res in body["results"][20:]] == [409, 422, 422]
+        assert body["results"][22]["error"].startswith("name:")
+
+        user_id = body["results"][5]["user"]["id"]
+        r2 = await client.get(f"/users/{user_id}")
+        assert r2.json()["email"] == "bulk5@example.com"
+
+
+@pytest.mark.asyncio
+async def test_list_users_ndjson():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.post("/users/", json={"name": "Nd", "email": "nd@example.com"})
+
+        r = await client.get("/users/", headers={"Accept": "application/x-ndjson"})
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        users = [json.loads(line) for line in r.text.splitlines()]
+        assert users[-1]["email"] == "nd@example.com"
+        assert len(users) == len({u["id"] for u in users})
+
+
+@pytest.mark.asyncio
+async def test_protobuf_content_negotiation():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    headers = {"Content-Type": PROTOBUF, "Accept": PROTOBUF}
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        body = user_pb2.UserCreateRequest(
+            name="Proto", email="proto@example.com"
+        ).SerializeToString()
+        r = await client.post("/users/", content=body, headers=headers)
+        assert r.status_code == 200
+        assert r.headers["content-type"] == PROTOBUF
+        created = user_pb2.User.FromString(r.content)
+        assert created.email == "proto@example.com"
+
+        r2 = await client.get(f"/users/{created.id}", headers={"Accept": PROTOBUF})
+        assert user_pb2.User.FromString(r2.content) == created
+
+        r3 = await client.get("/users/", params={"limit": 1}, headers=headers)
+        page = user_pb2.ListUsersResponse.FromString(r3.content)
+        assert len(page.users) == 1
+        assert page.next_page_token == r3.headers.get("x-next-page-token", "")
+
+
+@pytest.mark.asyncio
+async def test_email_is_unique_and_looked_up_case_insensitively():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post(
+            "/users/", json={"name": "Ivan", "email": "ivan@example.com"}
+        )
+        assert r.status_code == 200
+        user_id = r.json()["id"]
+
+        r2 = await client.post(
+            "/users/", json={"name": "Ivan2", "email": "IVAN@example.com"}
+        )
+        assert r2.status_code == 409
+
+        r3 = await client.get("/users/by-email/Ivan@Example.com")
+        assert r3.status_code == 200
+        assert r3.json()["id"] == user_id
+        r4 = await client.get("/users/by-email/nobody@example.com")
+        assert r4.status_code == 404
+
+        r5 = await client.post(
+            "/users/bulk",
+            json=[
+                {"name": "Again", "email": "ivan@example.com"},
+                {"name": "New", "email": "ivan-new@example.com"},
+            ],
+        )
+        results = r5.json()["results"]
+        assert results[0]["status"] == 409
+        assert results[1]["status"] == 200
+
+
+@pytest.mark.asyncio
+async def test_suggest_users_by_name_or_email_prefix():
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for name, email in (
+            ("Xavier Stone", "xs@example.com"),
+            ("xena Park", "park@example.com"),
+            ("Bob Xu", "xavier.bob@example.com"),
+            ("Carol", "carol@example.com"),
+        ):
+            r = await client.post("/users/", json={"name": name, "email": email})
+            assert r.status_code == 200
+
+        r = await client.get("/users/suggest", params={"prefix": "XA"})
+        assert r.status_code == 200
+        assert [u["name"] for u in r.json()] == ["Xavier Stone", "Bob Xu"]
+
+        r2 = await client.get(
+            "/users/suggest", params={"prefix": "x", "limit": 2, "fields": "name"}
+        )
+        assert r2.json() == [{"name": "Xavier Stone"}, {"name": "Bob Xu"}]
+
+        r3 = await client.get("/users/suggest", params={"prefix": "xs@"})
+        assert [u["name"] for u in r3.json()] == ["Xavier Stone"]
@@ -1,7 +1,10 @@
 import pytest
+from google.protobuf import field_mask_pb2
 from services.user_service.app.crud import UserRepository
 from services.user_service.app.grpc_service import UserServicer
 from services.user_service.app import user_pb2
+from libs.common.bloom import BloomFilter
+from libs.common.emails import DuplicateEmailError
 from libs.common.models import UserCreate
 
 
@@ -47,6 +50,25 @@ async def test_get_user_grpc(user_repo):
     assert response.email == "bob@example.com"
 
 
+@pytest.mark.asyncio
+async def test_get_user_by_email_grpc(user_repo):
+    """Emails are indexed case-insensitively and unique."""
+    servicer = UserServicer(user_repo)
+    user = await user_repo.create(UserCreate(name="Judy", email="judy@example.com"))
+
+    request = user_pb2.GetUserByEmailRequest(email=" JUDY@example.com")
+    response = await servicer.GetUserByEmail(request, None)
+    assert response.id == user.id
+
+    with pytest.raises(DuplicateEmailError):
+        await user_repo.create(UserCreate(name="Judy2", email="Judy@Example.com"))
+    with pytest.raises(DuplicateEmailError):
+        await user_repo.create_many(
+            [UserCreate(name="Judy3", email="judy@example.com")]
+        )
+    assert [u.name for u in await user_repo.list_all()].count("Judy3") == 0
+
+
 @pytest.mark.asyncio
 async def test_list_users_grpc(user_repo):
     """Test listing users via gRPC."""
@@ -82,3 +104,169 @@ async def test_user_exists_grpc(user_repo):
     request = user_pb2.UserExistsRequest(user_id="u_nonexistent")
     response = await servicer.UserExists(request, None)
     assert response.exists is False
+
+
+@pytest.mark.asyncio
+async def test_batch_user_exists_grpc(user_repo):
+    """Test checking many users in one gRPC call."""
+    servicer = UserServicer(user_repo)
+
+    frank = await user_repo.create(UserCreate(name="Frank", email="frank@example.com"))
+
+    request = user_pb2.BatchUserExistsRequest(
+        user_ids=[frank.id, "u_nonexistent", frank.id]
+    )
+    response = await servicer.BatchUserExists(request, None)
+
+    assert dict(response.exists) == {frank.id: True, "u_nonexistent": False}
+
+
+@pytest.mark.asyncio
+async def test_batch_get_users_grpc(user_repo):
+    """Test BatchGetUsers answers in request order with found markers."""
+    servicer = UserServicer(user_repo)
+
+    grace = await user_repo.create(UserCreate(name="Grace", email="grace@example.com"))
+
+    request = user_pb2.BatchGetUsersRequest(
+        user_ids=[grace.id, "u_nonexistent", grace.id]
+    )
+    response = await servicer.BatchGetUsers(request, None)
+
+    assert [(r.id, r.found) for r in response.results] == [
+        (grace.id, True),
+        ("u_nonexistent", False),
+        (grace.id, True),
+    ]
+    assert response.results[0].user.email == "grace@example.com"
+    assert not response.results[1].HasField("user")
+
+
+@pytest.mark.asyncio
+async def test_read_mask_grpc(user_repo):
+    """Test read_mask limits the fields set on returned users."""
+    servicer = UserServicer(user_repo)
+    user = await user_repo.create(UserCreate(name="Heidi", email="heidi@example.com"))
+    mask = field_mask_pb2.FieldMask(paths=["id", "name"])
+
+    got = await servicer.GetUser(
+        user_pb2.GetUserRequest(user_id=user.id, read_mask=mask), None
+    )
+    assert (got.id, got.name, got.email) == (user.id, "Heidi", "")
+
+    listed = await servicer.ListUsers(user_pb2.ListUsersRequest(read_mask=mask), None)
+    assert listed.users and all(u.email == "" and u.id for u in listed.users)
+
+
+@pytest.mark.asyncio
+async def test_watch_users_snapshot_then_changes(user_repo):
+    """Test WatchUsers sends a snapshot, then users created afterwards."""
+    servicer = UserServicer(user_repo)
+    servicer.watch_chunk_size = 2
+    ids = [
+        (await user_repo.create(UserCreate(name=f"W{i}", email=f"w{i}@example.com"))).id
+        for i in range(3)
+    ]
+
+    stream = servicer.WatchUsers(user_pb2.WatchUsersRequest(), None)
+    first = await stream.__anext__()
+    second = await stream.__anext__()
+    assert first.kind == second.kind == user_pb2.UserChange.SNAPSHOT
+    assert not first.snapshot_complete and second.snapshot_complete
+    assert list(first.user_ids) + list(second.user_ids) == ids
+    assert second.sequence == 3
+
+    later = await user_repo.create(UserCreate(name="Late", email="late@example.com"))
+    change = await stream.__anext__()
+    assert change.kind == user_pb2.UserChange.CREATED
+    assert list(change.user_ids) == [later.id]
+    assert change.sequence == change.head_sequence == 4
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_watch_users_resumes_after_sequence(user_repo):
+    """Test WatchUsers resumes without a snapshot in the same epoch."""
+    servicer = UserServicer(user_repo)
+    servicer.watch_heartbeat_seconds = 0.01
+    for i in range(3):
+        await user_repo.create(UserCreate(name=f"R{i}", email=f"r{i}@example.com"))
+
+    request = user_pb2.WatchUsersRequest(
+        after_sequence=2, epoch=user_repo.changes.epoch
+    )
+    stream = servicer.WatchUsers(request, None)
+    change = await stream.__anext__()
+    assert change.kind == user_pb2.UserChange.CREATED
+    assert change.sequence == 3 and len(change.user_ids) == 1
+    heartbeat = await stream.__anext__()
+    assert heartbeat.kind == user_pb2.UserChange.HEARTBEAT
+    assert heartbeat.sequence == 3
+    await stream.aclose()
+
+    stale = user_pb2.WatchUsersRequest(after_sequence=2, epoch="other")
+    stream = servicer.WatchUsers(stale, None)
+    assert (await stream.__anext__()).kind == user_pb2.UserChange.SNAPSHOT
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_user_bloom_filter_grpc():
+    """Test GetUserBloomFilter and that the filter grows past its capacity."""
+    repo = UserRepository(bloom_capacity=2, bloom_fp_rate=0.01)
+    servicer = UserServicer(repo)
+    ids = [
+        (await repo.create(UserCreate(name=f"B{i}", email=f"b{i}@example.com"))).id
+        for i in range(5)
+    ]
+    assert repo.bloom.capacity >= 5
+
+    response = await servicer.GetUserBloomFilter(
+        user_pb2.GetUserBloomFilterRequest(), None
+    )
+    bloom = BloomFilter.from_bytes(response.filter)
+    assert all(bloom.might_contain(user_id) for user_id in ids)
+    assert response.version == 5
+
+    again = await servicer.GetUserBloomFilter(
+        user_pb2.GetUserBloomFilterRequest(
+            known_version=response.version, epoch=response.epoch
+        ),
+        None,
+    )
+    assert again.not_modified and not again.filter
+
+
+@pytest.mark.asyncio
+async def test_create_users_stream_grpc(user_repo):
+    """Test CreateUsers ingests a client stream in batches."""
+    servicer = UserServicer(user_repo)
+    servicer.ingest_batch_size = 3
+    emails = ["s0@example.com", "s1@example.com", "bad", "S0@example.com"]
+    emails += [f"s{i}@example.com" for i in range(2, 6)]
+
+    async def records():
+        for i, email in enumerate(emails):
+            yield user_pb2.UserCreateRequest(name=f"S{i}", email=email)
+
+    response = await servicer.CreateUsers(records(), None)
+
+    assert response.created == 6 and response.failed == 2
+    assert [bool(uid) for uid in response.user_ids] == [
+        True,
+        True,
+        False,
+        False,
+        True,
+        True,
+        True,
+        True,
+    ]
+    assert [(e.index, e.code) for e in response.errors] == [
+        (2, "INVALID_ARGUMENT"),
+        (3, "ALREADY_EXISTS"),
+    ]
+    assert response.users_per_second > 0
+    assert user_repo.changes.last_sequence == 6
+    stored = await user_repo.get(response.user_ids[7])
+    assert stored.email == "s5@example.com"
@@ -1,4 +1,7 @@
-"""Test configuration that makes the project package importable during tests."""
+"""Test configuration that makes the project package importable during tests.
+
+Also provides shared fixtures for tests that need a live gRPC server.
+"""
 
 from pathlib import Path
 import sys
@@ -6,3 +9,30 @@ import sys
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+import grpc  # noqa: E402
+import pytest  # noqa: E402
+
+from libs.common.grpc_pool import close_channel_pools  # noqa: E402
+from services.user_service.app import user_pb2_grpc  # noqa: E402
+from services.user_service.app.crud import UserRepository  # noqa: E402
+from services.user_service.app.grpc_service import UserServicer  # noqa: E402
+
+
+@pytest.fixture
+async def user_grpc_server():
+    """Run a User service gRPC server on a free local port.
+
+    Yields:
+        Tuple of (UserRepository backing the server, "host:port" target).
+    """
+    repo = UserRepository()
+    server = grpc.aio.server()
+    user_pb2_grpc.add_UserServiceServicer_to_server(UserServicer(repo), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    try:
+        yield repo, f"127.0.0.1:{port}"
+    finally:
+        await close_channel_pools()
+        await server.stop(None)
@@ -0,0 +1,77 @@
+import pytest
+
+from libs.common.balancer import (
+    DnsResolver,
+    LoadBalancer,
+    StaticResolver,
+    make_resolver,
+)
+from libs.common.metrics import Metrics
+from libs.common.resilience import ServiceUnavailableError
+
+
+@pytest.mark.asyncio
+async def test_least_outstanding_spreads_concurrent_requests():
+    lb = LoadBalancer(StaticResolver(["a", "b"]), strategy="least_outstanding")
+    async with lb.endpoint() as first:
+        async with lb.endpoint() as second:
+            assert {first.address, second.address} == {"a", "b"}
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_is_ejected():
+    metrics = Metrics()
+    lb = LoadBalancer(
+        StaticResolver(["bad", "good"]),
+        max_failures=2,
+        ejection_time=60,
+        metrics=metrics,
+        name="lb",
+    )
+    await lb.refresh()
+    bad = lb.endpoints["bad"]
+    for _ in range(2):
+        lb.record_failure(bad)
+
+    assert [ep.address for ep in lb.available()] == ["good"]
+    assert all(lb.pick().address == "good" for _ in range(20))
+    assert metrics.counters["lb_ejections_total"] == 1
+    assert metrics.gauges["lb_endpoints_available"] == 1
+
+
+@pytest.mark.asyncio
+async def test_endpoint_context_records_service_failures():
+    lb = LoadBalancer(StaticResolver(["only"]), max_failures=1)
+    with pytest.raises(ServiceUnavailableError):
+        async with lb.endpoint():
+            raise ServiceUnavailableError("boom")
+    assert lb.available() == []
+    # with every replica out, requests still go somewhere
+    assert lb.pick().address == "only"
+
+
+@pytest.mark.asyncio
+async def test_health_probe_marks_endpoints_unhealthy():
+    async def health_check(address):
+        return address != "sick"
+
+    lb = LoadBalancer(StaticResolver(["sick", "fine"]), health_check=health_check)
+    await lb.refresh()
+    await lb.probe()
+    assert [ep.address for ep in lb.available()] == ["fine"]
+
+
+@pytest.mark.asyncio
+async def test_dns_resolver_caches_and_formats(monkeypatch):
+    resolver = make_resolver("dns://users.internal:8001", scheme="http")
+    assert isinstance(resolver, DnsResolver)
+    lookups = []
+
+    async def fake_lookup():
+        lookups.append(1)
+        return ["10.0.0.1", "fd00::2"]
+
+    monkeypatch.setattr(resolver, "_lookup", fake_lookup)
+    assert await resolver.resolve() == ["http://10.0.0.1:8001", "http://[fd00::2]:8001"]
+    await resolver.resolve()
+    assert len(lookups) == 1
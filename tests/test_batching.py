@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from libs.common.batching import MicroBatcher
+from libs.common.metrics import Metrics
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_groups_keys_in_window():
+    metrics = Metrics()
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        return {k: k.endswith("ok") for k in keys}
+
+    batcher = MicroBatcher(
+        batch_fn, max_batch_size=100, max_wait=0.005, metrics=metrics, name="b"
+    )
+    results = await asyncio.gather(
+        batcher.submit("u_1ok"), batcher.submit("u_2"), batcher.submit("u_1ok")
+    )
+
+    assert results == [True, False, True]
+    assert batches == [["u_1ok", "u_2"]]
+    assert metrics.counters["b_batches_total"] == 1
+    assert metrics.counters["b_keys_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_flushes_at_max_size_and_shares_errors():
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        raise RuntimeError("user service down")
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait=10)
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+    )
+
+    assert batches == [["a", "b"]]  # did not wait for the 10s window
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,35 @@
+import pytest
+
+from libs.common.bloom import BloomFilter
+
+
+def test_added_keys_are_always_found():
+    bloom = BloomFilter(capacity=1000, fp_rate=0.01)
+    keys = [f"u_{i:08x}" for i in range(1000)]
+    bloom.update(keys)
+    assert all(key in bloom for key in keys)
+    assert bloom.count == 1000
+
+
+def test_false_positive_rate_is_near_target():
+    bloom = BloomFilter(capacity=2000, fp_rate=0.01)
+    bloom.update(f"u_{i:08x}" for i in range(2000))
+    false_positives = sum(f"x_{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.02
+
+
+def test_round_trip_through_bytes():
+    bloom = BloomFilter(capacity=100, fp_rate=0.001)
+    bloom.update(["u_a", "u_b"])
+    copy = BloomFilter.from_bytes(bloom.to_bytes())
+    assert copy.might_contain("u_a") and copy.might_contain("u_b")
+    assert copy.count == 2
+    assert copy.to_bytes() == bloom.to_bytes()
+
+
+def test_malformed_bytes_are_rejected():
+    data = BloomFilter(capacity=100).to_bytes()
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(b"\x00")
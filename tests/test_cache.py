@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from libs.common.cache import TTLCache
+from libs.common.metrics import Metrics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_loader(answers):
+    calls = []
+
+    async def loader(key):
+        calls.append(key)
+        return answers[key]
+
+    return loader, calls
+
+
+@pytest.mark.asyncio
+async def test_positive_and_negative_ttls():
+    clock = FakeClock()
+    metrics = Metrics()
+    cache = TTLCache(
+        positive_ttl=100,
+        negative_ttl=5,
+        refresh_ahead=0,
+        jitter=0,
+        metrics=metrics,
+        name="users",
+        clock=clock,
+    )
+    loader, calls = make_loader({"u_1": True, "u_2": False})
+
+    assert await cache.get_or_load("u_1", loader) is True
+    assert await cache.get_or_load("u_2", loader) is False
+    assert await cache.get_or_load("u_1", loader) is True
+    assert calls == ["u_1", "u_2"]
+
+    clock.now = 10  # negative answer expired, positive still fresh
+    await cache.get_or_load("u_1", loader)
+    await cache.get_or_load("u_2", loader)
+    assert calls == ["u_1", "u_2", "u_2"]
+
+    counters = metrics.snapshot()["counters"]
+    assert counters["users_hits_total"] == 2
+    assert counters["users_misses_total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    metrics = Metrics()
+    cache = TTLCache(max_size=2, metrics=metrics, name="users")
+    cache.put("a", True)
+    cache.put("b", True)
+    assert cache.get("a") is True  # "a" becomes most recently used
+    cache.put("c", True)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is True and cache.get("c") is True
+    assert metrics.counters["users_evictions_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_ahead_reloads_in_background():
+    clock = FakeClock()
+    cache = TTLCache(positive_ttl=100, refresh_ahead=0.2, jitter=0, clock=clock)
+    loader, calls = make_loader({"u_1": True})
+    await cache.get_or_load("u_1", loader)
+
+    clock.now = 90  # inside the last 20% of the entry's life
+    assert await cache.get_or_load("u_1", loader) is True
+    await asyncio.sleep(0)
+    assert calls == ["u_1", "u_1"]
+
+    clock.now = 150  # refreshed entry lives until 190
+    assert cache.get("u_1") is True
@@ -0,0 +1,82 @@
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient
+from httpx._transports.asgi import ASGITransport
+
+from libs.common import codecs
+from libs.common.codecs import (
+    MSGPACK,
+    PROTOBUF,
+    from_message,
+    negotiate,
+    parse_body,
+    to_message,
+)
+from libs.common.models import Product, ProductCreate
+from services.product_service.app import product_pb2
+
+
+def test_negotiate():
+    assert negotiate(PROTOBUF) == PROTOBUF
+    if codecs.msgpack is not None:
+        assert negotiate("application/msgpack;q=0.9, application/json") == MSGPACK
+    assert negotiate("application/json, application/x-protobuf") is None
+    assert negotiate("*/*") is None
+    assert negotiate(None) is None
+
+
+def test_message_round_trip_leaves_none_unset():
+    product = Product(id="p_1", name="Lamp", price=9.5)
+    message = to_message(product, product_pb2.Product)
+    assert not message.HasField("user_id")
+    assert from_message(message) == {"id": "p_1", "name": "Lamp", "price": 9.5}
+    assert to_message(product, product_pb2.Product, ["name"]).id == ""
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+
+    @app.post("/")
+    async def create(
+        payload: ProductCreate = Depends(
+            parse_body(ProductCreate, product_pb2.ProductCreateRequest)
+        )
+    ):
+        return payload
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_parse_body_formats(client):
+    msgpack = pytest.importorskip("msgpack")
+    expected = {"name": "Lamp", "price": 9.5, "user_id": None}
+    bodies = {
+        "application/json": b'{"name": "Lamp", "price": 9.5}',
+        PROTOBUF: product_pb2.ProductCreateRequest(
+            name="Lamp", price=9.5
+        ).SerializeToString(),
+        MSGPACK: msgpack.packb({"name": "Lamp", "price": 9.5}),
+    }
+    for content_type, body in bodies.items():
+        r = await client.post("/", content=body, headers={"content-type": content_type})
+        assert r.status_code == 200, content_type
+        assert r.json() == expected
+
+
+@pytest.mark.asyncio
+async def test_parse_body_errors(client):
+    msgpack = pytest.importorskip("msgpack")
+    r = await client.post("/", content=b"x", headers={"content-type": "text/plain"})
+    assert r.status_code == 415
+    r = await client.post("/", content=b"\xff\xff", headers={"content-type": PROTOBUF})
+    assert r.status_code == 400
+    r = await client.post(
+        "/", content=msgpack.packb({"name": "Lamp"}), headers={"content-type": MSGPACK}
+    )
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "price"]
@@ -0,0 +1,33 @@
+import pytest
+from google.protobuf.field_mask_pb2 import FieldMask
+
+from libs.common.fields import mask_fields, parse_fields, project
+from libs.common.models import Product
+from services.product_service.app import product_pb2
+
+
+def test_parse_fields_keeps_model_order():
+    assert parse_fields(["price,id", " name "], Product) == ["name", "price", "id"]
+    assert parse_fields(None, Product) is None
+    assert parse_fields([","], Product) is None
+
+
+def test_parse_fields_rejects_unknown():
+    with pytest.raises(ValueError, match="unknown fields: secret"):
+        parse_fields(["id,secret"], Product)
+
+
+def test_mask_fields():
+    descriptor = product_pb2.Product.DESCRIPTOR
+    assert mask_fields(FieldMask(), descriptor) is None
+    assert mask_fields(FieldMask(paths=["id", "name", "id"]), descriptor) == [
+        "id",
+        "name",
+    ]
+    with pytest.raises(ValueError):
+        mask_fields(FieldMask(paths=["owner"]), descriptor)
+
+
+def test_project_reads_only_selected_fields():
+    product = Product(id="p_1", name="Lamp", price=9.5, user_id=None)
+    assert project(product, ["id", "user_id"]) == {"id": "p_1", "user_id": None}
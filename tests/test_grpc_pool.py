@@ -0,0 +1,43 @@
+import pytest
+
+from libs.common.grpc_pool import GrpcChannelPool, get_channel_pool
+from libs.common.http_client import check_user_exists_grpc, check_users_exist_grpc
+from libs.common.metrics import Metrics
+from libs.common.models import UserCreate
+from services.user_service.app import user_pb2_grpc
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_round_robins_and_caches_stubs(user_grpc_server):
+    _, target = user_grpc_server
+    metrics = Metrics()
+    pool = GrpcChannelPool(target, size=2, metrics=metrics, name="users")
+    try:
+        assert await pool.warm_up(timeout=2.0)
+        assert metrics.gauges["users_channels_ready"] == 2
+
+        stubs = [pool.stub(user_pb2_grpc.UserServiceStub) for _ in range(4)]
+        assert stubs[0] is not stubs[1]
+        assert stubs[0] is stubs[2] and stubs[1] is stubs[3]
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_check_user_exists_grpc_uses_shared_pool(user_grpc_server):
+    repo, target = user_grpc_server
+    user = await repo.create(UserCreate(name="G", email="g@example.com"))
+
+    assert await check_user_exists_grpc(user.id, target) is True
+    assert await check_user_exists_grpc("u_missing", target) is False
+    # the same process-wide pool serves every call to the target
+    assert get_channel_pool(target) is get_channel_pool(target)
+
+
+@pytest.mark.asyncio
+async def test_check_users_exist_grpc_batches_lookups(user_grpc_server):
+    repo, target = user_grpc_server
+    user = await repo.create(UserCreate(name="B", email="b@example.com"))
+
+    exists = await check_users_exist_grpc([user.id, "u_missing", user.id], target)
+    assert exists == {user.id: True, "u_missing": False}
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from libs.common.hedging import Hedger, LatencyTracker
+from libs.common.metrics import Metrics
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=100)
+    for ms in range(1, 101):
+        tracker.record(ms / 1000)
+    assert tracker.percentile(0.95) == pytest.approx(0.096)
+
+
+@pytest.mark.asyncio
+async def test_slow_first_request_is_hedged_and_loser_cancelled():
+    metrics = Metrics()
+    hedger = Hedger(min_delay=0.01, max_delay=0.01, metrics=metrics, name="h")
+    started = []
+    cancelled = []
+
+    async def lookup():
+        attempt = len(started)
+        started.append(attempt)
+        try:
+            await asyncio.sleep(1.0 if attempt == 0 else 0.001)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    assert await hedger.call(lookup) == 1
+    await asyncio.sleep(0)
+    assert cancelled == [0]
+    assert metrics.counters["h_hedges_total"] == 1
+    assert metrics.counters["h_hedge_wins_total"] == 1
+    assert metrics.gauges["h_win_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_fast_request_is_not_hedged():
+    metrics = Metrics()
+    hedger = Hedger(min_delay=0.05, max_delay=0.05, metrics=metrics, name="h")
+
+    async def lookup():
+        return True
+
+    assert await hedger.call(lookup) is True
+    assert "h_hedges_total" not in metrics.counters
+    assert metrics.gauges["h_hedge_rate"] == 0.0
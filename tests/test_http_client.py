@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+import pytest
+
+from libs.common.http_client import PooledHttpClient, SingleFlight, check_user_exists
+from libs.common.metrics import Metrics
+from libs.common.resilience import ServiceUnavailableError
+
+
+async def _start_keepalive_server():
+    """Start a tiny HTTP/1.1 server that answers every request with 200."""
+
+    async def handle(reader, writer):
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                b"Content-Type: application/json\r\n\r\n{}"
+            )
+            await writer.drain()
+
+    async def safe_handle(reader, writer):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(safe_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_connection():
+    server, base_url = await _start_keepalive_server()
+    metrics = Metrics()
+    client = PooledHttpClient(metrics=metrics, name="test_http")
+    try:
+        for _ in range(3):
+            r = await client.get(f"{base_url}/health")
+            assert r.status_code == 200
+    finally:
+        await client.aclose()
+        server.close()
+        await server.wait_closed()
+
+    counters = metrics.snapshot()["counters"]
+    assert counters["test_http_requests_total"] == 3
+    assert counters["test_http_connections_opened_total"] == 1
+    assert metrics.gauges["test_http_in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_collapses_concurrent_calls():
+    metrics = Metrics()
+    flight = SingleFlight(metrics=metrics, name="sf")
+    calls = []
+
+    async def lookup():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return True
+
+    results = await asyncio.gather(*(flight.do("u_1", lookup) for _ in range(50)))
+
+    assert results == [True] * 50
+    assert len(calls) == 1
+    assert metrics.counters["sf_leaders_total"] == 1
+    assert metrics.counters["sf_collapsed_total"] == 49
+
+    # a finished call is not remembered
+    assert await flight.do("u_1", lookup) is True
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors():
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("user service down")
+
+    results = await asyncio.gather(
+        *(flight.do("u_1", failing) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_check_user_exists_treats_client_errors_as_missing():
+    statuses = {"u_ok": 200, "u_gone": 404, "suggest": 422, "busy": 429, "boom": 503}
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(statuses[request.url.path.rsplit("/", 1)[1]])
+    )
+    client = PooledHttpClient(transport=transport)
+    try:
+        assert await check_user_exists("u_ok", "http://users", client) is True
+        assert await check_user_exists("u_gone", "http://users", client) is False
+        assert await check_user_exists("suggest", "http://users", client) is False
+        for user_id in ("", ".", "..", "by-email/a@example.com"):
+            assert await check_user_exists(user_id, "http://users", client) is False
+        for user_id in ("busy", "boom"):
+            with pytest.raises(ServiceUnavailableError):
+                await check_user_exists(user_id, "http://users", client)
+    finally:
+        await client.aclose()
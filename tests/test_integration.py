@@ -1,8 +1,16 @@
+import asyncio
+
+import httpx
 import pytest
 from httpx import AsyncClient
 from httpx._transports.asgi import ASGITransport
 from services.user_service.app.main import create_app as create_user_app
 from services.product_service.app.main import create_app as create_product_app
+from libs.common.http_client import PooledHttpClient
+from libs.common.metrics import Metrics
+from libs.common.models import UserCreate
+from services.product_service.app.config import Settings
+from services.product_service.app.user_lookup import UserLookup
 
 
 @pytest.mark.asyncio
@@ -39,3 +47,294 @@ async def test_create_user_and_product_and_list_them():
 
             lp = await product_client.get("/products/")
             assert any(p["id"] == pid for p in lp.json())
+
+
+@pytest.mark.asyncio
+async def test_create_product_validates_owner_through_pooled_client():
+    user_app = create_user_app()
+    product_app = create_product_app()
+    # route the product service's pooled client to the in-process user app
+    product_app.state.user_lookup.http_client = PooledHttpClient(
+        transport=ASGITransport(app=user_app),
+        metrics=product_app.state.metrics,
+        name="user_service_http",
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=user_app), base_url="http://user"
+    ) as user_client:
+        async with AsyncClient(
+            transport=ASGITransport(app=product_app), base_url="http://product"
+        ) as product_client:
+            rr = await user_client.post(
+                "/users/", json={"name": "I2", "email": "i2@example.com"}
+            )
+            uid = rr.json()["id"]
+
+            ok = await product_client.post(
+                "/products/", json={"name": "P2", "price": 2.5, "user_id": uid}
+            )
+            assert ok.status_code == 200
+            assert ok.json()["user_id"] == uid
+
+            bad = await product_client.post(
+                "/products/", json={"name": "P3", "price": 3.5, "user_id": "u_nope"}
+            )
+            assert bad.status_code == 422
+
+            metrics = (await product_client.get("/metrics")).json()
+            assert metrics["counters"]["user_service_http_requests_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_owner_ids_cannot_reach_other_user_routes():
+    user_app = create_user_app()
+    product_app = create_product_app()
+    product_app.state.user_lookup.http_client = PooledHttpClient(
+        transport=ASGITransport(app=user_app)
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=product_app), base_url="http://product"
+    ) as product_client:
+        for user_id in ("bloom", "suggest", "bulk", ".", "?", "by-email/x@y.z"):
+            r = await product_client.post(
+                "/products/", json={"name": "P", "price": 1.0, "user_id": user_id}
+            )
+            assert r.status_code == 422, user_id
+
+
+@pytest.mark.asyncio
+async def test_create_product_validates_owner_over_grpc(user_grpc_server):
+    user_repo, target = user_grpc_server
+    user = await user_repo.create(UserCreate(name="G2", email="g2@example.com"))
+    product_app = create_product_app(
+        Settings(user_lookup_transport="grpc", user_service_grpc_target=target)
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=product_app), base_url="http://product"
+    ) as product_client:
+        ok = await product_client.post(
+            "/products/", json={"name": "G", "price": 1.0, "user_id": user.id}
+        )
+        assert ok.status_code == 200
+
+        bad = await product_client.post(
+            "/products/", json={"name": "G", "price": 1.0, "user_id": "u_nope"}
+        )
+        assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_unreachable_user_service_is_503_not_422():
+    product_app = create_product_app(
+        Settings(
+            user_lookup_max_attempts=2,
+            user_lookup_retry_base_delay=0.001,
+            user_breaker_failure_threshold=2,
+        )
+    )
+
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    product_app.state.user_lookup.http_client = PooledHttpClient(
+        transport=httpx.MockTransport(refuse)
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=product_app), base_url="http://product"
+    ) as product_client:
+        r = await product_client.post(
+            "/products/", json={"name": "P", "price": 1.0, "user_id": "u_down"}
+        )
+        assert r.status_code == 503
+
+        # the breaker is now open: fail fast without another attempt
+        r2 = await product_client.post(
+            "/products/", json={"name": "P", "price": 1.0, "user_id": "u_down2"}
+        )
+        assert r2.status_code == 503
+
+        counters = (await product_client.get("/metrics")).json()["counters"]
+        assert counters["user_lookup_attempts_total"] == 2
+        assert counters["user_service_breaker_rejected_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_user_checks_avoid_a_dead_replica():
+    user_app = create_user_app()
+    product_app = create_product_app(
+        Settings(
+            user_service_url="http://dead:8001,http://live:8001",
+            user_lb_max_failures=1,
+            user_lookup_retry_base_delay=0.001,
+            user_cache_size=0,
+        )
+    )
+    live = ASGITransport(app=user_app)
+
+    async def route(request):
+        if request.url.host == "dead":
+            raise httpx.ConnectError("connection refused", request=request)
+        return await live.handle_async_request(request)
+
+    product_app.state.user_lookup.http_client = PooledHttpClient(
+        transport=httpx.MockTransport(route)
+    )
+
+    async with AsyncClient(transport=live, base_url="http://user") as user_client:
+        uid = (
+            await user_client.post(
+                "/users/", json={"name": "LB", "email": "lb@example.com"}
+            )
+        ).json()["id"]
+        async with AsyncClient(
+            transport=ASGITransport(app=product_app), base_url="http://product"
+        ) as product_client:
+            for _ in range(5):
+                r = await product_client.post(
+                    "/products/", json={"name": "P", "price": 1.0, "user_id": uid}
+                )
+                assert r.status_code == 200
+
+            counters = (await product_client.get("/metrics")).json()["counters"]
+            assert counters.get("user_lookup_retries_total", 0) <= 1
+
+
+@pytest.mark.asyncio
+async def test_user_replica_follows_watch_stream(user_grpc_server):
+    user_repo, target = user_grpc_server
+    before = await user_repo.create(UserCreate(name="Rep", email="rep@example.com"))
+    metrics = Metrics()
+    lookup = UserLookup(
+        Settings(user_replica_target=target, user_service_url="http://unused:1"),
+        metrics=metrics,
+    )
+    await lookup.replica.start()
+    try:
+        await asyncio.wait_for(lookup.replica.ready.wait(), 5)
+        assert await lookup.exists(before.id)
+
+        after = await user_repo.create(
+            UserCreate(name="Rep2", email="rep2@example.com")
+        )
+        for _ in range(100):
+            if lookup.replica.contains(after.id):
+                break
+            await asyncio.sleep(0.01)
+        assert await lookup.exists(after.id)
+        assert metrics.counters["user_replica_hits_total"] == 2
+        assert (
+            metrics.gauges["user_replica_sequence"] == user_repo.changes.last_sequence
+        )
+        assert metrics.gauges["user_replica_lag_sequences"] == 0
+    finally:
+        await lookup.replica.stop()
+
+
+@pytest.mark.asyncio
+async def test_bloom_filter_rejects_unknown_users_locally():
+    user_app = create_user_app()
+    product_app = create_product_app(
+        Settings(
+            user_service_url="http://user",
+            user_bloom=True,
+            user_cache_size=0,
+        )
+    )
+    live = ASGITransport(app=user_app)
+    paths = []
+
+    async def route(request):
+        paths.append(request.url.path)
+        return await live.handle_async_request(request)
+
+    product_app.state.user_lookup.http_client = PooledHttpClient(
+        transport=httpx.MockTransport(route)
+    )
+
+    async with AsyncClient(transport=live, base_url="http://user") as user_client:
+        uid = (
+            await user_client.post(
+                "/users/", json={"name": "BF", "email": "bf@example.com"}
+            )
+        ).json()["id"]
+        async with AsyncClient(
+            transport=ASGITransport(app=product_app), base_url="http://product"
+        ) as product_client:
+            for _ in range(3):
+                bad = await product_client.post(
+                    "/products/", json={"name": "P", "price": 1.0, "user_id": "u_bad"}
+                )
+                assert bad.status_code == 422
+            # the filter fetched for the first create answers the others
+            assert paths == ["/bloom/users"]
+
+            ok = await product_client.post(
+                "/products/", json={"name": "P", "price": 1.0, "user_id": uid}
+            )
+            assert ok.status_code == 200
+            assert paths == ["/bloom/users", f"/users/{uid}"]
+
+            # a stale filter is refetched before a user is rejected
+            lookup = product_app.state.user_lookup
+            lookup.bloom.negative_max_age = 0
+            late = (
+                await user_client.post(
+                    "/users/", json={"name": "BF2", "email": "bf2@example.com"}
+                )
+            ).json()["id"]
+            r = await product_client.post(
+                "/products/", json={"name": "P", "price": 1.0, "user_id": late}
+            )
+            assert r.status_code == 200
+
+            counters = (await product_client.get("/metrics")).json()["counters"]
+            assert counters["user_bloom_rejects_total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_checks_each_owner_once():
+    user_app = create_user_app()
+    product_app = create_product_app(
+        Settings(user_service_url="http://user", user_cache_size=0)
+    )
+    live = ASGITransport(app=user_app)
+    paths = []
+
+    async def route(request):
+        paths.append(request.url.path)
+        return await live.handle_async_request(request)
+
+    product_app.state.user_lookup.http_client = PooledHttpClient(
+        transport=httpx.MockTransport(route)
+    )
+
+    async with AsyncClient(transport=live, base_url="http://user") as user_client:
+        uid = (
+            await user_client.post(
+                "/users/", json={"name": "Bulk", "email": "bulk@example.com"}
+            )
+        ).json()["id"]
+        items = [{"name": f"P{i}", "price": i, "user_id": uid} for i in range(50)]
+        items += [
+            {"name": "orphan", "price": 1.0, "user_id": "u_missing"},
+            {"name": "bad price", "price": "cheap"},
+            {"name": "no owner", "price": 2.0},
+        ]
+        async with AsyncClient(
+            transport=ASGITransport(app=product_app), base_url="http://product"
+        ) as product_client:
+            r = await product_client.post("/products/bulk", json=items)
+            assert r.status_code == 200
+            body = r.json()
+
+    assert body["created"] == 51 and body["failed"] == 2
+    statuses = [result["status"] for result in body["results"]]
+    assert statuses == [200] * 50 + [422, 422, 200]
+    assert body["results"][50]["error"] == "user not found"
+    assert body["results"][51]["error"].startswith("price:")
+    assert body["results"][0]["product"]["user_id"] == uid
+    assert sorted(paths) == sorted([f"/users/{uid}", "/users/u_missing"])
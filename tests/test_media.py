@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from libs.common.media import NDJSON, ndjson_response, wants_ndjson
+from libs.common.models import Product
+from libs.common.pagination import InsertionIndex, InvalidCursorError, encode_cursor
+
+
+def test_wants_ndjson_parses_accept():
+    assert wants_ndjson("application/x-ndjson")
+    assert wants_ndjson("text/html, application/x-ndjson;q=0.9")
+    assert not wants_ndjson("application/json")
+    assert not wants_ndjson(None)
+
+
+def make_repo(n):
+    products = {f"p_{i}": Product(id=f"p_{i}", name=f"N{i}", price=i) for i in range(n)}
+    index = InsertionIndex()
+    index.extend(products)
+    reads = []
+
+    async def list_page(limit, after):
+        keys, more = index.page(after, limit)
+        reads.append(len(keys))
+        return [products[k] for k in keys], more
+
+    return list_page, reads
+
+
+async def collect(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.asyncio
+async def test_streams_one_object_per_line_in_chunks():
+    list_page, reads = make_repo(12)
+    response = await ndjson_response(list_page, chunk_size=5)
+    assert response.media_type == NDJSON
+
+    lines = (await collect(response)).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [f"p_{i}" for i in range(12)]
+    assert reads == [5, 5, 2]
+
+
+@pytest.mark.asyncio
+async def test_after_and_limit():
+    list_page, reads = make_repo(12)
+    response = await ndjson_response(
+        list_page, after=encode_cursor("p_2"), limit=4, chunk_size=5
+    )
+    lines = (await collect(response)).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["p_3", "p_4", "p_5", "p_6"]
+    assert reads == [4]
+
+
+@pytest.mark.asyncio
+async def test_bad_token_fails_before_streaming():
+    list_page, _ = make_repo(1)
+    with pytest.raises(InvalidCursorError):
+        await ndjson_response(list_page, after=encode_cursor("p_missing"))
+
+
+@pytest.mark.asyncio
+async def test_fields_projection():
+    list_page, _ = make_repo(2)
+    response = await ndjson_response(list_page, fields=["id", "name"])
+    lines = (await collect(response)).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": "p_0", "name": "N0"},
+        {"id": "p_1", "name": "N1"},
+    ]
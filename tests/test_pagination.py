@@ -0,0 +1,60 @@
+import pytest
+
+from libs.common.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InsertionIndex,
+    InvalidCursorError,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+)
+
+
+def test_pages_follow_insertion_order():
+    index = InsertionIndex()
+    index.extend(f"k{i}" for i in range(5))
+
+    assert index.page(None, 2) == (["k0", "k1"], "k1")
+    assert index.page("k1", 2) == (["k2", "k3"], "k3")
+    assert index.page("k3", 2) == (["k4"], None)
+    assert index.page("k4", 2) == ([], None)
+    # exactly filling the last page does not hand out an empty next page
+    assert index.page("k2", 2) == (["k3", "k4"], None)
+
+
+def test_unknown_key_is_rejected():
+    with pytest.raises(InvalidCursorError):
+        InsertionIndex().page("nope", 10)
+
+
+def test_cursor_round_trip_and_garbage():
+    assert decode_cursor(encode_cursor("p_abc123")) == "p_abc123"
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("%%%")
+
+
+def test_page_size_is_clamped():
+    assert clamp_page_size(None) == DEFAULT_PAGE_SIZE
+    assert clamp_page_size(0) == DEFAULT_PAGE_SIZE
+    assert clamp_page_size(5) == 5
+    assert clamp_page_size(10**6) == MAX_PAGE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_walks_every_item_once():
+    keys = [f"k{i}" for i in range(250)]
+    index = InsertionIndex()
+    index.extend(keys)
+
+    async def list_page(limit, after):
+        return index.page(after, limit)
+
+    seen, token = [], None
+    while True:
+        items, token = await fetch_page(list_page, 100, token)
+        seen += items
+        if token is None:
+            break
+    assert seen == keys
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from libs.common.metrics import Metrics
+from libs.common.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RetryBudget,
+    RetryPolicy,
+    ServiceUnavailableError,
+    call_with_resilience,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def flaky(failures: int):
+    """Return a call that fails ``failures`` times, then answers True."""
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise ServiceUnavailableError("boom")
+        return True
+
+    return call, calls
+
+
+def test_circuit_breaker_opens_probes_and_closes():
+    clock = FakeClock()
+    metrics = Metrics()
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=10, metrics=metrics, name="cb", clock=clock
+    )
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 10  # reset timeout passed: one probe allowed
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert metrics.counters["cb_opened_total"] == 1
+    assert metrics.counters["cb_rejected_total"] == 2
+    assert metrics.gauges["cb_state"] == CircuitState.CLOSED.value
+
+
+def test_retry_budget_limits_retries():
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.5, min_per_second=0, clock=clock)
+    assert budget.try_withdraw() is False
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw() is True
+    assert budget.try_withdraw() is False
+
+
+@pytest.mark.asyncio
+async def test_call_with_resilience_retries_until_success():
+    metrics = Metrics()
+    call, calls = flaky(failures=2)
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001)
+
+    assert await call_with_resilience(call, policy, metrics=metrics, name="u")
+    assert len(calls) == 3
+    assert metrics.counters["u_retries_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_call_with_resilience_stops_when_budget_is_exhausted():
+    metrics = Metrics()
+    call, calls = flaky(failures=5)
+    budget = RetryBudget(ratio=0, min_per_second=0)
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+
+    with pytest.raises(ServiceUnavailableError):
+        await call_with_resilience(
+            call, policy, budget=budget, metrics=metrics, name="u"
+        )
+    assert len(calls) == 1
+    assert metrics.counters["u_budget_exhausted_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_call_with_resilience_enforces_deadline():
+    async def hang():
+        await asyncio.sleep(10)
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    with pytest.raises(ServiceUnavailableError, match="deadline"):
+        await call_with_resilience(hang, RetryPolicy(deadline=0.01), breaker=breaker)
+    assert breaker.state is CircuitState.OPEN
@@ -0,0 +1,32 @@
+from libs.common.search import InvertedIndex, tokenize
+
+
+def test_tokenize_lowercases_and_splits_on_punctuation():
+    assert tokenize("Blue Widget, 2-pack") == ["blue", "widget", "2", "pack"]
+    assert tokenize("  ...  ") == []
+
+
+def test_all_terms_must_match_and_rank_by_frequency():
+    index = InvertedIndex()
+    index.add("p_1", "Blue widget")
+    index.add("p_2", "Red widget widget")
+    index.add("p_3", "Blue gadget")
+    index.add("p_4", "blue Widget, blue")
+
+    assert index.search("widget", limit=10) == (
+        [("p_2", 2), ("p_1", 1), ("p_4", 1)],
+        3,
+    )
+    assert index.search("BLUE widget", limit=1) == ([("p_4", 3)], 2)
+    assert index.search("blue sprocket", limit=10) == ([], 0)
+
+
+def test_memory_stats_count_terms_and_postings():
+    index = InvertedIndex()
+    index.add("p_1", "blue widget")
+    index.add("p_2", "blue gadget")
+    stats = index.memory_stats()
+    assert stats["documents"] == 2
+    assert stats["terms"] == 3
+    assert stats["postings"] == 4
+    assert stats["bytes"] > 0
@@ -0,0 +1,32 @@
+import random
+
+from libs.common.sortedlist import SortedList
+
+
+def test_values_stay_sorted_across_splits():
+    values = SortedList()
+    values.load = 4
+    numbers = [random.randint(0, 50) for _ in range(500)]
+    for number in numbers:
+        values.add(number)
+    assert list(values) == sorted(numbers)
+    assert len(values) == 500
+    assert max(len(sublist) for sublist in values._lists) <= 8
+
+
+def test_update_merges_large_batches_and_adds_small_ones():
+    values = SortedList([5, 1, 3])
+    values.update(range(10, 0, -1))
+    values.update([0])
+    assert list(values) == sorted([5, 1, 3, 0, *range(1, 11)])
+    assert len(values) == 14
+
+
+def test_irange_starts_at_bound():
+    values = SortedList()
+    values.load = 2
+    values.update((price, f"p_{i}") for i, price in enumerate([3, 1, 2, 2, 5, 4]))
+    assert [key for key in values.irange((2,))][:2] == [(2, "p_2"), (2, "p_3")]
+    assert next(values.irange((2, "p_2"), exclusive=True)) == (2, "p_3")
+    assert list(values.irange((6,))) == []
+    assert len(list(values.irange())) == 6
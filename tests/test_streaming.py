@@ -0,0 +1,61 @@
+import grpc
+import pytest
+
+from libs.common.models import UserCreate
+from services.product_service.app import product_pb2, product_pb2_grpc
+from services.product_service.app.crud import ProductRepository
+from services.product_service.app.grpc_service import ProductServicer
+from services.user_service.app import user_pb2, user_pb2_grpc
+
+
+@pytest.mark.asyncio
+async def test_stream_users_over_the_wire(user_grpc_server):
+    repo, target = user_grpc_server
+    await repo.create_many(
+        UserCreate(name=f"Stream{i}", email=f"stream{i}@example.com")
+        for i in range(1200)
+    )
+    async with grpc.aio.insecure_channel(target) as channel:
+        stub = user_pb2_grpc.UserServiceStub(channel)
+
+        sizes = []
+        async for chunk in stub.StreamUsers(user_pb2.StreamUsersRequest()):
+            sizes.append(len(chunk.users))
+        assert sizes == [500, 500, 200]
+
+        # the client may stop reading early; the server stops producing
+        call = stub.StreamUsers(user_pb2.StreamUsersRequest(chunk_size=10))
+        first = await call.read()
+        assert len(first.users) == 10
+        assert call.cancel()
+        assert await call.code() == grpc.StatusCode.CANCELLED
+
+        bad = stub.StreamUsers(user_pb2.StreamUsersRequest(page_token="bm9wZQ"))
+        with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+            await bad.read()
+        assert exc_info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+@pytest.mark.asyncio
+async def test_create_products_bidi_over_the_wire():
+    servicer = ProductServicer(ProductRepository())
+    servicer.create_window = 16
+    servicer.create_batch_size = 8
+    server = grpc.aio.server()
+    product_pb2_grpc.add_ProductServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            stub = product_pb2_grpc.ProductServiceStub(channel)
+
+            async def requests():
+                for i in range(500):
+                    yield product_pb2.ProductCreateRequest(name=f"Bidi{i}", price=i)
+
+            responses = [r async for r in stub.CreateProducts(requests())]
+    finally:
+        await server.stop(None)
+
+    assert [r.index for r in responses] == list(range(500))
+    assert [r.product.name for r in responses] == [f"Bidi{i}" for i in range(500)]